@@ -1,5 +1,5 @@
 # post_controller.py (updated)
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from frontend.services.Academics.Classroom.post_service import PostService
 from frontend.services.Academics.Classroom.topic_service import TopicService
 
@@ -77,23 +77,28 @@ class PostController:
             filter_type=self.current_filters["filter_type"],
             topic_name=self.current_filters["topic_name"]
         )
-    # COMMENT OUT - no longer used for Material/Assessment creation (handled by forms)
-    # def create_post(self, title: str, content: str, type_: str, 
-    #                author: str, topic_name: Optional[str] = None) -> bool:
-    #     """Create a new post"""
-    #     if not all([title, content, type_, author]) or self.current_class_id is None:
-    #         return False
-        
-    #     result = self.post_service.create_post(
-    #         class_id=self.current_class_id,
-    #         title=title,
-    #         content=content,
-    #         type_=type_,
-    #         author=author,
-    #         topic_name=topic_name
-    #     )
+    def get_classworks_by_topic(self) -> List[Tuple[str, List[Dict]]]:
+        """Get all posts grouped by topic title for the Classworks tree (untitled first)"""
+        if self.current_class_id is None:
+            return []
+        return self.post_service.get_posts_grouped_by_topic(self.current_class_id)
+
+    def create_post(self, title: str, content: str, type_: str, author: str,
+                    topic_name: Optional[str] = None, attachment: Optional[Dict] = None) -> Optional[Dict]:
+        """Create a new post (materials and assessments) for the current class"""
+        if not all([title, type_, author]) or self.current_class_id is None:
+            return None
         
-    #     return result is not None
+        topic = self.get_topic_by_name(topic_name) if topic_name else None
+        return self.post_service.create_post(
+            class_id=self.current_class_id,
+            title=title,
+            content=content or "",
+            type_=type_,
+            author=author,
+            topic_id=topic.get("id") if topic else None,
+            attachment=attachment
+        )
     
     # def update_post(self, post_id: int, updates: Dict) -> bool:
     #     """Update an existing post"""
@@ -141,8 +146,7 @@ class PostController:
         if self.current_class_id is None:
             return None
         
-        topics = self.topic_service.get_topics_by_class_id(self.current_class_id)
-        for topic in topics:
-            if topic.get("id") == topic_id:
-                return topic
+        topic = self.topic_service.get_topic_by_id(topic_id)
+        if topic and topic.get("class_id") == self.current_class_id:
+            return topic
         return None
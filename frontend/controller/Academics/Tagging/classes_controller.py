@@ -38,12 +38,12 @@ class ClassesController(QObject):
 
     def load_classes(self) -> bool:
         """
-        Loads all classes from data store.
+        Loads the first page of classes from the data store; the model
+        fetches further pages as the table scrolls.
         """
         try:
-            classes = self.service.get_all()
             if self.model:
-                self.model.set_classes(classes)
+                self.model.load_pages(self._fetch_classes_page)
                 return True
 
         except Exception as e:
@@ -51,6 +51,25 @@ class ClassesController(QObject):
 
         return False
 
+    def _fetch_classes_page(self, offset: int, limit: int) -> dict:
+        return self.service.query(offset=offset, limit=limit)
+
+    def get_conflict_report(self) -> tuple[bool, str]:
+        """
+        Build the whole-term room/faculty conflict report.
+
+        Returns:
+            tuple: (has_conflicts: bool, report text)
+        """
+        from frontend.services.Academics.Tagging.conflict_report import format_conflict_report
+
+        try:
+            report = self.service.get_conflict_report()
+            return bool(report), format_conflict_report(report)
+        except Exception as e:
+            logger.exception(f"Error building conflict report: {e}")
+            return False, f"An error occurred: {str(e)}"
+
     # =========================================================================
     # CREATE OPERATIONS
     # =========================================================================
@@ -115,28 +115,19 @@ class SectionsController:
         Returns:
             tuple: (is_valid: bool, error_message: Optional[str])
         """
-        existing_sections = self.service.get_all() 
-
-        for existing in existing_sections:
-            if (
-                existing['section'] == section_data['section'] and
-                existing['program'] == section_data['program'] and 
-                existing['year'] == section_data['year'] and 
-                existing['curriculum'] == section_data['curriculum'] and
-                existing['type'] == section_data['type']
-            ):
-                error_message = (
-                    f"Duplicate section detected!\n\n"
-                    f"Section: {section_data['section']}\n"
-                    f"Program: {section_data['program']}\n"
-                    f"Year: {section_data['year']}\n"
-                    f"Curriculum: {section_data['curriculum']}\n"
-                    f"Type: {section_data['type']}\n\n"
-                    f"A section with these exact details already exists."
-                )
-                logger.error(f"Duplicate section data. Section {section_data['section']} already exists.")
-                return False, error_message
-            
+        if self.service.find_duplicate(section_data) is not None:
+            error_message = (
+                f"Duplicate section detected!\n\n"
+                f"Section: {section_data['section']}\n"
+                f"Program: {section_data['program']}\n"
+                f"Year: {section_data['year']}\n"
+                f"Curriculum: {section_data['curriculum']}\n"
+                f"Type: {section_data['type']}\n\n"
+                f"A section with these exact details already exists."
+            )
+            logger.error(f"Duplicate section data. Section {section_data['section']} already exists.")
+            return False, error_message
+
         return True, None
 
         # =================================================
@@ -233,31 +224,19 @@ class SectionsController:
         Returns:
              tuple: (is_valid: bool, error_message: Optional[str])
         """
-        existing_sections = self.service.get_all()
-
-        for existing in existing_sections:
-            # Skip the section being updated
-            if existing['id'] == section_id:
-                continue
-
-            if (
-                    existing['section'] == section_data['section'] and
-                    existing['program'] == section_data['program'] and
-                    existing['year'] == section_data['year'] and
-                    existing['curriculum'] == section_data['curriculum'] and
-                    existing['type'] == section_data['type']
-            ):
-                error_message = (
-                    f"Duplicate section detected!\n\n"
-                    f"Section: {section_data['section']}\n"
-                    f"Program: {section_data['program']}\n"
-                    f"Year: {section_data['year']}\n"
-                    f"Curriculum: {section_data['curriculum']}\n"
-                    f"Type: {section_data['type']}\n\n"
-                    f"A section with these exact details already exists."
-                )
-                logger.error(f"Duplicate section data. Section {section_data['section']} already exists.")
-                return False, error_message
+        # The section being updated does not count as a duplicate of itself
+        if self.service.find_duplicate(section_data, exclude_id=section_id) is not None:
+            error_message = (
+                f"Duplicate section detected!\n\n"
+                f"Section: {section_data['section']}\n"
+                f"Program: {section_data['program']}\n"
+                f"Year: {section_data['year']}\n"
+                f"Curriculum: {section_data['curriculum']}\n"
+                f"Type: {section_data['type']}\n\n"
+                f"A section with these exact details already exists."
+            )
+            logger.error(f"Duplicate section data. Section {section_data['section']} already exists.")
+            return False, error_message
 
         return True, None
 
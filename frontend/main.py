@@ -1,3 +1,4 @@
+import os
 import sys
 from PyQt6.QtWidgets import QApplication, QMainWindow, QGridLayout, QWidget
 from views.Login.login import LoginWidget
@@ -6,6 +7,15 @@ from widgets.layout_manager import LayoutManager
 from router.router import Router
 from views.Login.resetpassword import ResetPasswordWidget
 
+# Launched as `python frontend/main.py`, only frontend/ is on sys.path. The
+# persistence worker must be imported as the same frontend.* module the data
+# stores use (it holds the process-wide worker), so add the repo root first.
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from frontend.services.Academics.data.persistence_worker import flush_pending_writes, start_persistence_worker  # noqa: E402
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -90,6 +100,9 @@ class MainWindow(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    # Data files are written off the GUI thread; flush what's pending on quit
+    start_persistence_worker()
+    app.aboutToQuit.connect(flush_pending_writes)
     w = MainWindow()
     w.show()
     sys.exit(app.exec())
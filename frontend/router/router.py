@@ -1,27 +1,30 @@
 from PyQt6.QtWidgets import QStackedWidget, QLabel, QVBoxLayout, QWidget
 from PyQt6.QtGui import QFont
+from PyQt6.QtCore import QTimer
 from utils.db_helper import NavigationDataHelper, get_path_for_main, get_path_for_modular
 from importlib import import_module
 import os
 import sys
+import threading
 
 class Router:
-    def __init__(self, user_role, user_session=None, on_logout=None):
+    def __init__(self, user_role, user_session=None, on_logout=None, preimport=False):
         # Ensure sys.path includes project root
         project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
         if project_root not in sys.path:
             sys.path.append(project_root)
-        print(f"Router: Added {project_root} to sys.path")
-        print(f"Router: sys.path: {sys.path}")
 
         self.stack = QStackedWidget()
         self.nav_helper = NavigationDataHelper(json_file="navbar.json")
         self.user_role = user_role
         self.user_session = user_session or {}  # Store session data
         self.page_map = {}
+        self._page_factories = {}  # key -> callable building the page (not constructed yet)
         self._page_classes = self._build_page_classes()
         self._preload_pages()
         self.on_logout = on_logout 
+        if preimport:
+            self.start_preimport()
 
     def request_full_logout(self):
         if isinstance(self.user_session, dict):
@@ -32,122 +35,156 @@ class Router:
             self.on_logout()
 
     def _build_page_classes(self):
-        """Parse navbar.json 'function' and use path helper methods to build {id_or_key: ClassObject} map."""
+        """
+        Parse navbar.json 'function' and use path helper methods to build a
+        {id_or_key: (module_path, class_name)} map. Nothing is imported here;
+        see _page_class.
+        """
         page_classes = {}
 
         # Handle parent
         for parent in self.nav_helper.data["parents"]:
-            parent_name = parent["name"]
-            parent_id = parent["id"]
-            print(f"Router: Processing parent '{parent_name}' (ID: {parent_id})")
-
             # Handle mains
             for main in parent["mains"]:
                 main_id = main["id"]
-                function_str = main["function"]
-                class_name = function_str.replace("()", "")
+                class_name = main["function"].replace("()", "")
                 module_path = get_path_for_main(main_id)
-                print(f"Router: Path for main ID {main_id} ({class_name}): {module_path}")
-
-                try:
-                    if module_path:
-                        file_path = module_path.replace(".", "/") + ".py"
-                        abs_file_path = os.path.abspath(file_path)
-                        print(f"Router: Attempting to import {module_path}, file: {abs_file_path}, exists: {os.path.exists(abs_file_path)}")
-                        module = import_module(module_path)
-                        page_class = getattr(module, class_name)
-                        page_classes[f"main_{main_id}"] = page_class
-                        print(f"Router: Successfully imported {class_name} for main ID {main_id}")
-                    else:
-                        print(f"Router: No path found for main ID {main_id}, skipping {class_name}")
-                except (ImportError, AttributeError) as e:
-                    print(f"Router: Failed to import {class_name} from {module_path}: {e}")
+                if module_path:
+                    page_classes[f"main_{main_id}"] = (module_path, class_name)
+                else:
+                    print(f"Router: No path found for main ID {main_id}, skipping {class_name}")
 
                 # Handle modulars
-                if "modulars" in main:  # Check for modulars key
-                    for modular in main["modulars"]:
-                        mod_id = modular["id"]
-                        function_str = modular.get("function", "")
-                        module_path = get_path_for_modular(mod_id)
-                        print(f"Router: Path for modular ID {mod_id}: {module_path}")
-                        if function_str and module_path:
-                            class_name = function_str.replace("()", "")
-                            try:
-                                file_path = module_path.replace(".", "/") + ".py"
-                                abs_file_path = os.path.abspath(file_path)
-                                print(f"Router: Attempting to import {module_path} for modular, file: {abs_file_path}, exists: {os.path.exists(abs_file_path)}")
-                                module = import_module(module_path)
-                                page_class = getattr(module, class_name)
-                                page_classes[f"mod_{main_id}_{mod_id}"] = page_class
-                                print(f"Router: Successfully imported {class_name} for modular ID {mod_id}")
-                            except (ImportError, AttributeError) as e:
-                                print(f"Router: Failed to import modular {class_name} from {module_path}: {e}")
-                else:
-                    print(f"Router: No 'modulars' key found for main ID {main_id}, skipping modulars")
+                for modular in main.get("modulars", []):
+                    mod_id = modular["id"]
+                    function_str = modular.get("function", "")
+                    module_path = get_path_for_modular(mod_id)
+                    if function_str and module_path:
+                        page_classes[f"mod_{main_id}_{mod_id}"] = (module_path, function_str.replace("()", ""))
 
         return page_classes
 
+    def _page_class(self, key):
+        """
+        Import and return the page class of a key, or None if it has no
+        module. Raises ImportError/AttributeError if the import fails.
+        """
+        descriptor = self._page_classes.get(key)
+        if descriptor is None:
+            return None
+        module_path, class_name = descriptor
+        page_class = getattr(import_module(module_path), class_name)
+        print(f"Router: Imported {class_name} from {module_path} for {key}")
+        return page_class
+
+    def start_preimport(self):
+        """
+        Opt-in: import the modules of the role's pages on a background thread
+        so later first navigations skip the import. Pages are still constructed
+        on the GUI thread, and a failed import still gets its fallback page.
+        """
+        modules = sorted({self._page_classes[key][0]
+                          for key in self._page_factories if key in self._page_classes})
+
+        def run():
+            for module_path in modules:
+                try:
+                    import_module(module_path)
+                except Exception as e:
+                    print(f"Router: Background import of {module_path} failed: {e}")
+
+        threading.Thread(target=run, name="router-preimport", daemon=True).start()
+
+    def _has_access(self, access):
+        # Valid roles for access
+        valid_roles = {"admin", "staff", "faculty", "student"}
+        if self.user_role not in valid_roles:
+            return False
+        return (isinstance(access, str) and access == self.user_role) or \
+            (isinstance(access, list) and self.user_role in access)
+
     def _preload_pages(self):
+        """
+        Register a factory for every page the role can access. Pages are only
+        constructed on their first navigate() (or by prewarm_pages), so login
+        time depends on the landing page alone.
+        """
         # Default "Access Denied" page
         access_denied_widget = self._create_default_widget("Access Denied", "You do not have permission to view this page.")
         self.stack.addWidget(access_denied_widget)
         self.page_map["access_denied"] = 0
 
-        # Valid roles for access
-        valid_roles = {"admin", "staff", "faculty", "student"}
-
-        # Load pages from navbar.json
+        # Register pages from navbar.json
         for parent in self.nav_helper.data["parents"]:
             for main in parent["mains"]:
                 main_id = main["id"]
                 access = main["access"]
-                name = main["name"]
+                if not self._has_access(access):
+                    continue
+
                 key = f"main_{main_id}"
-                if (isinstance(access, str) and access == self.user_role and self.user_role in valid_roles) or \
-                (isinstance(access, list) and self.user_role in access and self.user_role in valid_roles):
-                    print(f"Router: Loading page {key} with access {access} for user_role {self.user_role}")
-                    page_class = self._page_classes.get(key)
-                    if page_class:
-                        # Pass user session data to dashboard initialization
-                        page = page_class(
-                            username=self.user_session.get("username", ""),
-                            roles=self.user_session.get("roles", []),
-                            primary_role=self.user_session.get("primary_role", ""),
-                            token=self.user_session.get("token", "")
-                        )
-                    else:
-                        page = self._create_default_widget(name, f"Page for {name}")
-                    index = self.stack.addWidget(page)
-                    self.page_map[key] = index
-                    print(f"Router: Added {key} to page_map at index {index}")
-
-                # Load modulars
-                if "modulars" in main:
-                    for modular in main["modulars"]:
-                        mod_id = modular["id"]
-                        mod_name = modular["name"]
-                        mod_key = f"mod_{main_id}_{mod_id}"
-                        if (isinstance(access, str) and access == self.user_role and self.user_role in valid_roles) or \
-                        (isinstance(access, list) and self.user_role in access and self.user_role in valid_roles):
-                            print(f"Router: Loading modular {mod_key} with access {access} for user_role {self.user_role}")
-                            page_class = self._page_classes.get(mod_key)
-                            if page_class:
-                                # Pass user session data to modulars
-                                page = page_class(
-                                    username=self.user_session.get("username", ""),
-                                    roles=self.user_session.get("roles", []),
-                                    primary_role=self.user_session.get("primary_role", ""),
-                                    token=self.user_session.get("token", "")
-                                )
-                            else:
-                                page = self._create_default_widget(mod_name, f"Sub-page for {mod_name}")
-                            index = self.stack.addWidget(page)
-                            self.page_map[mod_key] = index
-                            print(f"Router: Added {mod_key} to page_map at index {index}")
+                self._page_factories[key] = self._page_factory(key, main["name"], f"Page for {main['name']}")
+                print(f"Router: Registered page {key} with access {access} for user_role {self.user_role}")
+
+                # Register modulars
+                for modular in main.get("modulars", []):
+                    mod_key = f"mod_{main_id}_{modular['id']}"
+                    mod_name = modular["name"]
+                    self._page_factories[mod_key] = self._page_factory(mod_key, mod_name, f"Sub-page for {mod_name}")
+                    print(f"Router: Registered modular {mod_key} with access {access} for user_role {self.user_role}")
+
+    def _page_factory(self, key, name, desc):
+        def create():
+            try:
+                page_class = self._page_class(key)
+            except (ImportError, AttributeError) as e:
+                print(f"Router: Failed to import page {key}: {e}")
+                return self._create_default_widget("⚠️ Page Unavailable", f"{name} could not be loaded: {e}")
+            if page_class:
+                # Pass user session data to page initialization
+                return page_class(
+                    username=self.user_session.get("username", ""),
+                    roles=self.user_session.get("roles", []),
+                    primary_role=self.user_session.get("primary_role", ""),
+                    token=self.user_session.get("token", "")
+                )
+            return self._create_default_widget(name, desc)
+        return create
+
+    def _ensure_page(self, key):
+        """Stack index of a page, constructing it on first use; None if not registered."""
+        index = self.page_map.get(key)
+        if index is None:
+            factory = self._page_factories.pop(key, None)
+            if factory is None:
+                return None
+            print(f"Router: Constructing page {key}")
+            index = self.stack.addWidget(factory())
+            self.page_map[key] = index
+            print(f"Router: Added {key} to page_map at index {index}")
+        return index
+
+    def prewarm_pages(self, keys=None):
+        """
+        Construct registered pages ahead of navigation, one per event loop
+        pass so the UI stays responsive. keys defaults to every registered page.
+        """
+        pending = list(self._page_factories if keys is None else keys)
+
+        def build_next():
+            while pending:
+                key = pending.pop(0)
+                if key in self._page_factories:
+                    self._ensure_page(key)
+                    break
+            if pending:
+                QTimer.singleShot(0, build_next)
+
+        QTimer.singleShot(0, build_next)
 
     def navigate(self, page_id, is_modular=False, parent_main_id=None):
         key = f"mod_{parent_main_id}_{page_id}" if is_modular else f"main_{page_id}"
-        index = self.page_map.get(key)
+        index = self._ensure_page(key)
         print(f"Router: Navigating to {key}, index: {index}, page_map: {self.page_map}")
         if index is not None:
             self.stack.setCurrentWidget(self.stack.widget(index))
@@ -164,6 +201,7 @@ class Router:
             self.stack.removeWidget(widget)
             widget.deleteLater()
         self.page_map.clear()
+        self._page_factories.clear()
         access_denied = self._create_default_widget("Access Denied", "You do not have permission to view this page.")
         self.stack.addWidget(access_denied)
         self.page_map["access_denied"] = 0
@@ -230,11 +268,10 @@ class Router:
                 self.user_role = self.user_session.get("primary_role", "")
                 self.clear_pages()
                 self._preload_pages()
-                # jump to first non-default page if any
-                for k, idx2 in self.page_map.items():
-                    if k != "access_denied":
-                        self.stack.setCurrentIndex(idx2)
-                        break
+                # jump to first registered page if any; only it gets constructed
+                for k in list(self._page_factories):
+                    self.stack.setCurrentIndex(self._ensure_page(k))
+                    break
             login.login_successful.connect(_on_success)
 
         idx = self.stack.addWidget(login)
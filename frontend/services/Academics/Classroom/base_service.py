@@ -3,24 +3,52 @@ import json
 import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
+from frontend.services.Academics.data.classroom_index import ClassroomIndex
+from frontend.services.Academics.data.classroom_store import get_classroom_store
 
 class BaseService(ABC):
     def __init__(self, json_path: str):
         self.json_path = json_path
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.data = self.load_data()
+        self._store = get_classroom_store(json_path)
+        self._fallback_data = None
+    
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Current shared snapshot (reparsed only when the file changes)."""
+        return self.load_data()
     
     def load_data(self) -> Dict[str, Any]:
         """Load data from JSON file with error handling."""
         try:
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            data = self._store.load()
         except FileNotFoundError:
-            self.logger.warning(f"Data file not found, creating empty structure: {self.json_path}")
-            return self.get_default_data()
+            if self._fallback_data is None:
+                self.logger.warning(f"Data file not found, creating empty structure: {self.json_path}")
         except json.JSONDecodeError as e:
-            self.logger.error(f"Error decoding JSON from {self.json_path}: {e}")
-            return self.get_default_data()
+            if self._fallback_data is None:
+                self.logger.error(f"Error decoding JSON from {self.json_path}: {e}")
+        else:
+            self._fallback_data = None
+            return data
+        
+        # Keep one default structure so edits survive until save_data()
+        if self._fallback_data is None:
+            self._fallback_data = self.get_default_data()
+        return self._fallback_data
+    
+    def load_index(self, class_id: Optional[int] = None) -> ClassroomIndex:
+        """
+        Secondary indexes (posts/topics by class, topic and id) of the snapshot.
+        
+        With class_id, only that class's records need to be indexed.
+        """
+        try:
+            if class_id is not None:
+                return self._store.class_index(class_id)
+            return self._store.get_index()
+        except (FileNotFoundError, json.JSONDecodeError):
+            return ClassroomIndex(self.load_data())
     
     def get_default_data(self) -> Dict[str, Any]:
         """Return default data structure when file doesn't exist."""
@@ -29,15 +57,12 @@ class BaseService(ABC):
     def save_data(self) -> bool:
         """Save data to JSON file with error handling."""
         try:
-            with open(self.json_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=4, ensure_ascii=False)
+            self._store.save(self.data)
             return True
         except Exception as e:
             self.logger.error(f"Error saving data to {self.json_path}: {e}")
             return False
     
     def generate_id(self, collection_name: str) -> int:
-        """Generate a new ID for a collection."""
-        items = self.data.get(collection_name, [])
-        existing_ids = [item.get("id", 0) for item in items if item.get("id")]
-        return max(existing_ids) + 1 if existing_ids else 1
\ No newline at end of file
+        """Generate a new ID for a collection (never reused, even after deletes)."""
+        return self._store.next_id(collection_name)
\ No newline at end of file
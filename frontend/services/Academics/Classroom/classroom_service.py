@@ -1,25 +1,27 @@
-import json
+from frontend.services.Academics.data.classroom_store import get_classroom_store
 
 class ClassroomService:
     def __init__(self):
         self.data_file = "frontend/services/Academics/data/classroom_data.json"
-        self.load_data()
+        self._store = get_classroom_store(self.data_file)
+        self.data = None
 
     def load_data(self):
-        with open(self.data_file, "r") as f:
-            self.data = json.load(f)
+        self.data = self._store.load()
 
     def load_classes(self):
-        self.load_data()
-        return self.data["classes"]
+        # Catalog only; a class's posts and topics are loaded when it is opened
+        return self._store.collection("classes")
 
     def load_topics(self, class_id):
-        return [t for t in self.data["topics"] if t["class_id"] == class_id]
+        return self._store.class_index(class_id).topics_for_class(class_id)
 
     def load_posts(self, class_id, filter_type="all", topic_id=None):
-        posts = [p for p in self.data["posts"] if p["class_id"] == class_id]
+        index = self._store.class_index(class_id)
+        if topic_id is not None:
+            posts = index.posts_for_topic(class_id, topic_id)
+        else:
+            posts = index.posts_for_class(class_id)
         if filter_type != "all":
             posts = [p for p in posts if p["type"] == filter_type]
-        if topic_id is not None:
-            posts = [p for p in posts if p["topic_id"] == topic_id]
         return posts
\ No newline at end of file
@@ -9,17 +9,25 @@ class ClassworkService(BaseService):
     
     def get_classwork_by_class_id(self, class_id: int) -> List[Dict]:
         """Get all posts for a specific class."""
-        return [p for p in self.data.get("posts", []) if p.get("class_id") == class_id]
+        return self.load_index(class_id).posts_for_class(class_id)
     
     def get_topics_by_class_id(self, class_id: int) -> List[Dict]:
         """Get all topics for a specific class."""
-        return [t for t in self.data.get("topics", []) if t.get("class_id") == class_id]
+        return self.load_index(class_id).topics_for_class(class_id)
     
     def filter_classwork(self, class_id: int, filter_type: Optional[str] = None, 
                         topic_name: Optional[str] = None) -> List[Dict]:
         """Filter classwork items with proper separation of concerns."""
-        posts = self.get_classwork_by_class_id(class_id)
-        topics = {t["id"]: t["title"] for t in self.get_topics_by_class_id(class_id)}
+        index = self.load_index(class_id)
+        class_topics = index.topics_for_class(class_id)
+        topics = {t["id"]: t["title"] for t in class_topics}
+        
+        # Narrow to the topic's own posts when the title resolves to a topic
+        topic_ids = [t["id"] for t in class_topics if t.get("title") == topic_name]
+        if topic_name and topic_ids:
+            posts = [p for tid in topic_ids for p in index.posts_for_topic(class_id, tid)]
+        else:
+            posts = index.posts_for_class(class_id)
         
         filtered_items = []
         for post in posts:
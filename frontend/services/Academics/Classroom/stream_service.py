@@ -9,7 +9,7 @@ class StreamService(BaseService):
     
     def get_posts_by_class_id(self, class_id: int) -> List[Dict]:
         """Get posts for a class, sorted by date (newest first)."""
-        posts = [p for p in self.data.get("posts", []) if p.get("class_id") == class_id]
+        posts = self.load_index(class_id).posts_for_class(class_id)
         
         try:
             return sorted(posts, 
@@ -25,11 +25,8 @@ class StreamService(BaseService):
             post_data["class_id"] = class_id
             post_data["date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
-            if "posts" not in self.data:
-                self.data["posts"] = []
-            
-            self.data["posts"].append(post_data)
-            return self.save_data()
+            self._store.insert("posts", post_data)
+            return True
             
         except Exception as e:
             self.logger.error(f"Error adding post: {e}")
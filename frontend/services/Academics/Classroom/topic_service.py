@@ -1,66 +1,53 @@
 # topic_service.py
-import json
 from typing import List, Dict, Optional
 from datetime import datetime
+from frontend.services.Academics.data.classroom_index import ClassroomIndex
+from frontend.services.Academics.data.classroom_store import get_classroom_store
 
 class TopicService:
     def __init__(self, data_file="frontend/services/Academics/data/classroom_data.json"):
         self.data_file = data_file
+        self._store = get_classroom_store(data_file)
     
     def _load_data(self):
         try:
-            with open(self.data_file, 'r') as f:
-                return json.load(f)
+            return self._store.load()
         except FileNotFoundError:
             return {"classes": [], "posts": [], "topics": [], "users": []}
     
+    def _load_index(self, class_id: Optional[int] = None) -> ClassroomIndex:
+        try:
+            if class_id is not None:
+                return self._store.class_index(class_id)
+            return self._store.get_index()
+        except FileNotFoundError:
+            return ClassroomIndex()
+    
     def _save_data(self, data):
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=4)
+        self._store.save(data)
     
     def get_topics_by_class_id(self, class_id: int) -> List[Dict]:
         """Get all topics for a specific class"""
-        data = self._load_data()
-        return [topic for topic in data.get("topics", []) 
-                if topic.get("class_id") == class_id]
+        return self._load_index(class_id).topics_for_class(class_id)
     
     def create_topic(self, class_id: int, title: str, type_: str) -> Optional[Dict]:
         """Create a new topic"""
-        data = self._load_data()
-        
-        # Get next topic ID
-        topics = data.get("topics", [])
-        next_id = max([t.get("id", 0) for t in topics], default=0) + 1
-        
         new_topic = {
-            "id": next_id,
+            "id": self._store.next_id("topics"),
             "class_id": class_id,
             "title": title,
             "type": type_,
             "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
-        data.setdefault("topics", []).append(new_topic)
-        self._save_data(data)
+        self._store.insert("topics", new_topic)
         
         return new_topic
     
     def get_topic_by_name(self, class_id: int, title: str) -> Optional[Dict]:
         """Get topic by name"""
-        data = self._load_data()
-        
-        for topic in data.get("topics", []):
-            if topic.get("class_id") == class_id and topic.get("title") == title:
-                return topic
-        
-        return None
+        return self._load_index(class_id).find_topic(class_id, title)
     
     def get_topic_by_id(self, topic_id: int) -> Optional[Dict]:
         """Get topic by ID"""
-        data = self._load_data()
-        
-        for topic in data.get("topics", []):
-            if topic.get("id") == topic_id:
-                return topic
-        
-        return None
\ No newline at end of file
+        return self._load_index().get_topic(topic_id)
\ No newline at end of file
@@ -0,0 +1,99 @@
+# Tagging/class_import.py
+"""
+Bulk class import from CSV or JSON.
+
+    python -m frontend.services.Academics.Tagging.class_import FILE [--data-file PATH] [--no-conflict-check]
+
+JSON files hold a list of class dicts (or {"classes": [...]}) in the shape
+ClassService.create() accepts. CSV files have one class per row with the
+columns code, title, units, section_id, room, instructor, type and
+schedules, where schedules reads "Monday 08:00 AM-10:00 AM; Wednesday ...".
+All rows are validated together and saved with one write (see
+ClassService.create_many).
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from typing import Dict, List
+
+from frontend.services.Academics.data.classroom_store import DEFAULT_DATA_FILE
+from frontend.services.Academics.Tagging.class_service import ClassService
+from frontend.services.Academics.Tagging.section_service import SectionService
+
+
+def parse_schedules(text: str) -> List[Dict]:
+    """
+    Parse "Day HH:MM AM-HH:MM PM; ..." into schedule dicts.
+
+    Malformed entries are kept with their raw text so that validation
+    reports them against the right row.
+    """
+    schedules = []
+    for part in (text or '').split(';'):
+        part = part.strip()
+        if not part:
+            continue
+        day, _, times = part.partition(' ')
+        start, _, end = times.partition('-')
+        schedules.append({
+            'day': day.strip().capitalize(),
+            'start_time': start.strip(),
+            'end_time': end.strip(),
+        })
+    return schedules
+
+
+def _csv_row(row: Dict[str, str]) -> Dict:
+    record = {key.strip(): (value or '').strip() for key, value in row.items() if key}
+    for field in ('units', 'section_id'):
+        if record.get(field, '').isdigit():
+            record[field] = int(record[field])
+    record['schedules'] = parse_schedules(record.get('schedules', ''))
+    return record
+
+
+def read_class_rows(path: str) -> List[Dict]:
+    """
+    Read class rows from a .csv or .json file.
+
+    Raises:
+        ValueError: If the file type is not supported or the JSON is not a list
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            return [_csv_row(row) for row in csv.DictReader(f)]
+
+    if ext == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        rows = data.get('classes') if isinstance(data, dict) else data
+        if not isinstance(rows, list):
+            raise ValueError(f"{path} must hold a list of classes")
+        return rows
+
+    raise ValueError(f"Unsupported import file type: {ext or path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import classes from CSV or JSON")
+    parser.add_argument("file")
+    parser.add_argument("--data-file", default=DEFAULT_DATA_FILE)
+    parser.add_argument("--no-conflict-check", action="store_true",
+                        help="skip room and faculty conflict checks")
+    args = parser.parse_args()
+
+    service = ClassService(args.data_file, section_service=SectionService(args.data_file))
+    result = service.create_many(read_class_rows(args.file),
+                                 check_conflicts=not args.no_conflict_check)
+
+    print(f"Created {len(result['created'])} classes")
+    for error in result['errors']:
+        print(f"Row {error['row']}: {error['error']}")
+    sys.exit(1 if result['errors'] else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -8,65 +8,16 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from copy import deepcopy
 
+from frontend.services.Academics.data.classroom_store import get_classroom_store
+from frontend.services.Academics.data.readonly import freeze
+from frontend.services.Academics.data.schedule_index import ScheduleIndex, parse_minutes
+from frontend.services.Academics.Tagging.section_service import generate_section_name  # noqa: F401  (still importable from here)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def generate_section_name(section: Dict) -> str:
-    """
-    Generate formatted section name from section data.
-
-    Args:
-        section: Section dictionary containing:
-                - program: Full program name (e.g., "BS Computer Science")
-                - year: Year level (e.g., "3rd")
-                - section: Section letter (e.g., "C")
-
-    Returns:
-        Formatted section name (e.g., "BSCS-3C")
-
-    Example:
-        >>> section = {"program": "BS Computer Science", "year": "3rd", "section": "C"}
-        >>> generate_section_name(section)
-        'BSCS-3C'
-    """
-    if not section:
-        return "Unknown"
-
-    # Extract program acronym from full program name
-    program = section.get('program', '')
-    year = section.get('year', '')
-    section_letter = section.get('section', '')
-
-    # Generate program acronym (e.g., "BS Computer Science" -> "BSCS")
-    program_acronym = ''
-    if program:
-        # Take all capital letters and first letters of words
-        words = program.split()
-        for word in words:
-            # If word is all caps (like "BS", "IT"), take the whole thing
-            if word.isupper():
-                program_acronym += word
-            else:
-                # Otherwise take first letter if it's uppercase
-                if word and word[0].isupper():
-                    program_acronym += word[0]
-
-    # Extract year number (e.g., "3rd" -> "3")
-    year_num = ''
-    if year:
-        year_num = ''.join(filter(str.isdigit, year))
-
-    # Combine: PROGRAM-YEARSECTION (e.g., "BSCS-3C")
-    if program_acronym and year_num and section_letter:
-        return f"{program_acronym}-{year_num}{section_letter}"
-    elif section_letter:
-        return section_letter
-    else:
-        return "Unknown"
-
-
 class ClassServiceError(Exception):
     """Base exception for class service errors."""
     pass
@@ -105,7 +56,8 @@ class ClassService:
     Attributes:
         json_file (str): Path to the unified classroom_data.json file
         section_service: Reference to SectionService for validation
-        _cache (Dict): In-memory cache of loaded data
+        _store (ClassroomStore): Shared process-wide snapshot of json_file;
+            reads return its read-only records without copying
     """
 
     # Required fields for a valid class
@@ -137,7 +89,7 @@ class ClassService:
             section_service: SectionService instance for validation
         """
         self.json_file = json_file
-        self._cache: Optional[Dict] = None
+        self._store = get_classroom_store(json_file)
 
         # Import here to avoid circular dependency
         if section_service is None:
@@ -182,32 +134,15 @@ class ClassService:
         Load data from unified JSON file.
 
         Returns:
-            Dict: Complete unified JSON structure
+            Dict: Read-only views of the collections this service uses. The
+                  records are shared with every other reader; copy() one to
+                  get an editable dict.
         """
-        if self._cache is not None:
-            return deepcopy(self._cache)
-
         try:
-            with open(self.json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Ensure required keys exist
-            if 'classes' not in data:
-                data['classes'] = []
-            if 'sections' not in data:
-                data['sections'] = []
-            if 'topics' not in data:
-                data['topics'] = []
-            if 'posts' not in data:
-                data['posts'] = []
-            if 'users' not in data:
-                data['users'] = []
-            if 'enrollments' not in data:
-                data['enrollments'] = []
-
-            self._cache = deepcopy(data)
+            data = {'classes': self._store.frozen('classes')}
+
             logger.debug(f"Loaded {len(data['classes'])} classes from unified file")
-            return deepcopy(data)
+            return data
 
         except FileNotFoundError:
             error_msg = f"Data file not found: {self.json_file}"
@@ -224,59 +159,22 @@ class ClassService:
             logger.error(error_msg)
             raise ClassStorageError(error_msg)
 
-    def _save_data(self, data: Dict) -> None:
+    def _generate_next_id(self) -> int:
         """
-        Save data to unified JSON file atomically.
+        Generate the next ID for a new class.
+        Taken from the store's persisted sequence, so IDs of deleted
+        classes are never handed out again.
 
-        Args:
-            data: Complete unified JSON structure to save
+        Returns:
+            int: Next available ID
         """
-        temp_file = f"{self.json_file}.tmp"
-
         try:
-            # No metadata in unified structure - data is saved as-is
-
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-                f.flush()
-                os.fsync(f.fileno())
-
-            os.replace(temp_file, self.json_file)
-            self._cache = None
-
-            logger.debug(f"Saved {len(data['classes'])} classes to unified file")
-
-        except Exception as e:
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
-
-            error_msg = f"Error saving data: {str(e)}"
+            return self._store.next_id('classes')
+        except json.JSONDecodeError as e:
+            error_msg = f"Invalid JSON in data file: {str(e)}"
             logger.error(error_msg)
             raise ClassStorageError(error_msg)
 
-    def _generate_next_id(self, data: Dict) -> int:
-        """
-        Generate the next available ID for a new class.
-        Uses max existing ID + 1 approach (no metadata).
-
-        Args:
-            data: Current unified data structure
-
-        Returns:
-            int: Next available ID
-        """
-        if not data['classes']:
-            return 1
-
-        existing_ids = {cls['id'] for cls in data['classes'] if 'id' in cls}
-        if not existing_ids:
-            return 1
-
-        return max(existing_ids) + 1
-
     # ... (all validation methods remain the same) ...
 
     def _validate_schedule(self, schedule: Dict) -> None:
@@ -368,44 +266,60 @@ class ClassService:
                         f"{field.capitalize()} must be a non-empty string"
                     )
 
+    def _schedule_overlaps(self, schedules: List[Dict], exclude_class_id: Optional[int], find) -> List[Tuple[Dict, Dict, Dict]]:
+        """
+        Look each schedule up in the store's schedule interval index.
+
+        Args:
+            schedules: Schedule dictionaries of the class being saved
+            exclude_class_id: Class ID to skip (the class being updated)
+            find: ScheduleIndex lookup taking (day, start, end)
+
+        Returns:
+            List of (new schedule, existing class, existing schedule) overlaps
+        """
+        overlaps = []
+        for new_schedule in schedules:
+            try:
+                start = parse_minutes(new_schedule['start_time'])
+                end = parse_minutes(new_schedule['end_time'])
+            except ValueError as e:
+                logger.warning(f"Error parsing time during conflict check: {e}")
+                continue
+
+            for _, _, existing_class, existing_schedule in find(new_schedule['day'], start, end):
+                if exclude_class_id and existing_class.get('id') == exclude_class_id:
+                    continue
+                overlaps.append((new_schedule, existing_class, existing_schedule))
+        return overlaps
+
     def _check_schedule_conflicts(
             self,
             schedules: List[Dict],
             room: str,
-            exclude_class_id: int = None
+            exclude_class_id: int = None,
+            index: Optional[ScheduleIndex] = None
     ) -> List[str]:
-        """Check for schedule conflicts with other classes."""
+        """Check for schedule conflicts with other classes in the same room."""
         conflicts = []
 
         try:
-            all_classes = self.get_all()
-
-            for existing_class in all_classes:
-                if exclude_class_id and existing_class['id'] == exclude_class_id:
-                    continue
-
-                if existing_class['room'] != room:
-                    continue
+            if index is None:
+                index = self._store.get_index().schedules
+            overlaps = self._schedule_overlaps(
+                schedules, exclude_class_id,
+                lambda day, start, end: index.room_overlaps(room, day, start, end)
+            )
 
-                for new_schedule in schedules:
-                    for existing_schedule in existing_class['schedules']:
-                        if new_schedule['day'] != existing_schedule['day']:
-                            continue
-
-                        new_start = self._parse_time(new_schedule['start_time'])
-                        new_end = self._parse_time(new_schedule['end_time'])
-                        exist_start = self._parse_time(existing_schedule['start_time'])
-                        exist_end = self._parse_time(existing_schedule['end_time'])
-
-                        if new_start < exist_end and new_end > exist_start:
-                            conflict_msg = (
-                                f"Conflict with {existing_class['code']} "
-                                f"({existing_class['title']}) in {room} "
-                                f"on {new_schedule['day']} "
-                                f"{existing_schedule['start_time']} - "
-                                f"{existing_schedule['end_time']}"
-                            )
-                            conflicts.append(conflict_msg)
+            for new_schedule, existing_class, existing_schedule in overlaps:
+                conflict_msg = (
+                    f"Conflict with {existing_class['code']} "
+                    f"({existing_class['title']}) in {room} "
+                    f"on {new_schedule['day']} "
+                    f"{existing_schedule['start_time']} - "
+                    f"{existing_schedule['end_time']}"
+                )
+                conflicts.append(conflict_msg)
 
         except Exception as e:
             logger.error(f"Error checking conflicts: {str(e)}")
@@ -416,17 +330,20 @@ class ClassService:
             self,
             schedules: List[Dict],
             instructor: str,
-            exclude_class_id: int = None
+            exclude_class_id: int = None,
+            index: Optional[ScheduleIndex] = None
     ) -> List[str]:
         """
         Check for faculty schedule conflicts.
 
         A faculty member cannot teach multiple classes at the same time.
+        Instructor names are compared case-insensitively.
 
         Args:
             schedules: List of schedule dictionaries for the class
             instructor: Name of the instructor
             exclude_class_id: Class ID to exclude from conflict check (for updates)
+            index: Schedules to check against (default: all stored classes)
 
         Returns:
             List of conflict messages
@@ -434,51 +351,68 @@ class ClassService:
         conflicts = []
 
         try:
-            all_classes = self.get_all()
-
-            for existing_class in all_classes:
-                # Skip the class being updated
-                if exclude_class_id and existing_class['id'] == exclude_class_id:
-                    continue
-
-                # Only check classes taught by the same instructor
-                if existing_class.get('instructor', '').strip().lower() != instructor.strip().lower():
-                    continue
+            if index is None:
+                index = self._store.get_index().schedules
+            overlaps = self._schedule_overlaps(
+                schedules, exclude_class_id,
+                lambda day, start, end: index.instructor_overlaps(instructor, day, start, end)
+            )
 
-                # Check for time conflicts
-                for new_schedule in schedules:
-                    for existing_schedule in existing_class.get('schedules', []):
-                        # Must be the same day
-                        if new_schedule['day'] != existing_schedule['day']:
-                            continue
-
-                        # Parse times
-                        try:
-                            new_start = self._parse_time(new_schedule['start_time'])
-                            new_end = self._parse_time(new_schedule['end_time'])
-                            exist_start = self._parse_time(existing_schedule['start_time'])
-                            exist_end = self._parse_time(existing_schedule['end_time'])
-                        except Exception as e:
-                            logger.warning(f"Error parsing time during faculty conflict check: {e}")
-                            continue
-
-                        # Check for overlap: (start1 < end2) AND (end1 > start2)
-                        if new_start < exist_end and new_end > exist_start:
-                            section_name = existing_class.get('section_name', 'Unknown')
-                            conflict_msg = (
-                                f"Faculty conflict: {instructor} is already teaching "
-                                f"{existing_class['code']} ({existing_class['title']}) "
-                                f"for section {section_name} "
-                                f"on {new_schedule['day']} "
-                                f"{existing_schedule['start_time']} - {existing_schedule['end_time']}"
-                            )
-                            conflicts.append(conflict_msg)
+            for new_schedule, existing_class, existing_schedule in overlaps:
+                section_name = existing_class.get('section_name', 'Unknown')
+                conflict_msg = (
+                    f"Faculty conflict: {instructor} is already teaching "
+                    f"{existing_class['code']} ({existing_class['title']}) "
+                    f"for section {section_name} "
+                    f"on {new_schedule['day']} "
+                    f"{existing_schedule['start_time']} - {existing_schedule['end_time']}"
+                )
+                conflicts.append(conflict_msg)
 
         except Exception as e:
             logger.error(f"Error checking faculty conflicts: {str(e)}")
 
         return conflicts
 
+    def get_conflict_report(self, token: str = None) -> List[Dict]:
+        """
+        List every room and faculty clash among all classes of the term.
+
+        One sweep over the store's schedule interval index, sorted per
+        (room, day) and (instructor, day): O(n log n) in the schedules.
+
+        Returns:
+            List of dicts with keys 'kind' ('room' or 'faculty'), 'room' or
+            'instructor', 'day', 'first', 'second' (each with the class's
+            id, code, title, section_name, start_time and end_time)
+        """
+        def entry(interval):
+            _, _, cls, schedule = interval
+            return {
+                'id': cls.get('id'),
+                'code': cls.get('code'),
+                'title': cls.get('title'),
+                'section_name': cls.get('section_name', 'Unknown'),
+                'start_time': schedule['start_time'],
+                'end_time': schedule['end_time'],
+            }
+
+        try:
+            index = self._store.get_index().schedules
+        except FileNotFoundError:
+            raise ClassStorageError(f"Data file not found: {self.json_file}")
+
+        report = []
+        for room, day, first, second in index.room_clashes():
+            report.append({'kind': 'room', 'room': room, 'day': day,
+                           'first': entry(first), 'second': entry(second)})
+        for instructor, day, first, second in index.instructor_clashes():
+            report.append({'kind': 'faculty', 'instructor': instructor, 'day': day,
+                           'first': entry(first), 'second': entry(second)})
+
+        logger.info(f"Conflict report found {len(report)} clashes")
+        return report
+
     # ========================================================================
     # PUBLIC CRUD METHODS - API UNCHANGED
     # ========================================================================
@@ -488,7 +422,7 @@ class ClassService:
         try:
             data = self._load_data()
             logger.info(f"Retrieved {len(data['classes'])} classes")
-            return deepcopy(data['classes'])
+            return list(data['classes'])
         except Exception as e:
             logger.error(f"Error retrieving classes: {str(e)}")
             raise
@@ -500,7 +434,7 @@ class ClassService:
             for cls in data['classes']:
                 if cls.get('id') == class_id:
                     logger.debug(f"Found class with ID {class_id}")
-                    return deepcopy(cls)
+                    return cls
 
             logger.warning(f"Class with ID {class_id} not found")
             return None
@@ -552,13 +486,10 @@ class ClassService:
                         "Schedule conflicts detected:\n" + "\n".join(all_conflicts)
                     )
 
-            section = self.section_service.get_by_id(class_data['section_id'])
-            section_name = generate_section_name(section) if section else 'Unknown'
-
-            data = self._load_data()
+            section_name = self.section_service.section_name(class_data['section_id'])
 
             new_class = deepcopy(class_data)
-            new_class['id'] = self._generate_next_id(data)
+            new_class['id'] = self._generate_next_id()
             new_class['section_name'] = section_name
             new_class['created_at'] = datetime.now().isoformat()
             new_class['updated_at'] = datetime.now().isoformat()
@@ -567,11 +498,10 @@ class ClassService:
             if 'instructor_id' not in new_class:
                 new_class['instructor_id'] = f"faculty_{new_class['id']}"
 
-            data['classes'].append(new_class)
-            self._save_data(data)
+            self._store.insert('classes', new_class)
 
             logger.info(f"Created class: {new_class['code']} (ID: {new_class['id']})")
-            return deepcopy(new_class)
+            return freeze(new_class)
 
         except (ClassValidationError, ScheduleConflictError, ClassStorageError):
             raise
@@ -580,6 +510,85 @@ class ClassService:
             logger.error(error_msg)
             raise ClassStorageError(error_msg)
 
+    def create_many(
+            self,
+            rows: List[Dict],
+            token: str = None,
+            check_conflicts: bool = True
+    ) -> Dict[str, List]:
+        """
+        Create many classes with one validation pass and a single write.
+
+        Sections are looked up once for the whole batch. With check_conflicts,
+        each row is checked against the stored classes and against the rows
+        accepted before it. Rows that fail are reported and skipped; the rest
+        are saved together.
+
+        Args:
+            rows: Class dictionaries, as accepted by create()
+            token: Unused, kept for API symmetry
+            check_conflicts: Whether to check room and faculty conflicts
+
+        Returns:
+            Dict: 'created' (the created classes) and 'errors'
+                  (dicts with the 1-based 'row' number and 'error' message)
+
+        Raises:
+            ClassStorageError: If the data file cannot be read or written
+        """
+        try:
+            stored = self._store.get_index().schedules if check_conflicts else None
+        except Exception as e:
+            error_msg = f"Error loading data: {str(e)}"
+            logger.error(error_msg)
+            raise ClassStorageError(error_msg)
+
+        batch = ScheduleIndex()
+        accepted, errors = [], []
+        for number, row in enumerate(rows, start=1):
+            try:
+                self._validate_class_data(row, is_update=False)
+
+                if check_conflicts:
+                    all_conflicts = []
+                    for index in (stored, batch):
+                        all_conflicts += self._check_schedule_conflicts(
+                            row['schedules'], row['room'], index=index)
+                        all_conflicts += self._check_faculty_schedule_conflicts(
+                            row['schedules'], row['instructor'], index=index)
+                    if all_conflicts:
+                        raise ScheduleConflictError(
+                            "Schedule conflicts detected:\n" + "\n".join(all_conflicts)
+                        )
+            except (ClassValidationError, ScheduleConflictError) as e:
+                errors.append({'row': number, 'error': str(e)})
+                continue
+
+            new_class = deepcopy(row)
+            new_class['section_name'] = self.section_service.section_name(row['section_id'])
+            accepted.append(new_class)
+            batch.add_class(new_class)
+
+        if accepted:
+            now = datetime.now().isoformat()
+            try:
+                ids = self._store.reserve_ids('classes', len(accepted))
+                for new_class, class_id in zip(accepted, ids):
+                    new_class['id'] = class_id
+                    new_class['created_at'] = now
+                    new_class['updated_at'] = now
+                    if 'instructor_id' not in new_class:
+                        new_class['instructor_id'] = f"faculty_{class_id}"
+
+                self._store.insert_many('classes', accepted)
+            except Exception as e:
+                error_msg = f"Unexpected error creating classes: {str(e)}"
+                logger.error(error_msg)
+                raise ClassStorageError(error_msg)
+
+        logger.info(f"Bulk import created {len(accepted)} classes, rejected {len(errors)} rows")
+        return {'created': [freeze(c) for c in accepted], 'errors': errors}
+
     def update(
             self,
             class_id: int,
@@ -593,17 +602,15 @@ class ClassService:
 
             data = self._load_data()
 
-            class_index = None
-            for i, cls in enumerate(data['classes']):
+            existing_class = None
+            for cls in data['classes']:
                 if cls.get('id') == class_id:
-                    class_index = i
+                    existing_class = cls
                     break
 
-            if class_index is None:
+            if existing_class is None:
                 raise ClassNotFoundError(f"Class with ID {class_id} not found")
 
-            existing_class = data['classes'][class_index]
-
             if check_conflicts:
                 schedules_to_check = class_data.get('schedules', existing_class['schedules'])
                 room_to_check = class_data.get('room', existing_class['room'])
@@ -629,20 +636,21 @@ class ClassService:
                     )
 
             if 'section_id' in class_data:
-                section = self.section_service.get_by_id(class_data['section_id'])
-                class_data['section_name'] = generate_section_name(section) if section else 'Unknown'
+                class_data['section_name'] = self.section_service.section_name(class_data['section_id'])
 
-            existing_class.update(class_data)
-            existing_class['updated_at'] = datetime.now().isoformat()
-            existing_class['id'] = class_id
+            # Only the edited record is copied; the stored one is read-only
+            updated_class = existing_class.copy()
+            updated_class.update(class_data)
+            updated_class['updated_at'] = datetime.now().isoformat()
+            updated_class['id'] = class_id
 
-            if 'created_at' not in existing_class:
-                existing_class['created_at'] = datetime.now().isoformat()
+            if 'created_at' not in updated_class:
+                updated_class['created_at'] = datetime.now().isoformat()
 
-            self._save_data(data)
+            self._store.replace('classes', class_id, updated_class)
 
             logger.info(f"Updated class ID {class_id}")
-            return deepcopy(existing_class)
+            return freeze(updated_class)
 
         except (ClassNotFoundError, ClassValidationError,
                 ScheduleConflictError, ClassStorageError):
@@ -655,18 +663,13 @@ class ClassService:
     def delete(self, class_id: int, token: str = None) -> bool:
         """Delete a class. API unchanged."""
         try:
-            data = self._load_data()
-
-            original_count = len(data['classes'])
-            data['classes'] = [
-                cls for cls in data['classes'] if cls.get('id') != class_id
-            ]
+            classes = self._store.load().get('classes') or []
+            doomed = [cls for cls in classes if cls.get('id') == class_id]
 
-            if len(data['classes']) == original_count:
+            if not doomed or not self._store.remove('classes', doomed):
                 logger.warning(f"Class with ID {class_id} not found")
                 return False
 
-            self._save_data(data)
             logger.info(f"Deleted class ID {class_id}")
             return True
 
@@ -675,26 +678,53 @@ class ClassService:
             logger.error(error_msg)
             raise ClassStorageError(error_msg)
 
-    def search(self, filters: Dict, token: str = None) -> List[Dict]:
-        """Search classes by criteria. API unchanged."""
+    def query(
+            self,
+            filters: Optional[Dict] = None,
+            prefix: Optional[Dict[str, str]] = None,
+            sort_by: Optional[str] = None,
+            descending: bool = False,
+            offset: int = 0,
+            limit: Optional[int] = None,
+            token: str = None
+    ) -> Dict:
+        """
+        Filter, sort and page classes using the store's indexes.
+
+        Args:
+            filters: field -> value, or a list/tuple/set of accepted values;
+                     section_id, instructor, room, type and day (any
+                     day of the schedules) are indexed, other fields are checked on the matches only
+            prefix: field -> case-insensitive prefix (code and title are indexed)
+            sort_by: Field to sort by (default 'id')
+            descending: Reverse the sort order
+            offset: Number of matches to skip
+            limit: Page size (None returns every match from offset on)
+
+        Returns:
+            Dict: 'items' (read-only classes), 'total' (number of matches),
+                  'offset' and 'limit'
+        """
         try:
-            all_classes = self.get_all(token)
+            result = self._store.query(
+                'classes', filters=filters, prefix=prefix, sort_by=sort_by,
+                descending=descending, offset=offset, limit=limit
+            )
+            logger.debug(f"Query matched {result['total']} classes")
+            return result
 
-            if not filters:
-                return all_classes
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            error_msg = f"Error loading data: {str(e)}"
+            logger.error(error_msg)
+            raise ClassStorageError(error_msg)
 
-            results = []
-            for cls in all_classes:
-                match = True
-                for key, value in filters.items():
-                    if key not in cls or cls[key] != value:
-                        match = False
-                        break
-                if match:
-                    results.append(cls)
+    def search(self, filters: Dict, token: str = None) -> List[Dict]:
+        """Search classes by criteria (equality, or any of a list). API unchanged."""
+        try:
+            results = list(self.query(filters, token=token)['items'])
 
             logger.info(f"Search found {len(results)} classes")
             return results
         except Exception as e:
             logger.error(f"Error searching classes: {str(e)}")
-            raise
\ No newline at end of file
+            raise
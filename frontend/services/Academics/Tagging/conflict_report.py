@@ -0,0 +1,55 @@
+# Tagging/conflict_report.py
+"""
+Whole-term room and faculty conflict report.
+
+    python -m frontend.services.Academics.Tagging.conflict_report [--data-file PATH]
+
+Prints every pair of classes that share a room or an instructor at
+overlapping times (see ClassService.get_conflict_report) and exits with
+status 1 if there is any.
+"""
+import argparse
+import sys
+from typing import Dict, List
+
+from frontend.services.Academics.data.classroom_store import DEFAULT_DATA_FILE
+from frontend.services.Academics.Tagging.class_service import ClassService
+from frontend.services.Academics.Tagging.section_service import SectionService
+
+
+def _describe(entry: Dict) -> str:
+    return (f"{entry['code']} ({entry['title']}, {entry['section_name']}) "
+            f"{entry['start_time']} - {entry['end_time']}")
+
+
+def format_conflict_report(report: List[Dict]) -> str:
+    """Render a conflict report as one line per clash."""
+    if not report:
+        return "No schedule conflicts found."
+
+    lines = []
+    for clash in report:
+        if clash['kind'] == 'room':
+            where = f"Room conflict in {clash['room']}"
+        else:
+            where = f"Faculty conflict for {clash['instructor']}"
+        lines.append(
+            f"{where} on {clash['day']}: "
+            f"{_describe(clash['first'])} overlaps {_describe(clash['second'])}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report every schedule conflict in the term")
+    parser.add_argument("--data-file", default=DEFAULT_DATA_FILE)
+    args = parser.parse_args()
+
+    service = ClassService(args.data_file, section_service=SectionService(args.data_file))
+    report = service.get_conflict_report()
+    print(format_conflict_report(report))
+    sys.exit(1 if report else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,14 +5,72 @@ import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from copy import deepcopy
 
+from frontend.services.Academics.data.classroom_index import ClassroomIndex, section_key
+from frontend.services.Academics.data.classroom_store import get_classroom_store
+from frontend.services.Academics.data.readonly import freeze
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def generate_section_name(section: Dict) -> str:
+    """
+    Generate formatted section name from section data.
+
+    Args:
+        section: Section dictionary containing:
+                - program: Full program name (e.g., "BS Computer Science")
+                - year: Year level (e.g., "3rd")
+                - section: Section letter (e.g., "C")
+
+    Returns:
+        Formatted section name (e.g., "BSCS-3C")
+
+    Example:
+        >>> section = {"program": "BS Computer Science", "year": "3rd", "section": "C"}
+        >>> generate_section_name(section)
+        'BSCS-3C'
+    """
+    if not section:
+        return "Unknown"
+
+    # Extract program acronym from full program name
+    program = section.get('program', '')
+    year = section.get('year', '')
+    section_letter = section.get('section', '')
+
+    # Generate program acronym (e.g., "BS Computer Science" -> "BSCS")
+    program_acronym = ''
+    if program:
+        # Take all capital letters and first letters of words
+        words = program.split()
+        for word in words:
+            # If word is all caps (like "BS", "IT"), take the whole thing
+            if word.isupper():
+                program_acronym += word
+            else:
+                # Otherwise take first letter if it's uppercase
+                if word and word[0].isupper():
+                    program_acronym += word[0]
+
+    # Extract year number (e.g., "3rd" -> "3")
+    year_num = ''
+    if year:
+        year_num = ''.join(filter(str.isdigit, year))
+
+    # Combine: PROGRAM-YEARSECTION (e.g., "BSCS-3C")
+    if program_acronym and year_num and section_letter:
+        return f"{program_acronym}-{year_num}{section_letter}"
+    elif section_letter:
+        return section_letter
+    else:
+        return "Unknown"
+
+
 class SectionServiceError(Exception):
     """Base exception for section service errors."""
     pass
@@ -60,7 +118,9 @@ class SectionService:
             json_file: Path to unified JSON database file
         """
         self.json_file = json_file
-        self._cache: Optional[Dict] = None
+        self._store = get_classroom_store(json_file)
+        # section id -> (section record, display name); a replaced record misses
+        self._names: Dict[Any, Tuple[Dict, str]] = {}
         self._ensure_data_file_exists()
 
         logger.info(f"SectionService initialized with unified file: {json_file}")
@@ -89,32 +149,12 @@ class SectionService:
             raise SectionStorageError(error_msg)
 
     def _load_data(self) -> Dict:
-        """Load data from unified JSON file."""
-        # if self._cache is not None:
-        #     return deepcopy(self._cache)
-
+        """Load read-only views of the unified data (copy() a record to edit it)."""
         try:
-            with open(self.json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.info(f"{data} loaded from {self.json_file}")
-
-            # Ensure required keys exist
-            if 'sections' not in data:
-                data['sections'] = []
-            if 'classes' not in data:
-                data['classes'] = []
-            if 'topics' not in data:
-                data['topics'] = []
-            if 'posts' not in data:
-                data['posts'] = []
-            if 'users' not in data:
-                data['users'] = []
-            if 'enrollments' not in data:
-                data['enrollments'] = []
-
-            self._cache = deepcopy(data)
+            data = {'sections': self._store.frozen('sections')}
+
             logger.debug(f"Loaded {len(data['sections'])} sections from unified file")
-            return deepcopy(data)
+            return data
 
         except FileNotFoundError:
             error_msg = f"Data file not found: {self.json_file}"
@@ -131,45 +171,32 @@ class SectionService:
             logger.error(error_msg)
             raise SectionStorageError(error_msg)
 
-    def _save_data(self, data: Dict) -> None:
-        """Save data to unified JSON file atomically."""
-        temp_file = f"{self.json_file}.tmp"
-
+    def _load_index(self) -> ClassroomIndex:
+        """The store's indexes (sections by id and by uniqueness key)."""
         try:
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-                f.flush()
-                os.fsync(f.fileno())
+            return self._store.get_index()
 
-            os.replace(temp_file, self.json_file)
-            self._cache = None
-
-            logger.debug(f"Saved {len(data['sections'])} sections to unified file")
-
-        except Exception as e:
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
+        except FileNotFoundError:
+            error_msg = f"Data file not found: {self.json_file}"
+            logger.error(error_msg)
+            raise SectionStorageError(error_msg)
 
-            error_msg = f"Error saving data: {str(e)}"
+        except json.JSONDecodeError as e:
+            error_msg = f"Invalid JSON in data file: {str(e)}"
             logger.error(error_msg)
             raise SectionStorageError(error_msg)
 
-    def _generate_next_id(self, data: Dict) -> int:
+    def _generate_next_id(self) -> int:
         """
-        Generate the next available ID for a new section.
-        Uses max existing ID + 1 approach (no metadata).
+        Generate the next ID for a new section.
+        Uses the store's persisted sequence (IDs are never reused).
         """
-        if not data['sections']:
-            return 1
-
-        existing_ids = {sec['id'] for sec in data['sections'] if 'id' in sec}
-        if not existing_ids:
-            return 1
-
-        return max(existing_ids) + 1
+        try:
+            return self._store.next_id('sections')
+        except json.JSONDecodeError as e:
+            error_msg = f"Invalid JSON in data file: {str(e)}"
+            logger.error(error_msg)
+            raise SectionStorageError(error_msg)
 
     def _validate_section_data(self, data: Dict, is_update: bool = False) -> None:
         """Validate section data at storage level."""
@@ -215,7 +242,7 @@ class SectionService:
         try:
             data = self._load_data()
             logger.info(f"Retrieved {len(data['sections'])} sections")
-            return deepcopy(data['sections'])
+            return list(data['sections'])
         except Exception as e:
             logger.error(f"Error retrieving sections: {str(e)}")
             raise
@@ -223,11 +250,10 @@ class SectionService:
     def get_by_id(self, section_id: int, token: str = None) -> Optional[Dict]:
         """Retrieve a specific section by ID. API unchanged."""
         try:
-            data = self._load_data()
-            for section in data['sections']:
-                if section.get('id') == section_id:
-                    logger.debug(f"Found section with ID {section_id}")
-                    return deepcopy(section)
+            section = self._load_index().get_section(section_id)
+            if section is not None:
+                logger.debug(f"Found section with ID {section_id}")
+                return self._store.frozen_record(section)
 
             logger.warning(f"Section with ID {section_id} not found")
             return None
@@ -240,18 +266,15 @@ class SectionService:
         try:
             self._validate_section_data(section_data, is_update=False)
 
-            data = self._load_data()
-
             new_section = deepcopy(section_data)
-            new_section['id'] = self._generate_next_id(data)
+            new_section['id'] = self._generate_next_id()
             new_section['created_at'] = datetime.now().isoformat()
             new_section['updated_at'] = datetime.now().isoformat()
 
-            data['sections'].append(new_section)
-            self._save_data(data)
+            self._store.insert('sections', new_section)
 
             logger.info(f"Created section: {new_section['section']} (ID: {new_section['id']})")
-            return deepcopy(new_section)
+            return freeze(new_section)
 
         except (SectionValidationError, SectionStorageError):
             raise
@@ -265,29 +288,23 @@ class SectionService:
         try:
             self._validate_section_data(section_data, is_update=True)
 
-            data = self._load_data()
-
-            section_index = None
-            for i, section in enumerate(data['sections']):
-                if section.get('id') == section_id:
-                    section_index = i
-                    break
-
-            if section_index is None:
+            existing_section = self.get_by_id(section_id)
+            if existing_section is None:
                 raise SectionNotFoundError(f"Section with ID {section_id} not found")
 
-            existing_section = data['sections'][section_index]
-            existing_section.update(section_data)
-            existing_section['updated_at'] = datetime.now().isoformat()
-            existing_section['id'] = section_id
+            updated_section = existing_section.copy()
+            updated_section.update(section_data)
+            updated_section['updated_at'] = datetime.now().isoformat()
+            updated_section['id'] = section_id
 
-            if 'created_at' not in existing_section:
-                existing_section['created_at'] = datetime.now().isoformat()
+            if 'created_at' not in updated_section:
+                updated_section['created_at'] = datetime.now().isoformat()
 
-            self._save_data(data)
+            self._store.replace('sections', section_id, updated_section)
+            self._names.pop(section_id, None)
 
             logger.info(f"Updated section ID {section_id}")
-            return deepcopy(existing_section)
+            return freeze(updated_section)
 
         except (SectionNotFoundError, SectionValidationError, SectionStorageError):
             raise
@@ -299,18 +316,14 @@ class SectionService:
     def delete(self, section_id: int, token: str = None) -> bool:
         """Delete a section. API unchanged."""
         try:
-            data = self._load_data()
-
-            original_count = len(data['sections'])
-            data['sections'] = [
-                s for s in data['sections'] if s.get('id') != section_id
-            ]
+            sections = self._store.load().get('sections') or []
+            doomed = [s for s in sections if s.get('id') == section_id]
 
-            if len(data['sections']) == original_count:
+            if not doomed or not self._store.remove('sections', doomed):
                 logger.warning(f"Section with ID {section_id} not found")
                 return False
 
-            self._save_data(data)
+            self._names.pop(section_id, None)
             logger.info(f"Deleted section ID {section_id}")
             return True
 
@@ -319,26 +332,83 @@ class SectionService:
             logger.error(error_msg)
             raise SectionStorageError(error_msg)
 
-    def search(self, filters: Dict, token: str = None) -> List[Dict]:
-        """Search sections by criteria. API unchanged."""
+    def find_duplicate(self, section_data: Dict, exclude_id: Optional[int] = None) -> Optional[Dict]:
+        """
+        Return an existing section with the same section, program, year,
+        curriculum and type as section_data (one hash lookup), or None.
+
+        Args:
+            section_data: Section fields to check
+            exclude_id: ID of a section to ignore (the one being updated)
+        """
+        for section in self._load_index().sections_with_key(section_key(section_data)):
+            if section.get('id') != exclude_id:
+                return self._store.frozen_record(section)
+        return None
+
+    def section_name(self, section_id: int) -> str:
+        """
+        Display name of a section (e.g. "BSCS-3C"), or "Unknown".
+
+        Names are cached per section and recomputed only after the
+        section record has been replaced.
+        """
+        section = self._load_index().get_section(section_id)
+        if section is None:
+            return "Unknown"
+
+        entry = self._names.get(section_id)
+        if entry is None or entry[0] is not section:
+            entry = (section, generate_section_name(section))
+            self._names[section_id] = entry
+        return entry[1]
+
+    def query(
+            self,
+            filters: Optional[Dict] = None,
+            prefix: Optional[Dict[str, str]] = None,
+            sort_by: Optional[str] = None,
+            descending: bool = False,
+            offset: int = 0,
+            limit: Optional[int] = None,
+            token: str = None
+    ) -> Dict:
+        """
+        Filter, sort and page sections using the store's indexes.
+
+        Args:
+            filters: field -> value, or a list/tuple/set of accepted values;
+                     program, year, type and curriculum are indexed, other fields are checked on the matches only
+            prefix: field -> case-insensitive prefix (section and program are indexed)
+            sort_by: Field to sort by (default 'id')
+            descending: Reverse the sort order
+            offset: Number of matches to skip
+            limit: Page size (None returns every match from offset on)
+
+        Returns:
+            Dict: 'items' (read-only sections), 'total' (number of matches),
+                  'offset' and 'limit'
+        """
         try:
-            all_sections = self.get_all(token)
+            result = self._store.query(
+                'sections', filters=filters, prefix=prefix, sort_by=sort_by,
+                descending=descending, offset=offset, limit=limit
+            )
+            logger.debug(f"Query matched {result['total']} sections")
+            return result
 
-            if not filters:
-                return all_sections
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            error_msg = f"Error loading data: {str(e)}"
+            logger.error(error_msg)
+            raise SectionStorageError(error_msg)
 
-            results = []
-            for section in all_sections:
-                match = True
-                for key, value in filters.items():
-                    if key not in section or section[key] != value:
-                        match = False
-                        break
-                if match:
-                    results.append(section)
+    def search(self, filters: Dict, token: str = None) -> List[Dict]:
+        """Search sections by criteria (equality, or any of a list). API unchanged."""
+        try:
+            results = list(self.query(filters, token=token)['items'])
 
             logger.info(f"Search found {len(results)} sections")
             return results
         except Exception as e:
             logger.error(f"Error searching sections: {str(e)}")
-            raise
\ No newline at end of file
+            raise
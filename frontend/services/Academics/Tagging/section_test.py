@@ -369,6 +369,25 @@ class TestSectionService(unittest.TestCase):
         self.assertEqual(len(sections), 1)
         self.assertEqual(sections[0]['id'], s2['id'])
 
+    def test_duplicate_index_and_names_follow_writes(self):
+        """Test find_duplicate and section_name after create, update and delete"""
+        data = {
+            "section": "C", "program": "BS Computer Science", "curriculum": "2023",
+            "year": "3rd", "capacity": 40, "type": "Lecture", "remarks": "Test"
+        }
+        created = self.service.create(data)
+        self.assertEqual(self.service.find_duplicate(data)['id'], created['id'])
+        self.assertIsNone(self.service.find_duplicate(data, exclude_id=created['id']))
+        self.assertEqual(self.service.section_name(created['id']), "BSCS-3C")
+
+        self.service.update(created['id'], {"section": "D"})
+        self.assertIsNone(self.service.find_duplicate(data))
+        self.assertEqual(self.service.section_name(created['id']), "BSCS-3D")
+
+        self.service.delete(created['id'])
+        self.assertIsNone(self.service.find_duplicate({**data, "section": "D"}))
+        self.assertEqual(self.service.section_name(created['id']), "Unknown")
+
 # Run tests
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
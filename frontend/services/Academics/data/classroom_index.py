@@ -0,0 +1,233 @@
+# data/classroom_index.py
+"""
+Secondary indexes over the posts, topics and sections of a classroom snapshot.
+Schedule interval indexes over its classes, and the query indexes over
+classes and sections, are built on first use.
+
+Buckets are keyed by the record object itself (via id()) so a class-level
+read costs O(k) in that class's own records and insert/delete cost O(1),
+even for legacy records that share an id.
+"""
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from frontend.services.Academics.data.record_query import RecordQuery, field, schedule_days
+from frontend.services.Academics.data.schedule_index import ScheduleIndex
+
+Bucket = Dict[int, Dict]
+
+# collection -> (hash-indexed fields, prefix-indexed fields) for query()
+QUERY_FIELDS = {
+    "classes": (
+        {"section_id": field("section_id"), "instructor": field("instructor"),
+         "room": field("room"), "type": field("type"), "day": schedule_days},
+        ("code", "title"),
+    ),
+    "sections": (
+        {"program": field("program"), "year": field("year"),
+         "type": field("type"), "curriculum": field("curriculum")},
+        ("section", "program"),
+    ),
+}
+
+
+# Sections may not share all of these (see SectionService.find_duplicate)
+SECTION_KEY_FIELDS = ("section", "program", "year", "curriculum", "type")
+
+
+def section_key(section: Dict) -> Tuple[Any, ...]:
+    """Composite uniqueness key of a section."""
+    return tuple(section.get(name) for name in SECTION_KEY_FIELDS)
+
+
+def record_ids(record: Dict) -> Tuple[Any, ...]:
+    """Return every id a record can be looked up by ('id' and legacy 'post_id')."""
+    ids = []
+    for key in ("id", "post_id"):
+        value = record.get(key)
+        if value is not None and value not in ids:
+            ids.append(value)
+    return tuple(ids)
+
+
+class ClassroomIndex:
+    """
+    In-memory indexes for one snapshot of classroom data.
+
+    posts by id, posts by class, posts by (class, topic),
+    topics by id, topics by class, syllabus by class,
+    sections by id and sections by uniqueness key.
+    """
+
+    def __init__(self, data: Optional[Dict] = None):
+        self.rebuild(data or {})
+
+    def rebuild(self, data: Dict) -> None:
+        """Rebuild every index from a full snapshot (O(N), done once per reload)."""
+        self._posts_by_id: Dict[Any, Bucket] = defaultdict(dict)
+        self._posts_by_class: Dict[Any, Bucket] = defaultdict(dict)
+        self._posts_by_class_topic: Dict[Tuple[Any, Any], Bucket] = defaultdict(dict)
+        self._topics_by_id: Dict[Any, Bucket] = defaultdict(dict)
+        self._topics_by_class: Dict[Any, Bucket] = defaultdict(dict)
+        self._syllabus_by_class: Dict[Any, Bucket] = defaultdict(dict)
+        self._sections_by_id: Dict[Any, Bucket] = defaultdict(dict)
+        self._sections_by_key: Dict[Tuple[Any, ...], Bucket] = defaultdict(dict)
+        self._data = data
+        self._schedules: Optional[ScheduleIndex] = None
+        self._queries: Dict[str, RecordQuery] = {}
+
+        for post in data.get("posts", []):
+            self.add_post(post)
+        for topic in data.get("topics", []):
+            self.add_topic(topic)
+        for syllabus in data.get("syllabus", []):
+            self._syllabus_by_class[syllabus.get("class_id")][id(syllabus)] = syllabus
+        for section in data.get("sections", []):
+            self.add_section(section)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def add(self, collection: str, record: Dict) -> None:
+        if collection == "posts":
+            self.add_post(record)
+        elif collection == "topics":
+            self.add_topic(record)
+        elif collection == "syllabus":
+            self._syllabus_by_class[record.get("class_id")][id(record)] = record
+        elif collection == "sections":
+            self.add_section(record)
+        elif collection == "classes" and self._schedules is not None:
+            self._schedules.add_class(record)
+        if collection in self._queries:
+            self._queries[collection].add(record)
+
+    def remove(self, collection: str, record: Dict) -> None:
+        if collection == "posts":
+            self.remove_post(record)
+        elif collection == "topics":
+            self.remove_topic(record)
+        elif collection == "syllabus":
+            self._discard(self._syllabus_by_class, record.get("class_id"), id(record))
+        elif collection == "sections":
+            self.remove_section(record)
+        elif collection == "classes" and self._schedules is not None:
+            self._schedules.remove_class(record)
+        if collection in self._queries:
+            self._queries[collection].remove(record)
+
+    @property
+    def schedules(self) -> ScheduleIndex:
+        """Room/instructor interval indexes of the classes' schedules."""
+        if self._schedules is None:
+            self._schedules = ScheduleIndex(self._data.get("classes") or [])
+        return self._schedules
+
+    def query(self, collection: str) -> RecordQuery:
+        """Hash/prefix indexes for filtering a collection (see QUERY_FIELDS)."""
+        records = self._queries.get(collection)
+        if records is None:
+            indexed, prefixed = QUERY_FIELDS.get(collection, ({}, ()))
+            records = RecordQuery(self._data.get(collection) or [], indexed, prefixed)
+            self._queries[collection] = records
+        return records
+
+    def add_post(self, post: Dict) -> None:
+        key = id(post)
+        class_id = post.get("class_id")
+        for post_id in record_ids(post):
+            self._posts_by_id[post_id][key] = post
+        self._posts_by_class[class_id][key] = post
+        self._posts_by_class_topic[(class_id, post.get("topic_id"))][key] = post
+
+    def remove_post(self, post: Dict) -> None:
+        key = id(post)
+        class_id = post.get("class_id")
+        for post_id in record_ids(post):
+            self._discard(self._posts_by_id, post_id, key)
+        self._discard(self._posts_by_class, class_id, key)
+        self._discard(self._posts_by_class_topic, (class_id, post.get("topic_id")), key)
+
+    def add_topic(self, topic: Dict) -> None:
+        key = id(topic)
+        self._topics_by_id[topic.get("id")][key] = topic
+        self._topics_by_class[topic.get("class_id")][key] = topic
+
+    def remove_topic(self, topic: Dict) -> None:
+        key = id(topic)
+        self._discard(self._topics_by_id, topic.get("id"), key)
+        self._discard(self._topics_by_class, topic.get("class_id"), key)
+
+    def add_section(self, section: Dict) -> None:
+        key = id(section)
+        self._sections_by_id[section.get("id")][key] = section
+        self._sections_by_key[section_key(section)][key] = section
+
+    def remove_section(self, section: Dict) -> None:
+        key = id(section)
+        self._discard(self._sections_by_id, section.get("id"), key)
+        self._discard(self._sections_by_key, section_key(section), key)
+
+    @staticmethod
+    def _discard(index: Dict[Any, Bucket], bucket_key: Any, key: int) -> None:
+        bucket = index.get(bucket_key)
+        if bucket is None:
+            return
+        bucket.pop(key, None)
+        if not bucket:
+            del index[bucket_key]
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def posts_for_class(self, class_id: Any) -> List[Dict]:
+        """All posts of a class, in file order."""
+        return self._values(self._posts_by_class, class_id)
+
+    def posts_for_topic(self, class_id: Any, topic_id: Any) -> List[Dict]:
+        """Posts of a class under one topic (topic_id None = no topic)."""
+        return self._values(self._posts_by_class_topic, (class_id, topic_id))
+
+    def posts_with_id(self, post_id: Any) -> List[Dict]:
+        """Posts whose 'id' or 'post_id' equals post_id."""
+        return self._values(self._posts_by_id, post_id)
+
+    def get_post(self, post_id: Any) -> Optional[Dict]:
+        posts = self.posts_with_id(post_id)
+        return posts[0] if posts else None
+
+    def topics_for_class(self, class_id: Any) -> List[Dict]:
+        """All topics of a class, in file order."""
+        return self._values(self._topics_by_class, class_id)
+
+    def syllabus_for_class(self, class_id: Any) -> Optional[Dict]:
+        """The syllabus of a class, if it has one."""
+        syllabi = self._values(self._syllabus_by_class, class_id)
+        return syllabi[0] if syllabi else None
+
+    def get_topic(self, topic_id: Any) -> Optional[Dict]:
+        topics = self._values(self._topics_by_id, topic_id)
+        return topics[0] if topics else None
+
+    def find_topic(self, class_id: Any, title: str) -> Optional[Dict]:
+        """First topic of a class with the given title."""
+        for topic in self._values(self._topics_by_class, class_id):
+            if topic.get("title") == title:
+                return topic
+        return None
+
+    def get_section(self, section_id: Any) -> Optional[Dict]:
+        sections = self._values(self._sections_by_id, section_id)
+        return sections[0] if sections else None
+
+    def sections_with_key(self, key: Tuple[Any, ...]) -> List[Dict]:
+        """Sections whose section_key() equals key."""
+        return self._values(self._sections_by_key, key)
+
+    @staticmethod
+    def _values(index: Dict[Any, Bucket], bucket_key: Any) -> List[Dict]:
+        bucket = index.get(bucket_key)
+        return list(bucket.values()) if bucket else []
+
@@ -0,0 +1,417 @@
+# data/classroom_store.py
+"""
+Process-wide document store for classroom_data.json.
+
+Every Academics service reads the same unified JSON file. The store parses it
+once, serves all services from that single snapshot and only reparses when the
+file's mtime/size changes on disk (e.g. edited by another process).
+
+When the persistence worker is running, writes only update the snapshot and
+the file is written on the worker thread shortly after.
+"""
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from frontend.services.Academics.data.classroom_index import ClassroomIndex, record_ids
+from frontend.services.Academics.data.persistence_worker import get_persistence_worker
+from frontend.services.Academics.data.readonly import FrozenDict, FrozenList, freeze
+from frontend.services.Academics.data.storage_config import (
+    BACKEND_SHARDED,
+    BACKEND_SQLITE,
+    sharded_root,
+    sqlite_path,
+    storage_backend
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_FILE = "frontend/services/Academics/data/classroom_data.json"
+
+# Document key holding the last id handed out per collection
+SEQUENCES_KEY = "_sequences"
+
+
+def write_atomic(path: str, text: str) -> None:
+    """Write text to path via a synced temp file and os.replace."""
+    temp_file = f"{path}.tmp"
+    try:
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, path)
+    except Exception:
+        if os.path.exists(temp_file):
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+        raise
+
+
+class ClassroomStore:
+    """
+    Shared snapshot of one classroom JSON file.
+
+    The dict returned by load() is shared by every caller. Services that mutate
+    it must hand it back through save() so the file and snapshot stay in sync,
+    or use insert()/replace()/remove(), which also keep the secondary indexes
+    and the read-only views from frozen() current.
+    """
+
+    def __init__(self, data_file: str):
+        self.data_file = data_file
+        self._lock = threading.RLock()
+        self._data: Optional[Dict] = None
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._index: Optional[ClassroomIndex] = None
+        self._index_valid = False
+        # Read-only views: per collection, and per raw record as (raw, frozen)
+        self._frozen_lists: Dict[str, FrozenList] = {}
+        self._frozen_records: Dict[int, Tuple[Dict, FrozenDict]] = {}
+        # Snapshot versions handed to / finished by the background writer
+        self._version = 0
+        self._written_version = 0
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock guarding the snapshot; hold it for read-modify-save sequences."""
+        return self._lock
+
+    def _stat_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Return (mtime, size, inode) of the data file, or None if missing."""
+        try:
+            st = os.stat(self.data_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def load(self) -> Dict:
+        """
+        Return the shared snapshot, reparsing the file only if it changed.
+
+        Raises:
+            FileNotFoundError: If the data file does not exist
+            json.JSONDecodeError: If the data file is not valid JSON
+        """
+        with self._lock:
+            if self._version != self._written_version:
+                # Newer than the file; the background write is still pending
+                return self._data
+
+            signature = self._stat_signature()
+            if signature is None:
+                self._data = None
+                self._signature = None
+                raise FileNotFoundError(f"Data file not found: {self.data_file}")
+
+            if self._data is None or signature != self._signature:
+                with open(self.data_file, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+                self._signature = signature
+                self._index_valid = False
+                self._clear_frozen()
+                logger.debug(f"Parsed {self.data_file}")
+
+            return self._data
+
+    def save(self, data: Dict) -> None:
+        """Write data atomically and make it the new shared snapshot."""
+        with self._lock:
+            self._write(data)
+            # The caller may have edited indexed records in place
+            self._index_valid = False
+            self._clear_frozen()
+
+    def _write(self, data: Dict) -> None:
+        worker = get_persistence_worker()
+        if worker is not None:
+            self._data = data
+            self._version += 1
+            worker.schedule(self, self._write_in_background)
+            return
+
+        try:
+            write_atomic(self.data_file, json.dumps(data, indent=4, ensure_ascii=False))
+        except Exception:
+            # The caller may already have mutated the shared dict
+            self.invalidate()
+            raise
+
+        self._data = data
+        self._signature = self._stat_signature()
+
+    def _write_in_background(self) -> None:
+        """Worker job: serialize the latest snapshot and write it out."""
+        with self._lock:
+            version = self._version
+            if version == self._written_version:
+                return
+            data = self._data
+
+        # Serialized without the lock so GUI reads and writes don't wait on
+        # it. Every change bumps _version and schedules another job, so a
+        # text that raced with one is dropped and that job writes instead.
+        try:
+            text = json.dumps(data, indent=4, ensure_ascii=False)
+        except RuntimeError:
+            text = None
+        with self._lock:
+            if version != self._version:
+                return
+            if text is None:
+                # Changed in place without a new version (id counters)
+                text = json.dumps(self._data, indent=4, ensure_ascii=False)
+
+        try:
+            write_atomic(self.data_file, text)
+        except Exception:
+            # The snapshot stays authoritative; the next change retries
+            logger.exception(f"Background write of {self.data_file} failed")
+            return
+
+        with self._lock:
+            self._written_version = max(self._written_version, version)
+            if version == self._version:
+                self._signature = self._stat_signature()
+
+    def get_index(self) -> ClassroomIndex:
+        """
+        Return the secondary indexes for the current snapshot.
+
+        Built once per (re)load; insert() and remove() keep it up to date.
+        """
+        with self._lock:
+            data = self.load()
+            if self._index is None:
+                self._index = ClassroomIndex(data)
+            elif not self._index_valid:
+                self._index.rebuild(data)
+            self._index_valid = True
+            return self._index
+
+    def class_index(self, class_id: Any) -> ClassroomIndex:
+        """
+        Indexes for class-scoped lookups (posts, topics, syllabus of class_id).
+
+        A single file holds every class, so this is the global index; layouts
+        that split classes apart load only that class here.
+        """
+        return self.get_index()
+
+    def _writable_index(self) -> ClassroomIndex:
+        """get_index(), starting from an empty snapshot if the file is missing."""
+        try:
+            return self.get_index()
+        except FileNotFoundError:
+            self._data = {}
+            self._index = ClassroomIndex(self._data)
+            self._index_valid = True
+            return self._index
+
+    def insert(self, collection: str, record: Dict) -> Dict:
+        """Append a record to a collection, index it and persist."""
+        with self._lock:
+            index = self._writable_index()
+            data = self._data
+            data.setdefault(collection, []).append(record)
+            index.add(collection, record)
+            self._write(data)
+            self._frozen_lists.pop(collection, None)
+            return record
+
+    def insert_many(self, collection: str, records: List[Dict]) -> List[Dict]:
+        """Append several records, index them and persist once."""
+        with self._lock:
+            if not records:
+                return records
+            index = self._writable_index()
+            data = self._data
+            data.setdefault(collection, []).extend(records)
+            for record in records:
+                index.add(collection, record)
+            self._write(data)
+            self._frozen_lists.pop(collection, None)
+            return records
+
+    def replace(self, collection: str, record_id: Any, record: Dict) -> Optional[Dict]:
+        """
+        Swap the record whose id is record_id for a new record object and persist.
+
+        Returns the replaced record, or None if no record has that id.
+        """
+        with self._lock:
+            index = self._writable_index()
+            records = self._data.get(collection) or []
+            for position, old in enumerate(records):
+                if old.get("id") == record_id:
+                    break
+            else:
+                return None
+
+            records[position] = record
+            index.remove(collection, old)
+            index.add(collection, record)
+            self._write(self._data)
+            self._forget_frozen(collection, [old])
+            return old
+
+    def remove(self, collection: str, records: Iterable[Dict]) -> int:
+        """Remove the given record objects from a collection and persist."""
+        with self._lock:
+            index = self._writable_index()
+            self._seed_sequence(collection)
+            data = self._data
+            doomed = {id(r): r for r in records}
+            if not doomed:
+                return 0
+
+            kept = [r for r in data.get(collection, []) if id(r) not in doomed]
+            removed = len(data.get(collection, [])) - len(kept)
+            if removed:
+                data[collection] = kept
+                for record in doomed.values():
+                    index.remove(collection, record)
+                self._write(data)
+                self._forget_frozen(collection, doomed.values())
+            return removed
+
+    def next_id(self, collection: str) -> int:
+        """
+        Allocate the next id of a collection.
+
+        The last id handed out is kept per collection in the document, so
+        allocation is O(1) and ids of deleted records are never reused. The
+        counter is seeded from the highest existing id the first time.
+        """
+        return self.reserve_ids(collection, 1)[0]
+
+    def reserve_ids(self, collection: str, count: int) -> range:
+        """Allocate count consecutive ids at once (see next_id)."""
+        with self._lock:
+            sequences = self._sequence_document().setdefault(SEQUENCES_KEY, {})
+            first = self._last_id(sequences, collection) + 1
+            sequences[collection] = first + count - 1
+            self._persist_sequences(sequences)
+            return range(first, first + count)
+
+    def _seed_sequence(self, collection: str) -> None:
+        """Record a collection's highest id before its records are deleted."""
+        sequences = self._sequence_document().setdefault(SEQUENCES_KEY, {})
+        if collection not in sequences:
+            sequences[collection] = self._last_id(sequences, collection)
+            self._persist_sequences(sequences)
+
+    def _last_id(self, sequences: Dict[str, int], collection: str) -> int:
+        last = sequences.get(collection)
+        if last is None:
+            # One-time seed for data written before sequences existed
+            last = max((i for r in self.collection(collection) for i in record_ids(r)
+                        if isinstance(i, int)), default=0)
+        return last
+
+    def _sequence_document(self) -> Dict:
+        self._writable_index()
+        return self._data
+
+    def _persist_sequences(self, sequences: Dict[str, int]) -> None:
+        # Saved with the record that uses the id: every write rewrites the file
+        pass
+
+    def frozen(self, collection: str) -> FrozenList:
+        """
+        Read-only view of a collection, shared by every caller.
+
+        Records are frozen once and reused until they are replaced or the
+        file is reloaded, so repeated reads cost no copying.
+        """
+        with self._lock:
+            records = self.collection(collection)
+            view = self._frozen_lists.get(collection)
+            if view is None:
+                view = FrozenList(self.frozen_record(r) for r in records)
+                self._frozen_lists[collection] = view
+            return view
+
+    def query(self, collection: str, **criteria: Any) -> Dict[str, Any]:
+        """
+        Filtered, sorted page of a collection as read-only records.
+
+        Takes the keyword arguments of RecordQuery.query (filters, prefix,
+        sort_by, descending, offset, limit). Indexed fields are looked up
+        in the snapshot's hash/prefix indexes, which insert/replace/remove
+        keep current, so only the matches are touched.
+        """
+        with self._lock:
+            result = self.get_index().query(collection).query(**criteria)
+            result['items'] = FrozenList(self.frozen_record(r) for r in result['items'])
+            return result
+
+    def collection(self, collection: str) -> List[Dict]:
+        """The shared record list of one collection ([] if it is missing)."""
+        return self.load().get(collection) or []
+
+    def frozen_record(self, record: Dict) -> FrozenDict:
+        """Shared read-only view of one stored record (see frozen())."""
+        with self._lock:
+            entry = self._frozen_records.get(id(record))
+            if entry is None or entry[0] is not record:
+                entry = (record, freeze(record))
+                self._frozen_records[id(record)] = entry
+            return entry[1]
+
+    def _forget_frozen(self, collection: str, records: Iterable[Dict]) -> None:
+        self._frozen_lists.pop(collection, None)
+        for record in records:
+            self._frozen_records.pop(id(record), None)
+
+    def _clear_frozen(self) -> None:
+        self._frozen_lists = {}
+        self._frozen_records = {}
+
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next load() reparses the file."""
+        with self._lock:
+            self._data = None
+            self._signature = None
+            self._index_valid = False
+            self._clear_frozen()
+            self._written_version = self._version
+
+
+_stores: Dict[str, ClassroomStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_classroom_store(data_file: str = DEFAULT_DATA_FILE) -> ClassroomStore:
+    """
+    Return the process-wide store for data_file, creating it on first use.
+
+    With the sqlite backend configured the store reads and writes the
+    database next to data_file instead; with the sharded backend, the
+    per-class layout in the directory of the same name (see storage_config).
+    """
+    backend = storage_backend()
+    if backend == BACKEND_SQLITE:
+        key = os.path.abspath(sqlite_path(data_file))
+    elif backend == BACKEND_SHARDED:
+        key = os.path.abspath(sharded_root(data_file))
+    else:
+        key = os.path.abspath(data_file)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            # Imported here: both modules build on ClassroomStore
+            if backend == BACKEND_SQLITE:
+                from frontend.services.Academics.data.sqlite_store import SqliteClassroomStore
+                store = SqliteClassroomStore(key)
+            elif backend == BACKEND_SHARDED:
+                from frontend.services.Academics.data.sharded_store import ShardedClassroomStore
+                store = ShardedClassroomStore(key, source_file=os.path.abspath(data_file))
+            else:
+                store = ClassroomStore(key)
+            _stores[key] = store
+        return store
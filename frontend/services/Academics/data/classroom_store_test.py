@@ -0,0 +1,178 @@
+import json
+import os
+import tempfile
+import unittest
+
+from frontend.services.Academics.data.classroom_store import get_classroom_store
+from frontend.services.Academics.Classroom.post_service import PostService
+from frontend.services.Academics.Classroom.topic_service import TopicService
+from frontend.services.Academics.Tagging.section_service import SectionService
+
+
+class TestClassroomStore(unittest.TestCase):
+
+    def setUp(self):
+        """Create a small unified data file in a temp directory"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data_file = os.path.join(self.tmp_dir.name, "classroom_data.json")
+        self._write({
+            "classes": [{"id": 1}, {"id": 2}],
+            "topics": [{"id": 1, "class_id": 1, "title": "Week 1", "type": "material"}],
+            "posts": [
+                {"id": 1, "class_id": 1, "topic_id": 1, "type": "material", "title": "A", "date": "2025-08-18 10:00:00"},
+                {"id": 2, "class_id": 2, "topic_id": None, "type": "assessment", "title": "B", "date": "2025-08-19 10:00:00"},
+            ],
+        })
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write(self, data):
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def test_same_path_shares_one_store(self):
+        """Test every caller gets the same store for the same file"""
+        self.assertIs(get_classroom_store(self.data_file), get_classroom_store(self.data_file))
+
+    def test_services_share_snapshot(self):
+        """Test services read the single parsed snapshot"""
+        post_service = PostService(self.data_file)
+        topic_service = TopicService(self.data_file)
+        self.assertIs(post_service._load_data(), topic_service._load_data())
+
+    def test_reload_only_when_file_changes(self):
+        """Test the snapshot is reparsed only after the file changes"""
+        store = get_classroom_store(self.data_file)
+        first = store.load()
+        self.assertIs(store.load(), first)
+
+        self._write({"classes": [], "topics": [], "posts": [{"id": 9, "class_id": 1}]})
+        os.utime(self.data_file, ns=(0, 0))  # force a distinct mtime
+        reloaded = store.load()
+        self.assertIsNot(reloaded, first)
+        self.assertEqual(reloaded["posts"][0]["id"], 9)
+
+    def test_save_becomes_snapshot(self):
+        """Test writes update the shared snapshot without a reparse"""
+        post_service = PostService(self.data_file)
+        self.assertTrue(post_service.delete_post(2))
+
+        store = get_classroom_store(self.data_file)
+        data = store.load()
+        self.assertEqual([p["id"] for p in data["posts"]], [1])
+        with open(self.data_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), data)
+
+    def test_index_lookups(self):
+        """Test class, topic and id indexes answer without scanning"""
+        index = get_classroom_store(self.data_file).get_index()
+        self.assertEqual([p["id"] for p in index.posts_for_class(1)], [1])
+        self.assertEqual([p["id"] for p in index.posts_for_topic(2, None)], [2])
+        self.assertEqual(index.get_topic(1)["title"], "Week 1")
+        self.assertEqual(index.find_topic(1, "Week 1")["id"], 1)
+        self.assertIsNone(index.find_topic(2, "Week 1"))
+
+    def test_index_follows_insert_and_delete(self):
+        """Test indexes are maintained by inserts and deletes"""
+        topic_service = TopicService(self.data_file)
+        post_service = PostService(self.data_file)
+
+        topic = topic_service.create_topic(2, "Week 2", "assessment")
+        self.assertEqual(topic_service.get_topic_by_id(topic["id"])["title"], "Week 2")
+        self.assertEqual(len(topic_service.get_topics_by_class_id(2)), 1)
+
+        post_service.delete_post(1)
+        self.assertEqual(post_service.get_posts_by_class_id(1), [])
+        self.assertIsNone(get_classroom_store(self.data_file).get_index().get_post(1))
+
+    def test_index_rebuilt_after_external_change(self):
+        """Test indexes follow a reparse of the file"""
+        post_service = PostService(self.data_file)
+        self.assertEqual(len(post_service.get_posts_by_class_id(1)), 1)
+
+        self._write({"topics": [], "posts": [{"id": 5, "class_id": 1, "type": "material"},
+                                             {"id": 6, "class_id": 1, "type": "material"}]})
+        os.utime(self.data_file, ns=(0, 0))
+        self.assertEqual(len(post_service.get_posts_by_class_id(1)), 2)
+        self.assertEqual(len(post_service.get_posts_by_filters(1, filter_type="assessment")), 0)
+
+    def test_frozen_views_are_shared_and_read_only(self):
+        """Test reads hand out the same read-only records without copying"""
+        store = get_classroom_store(self.data_file)
+        posts = store.frozen("posts")
+        self.assertIs(store.frozen("posts"), posts)
+        self.assertEqual(posts[0], store.load()["posts"][0])
+        with self.assertRaises(TypeError):
+            posts[0]["title"] = "changed"
+        with self.assertRaises(TypeError):
+            posts.append({})
+
+        editable = posts[0].copy()
+        editable["title"] = "changed"
+        self.assertEqual(posts[0]["title"], "A")
+
+    def test_writes_update_snapshot_in_place(self):
+        """Test service writes keep the cached snapshot and untouched views"""
+        self._write({"sections": [{"id": 1, "section": "A"}, {"id": 2, "section": "B"}]})
+        service = SectionService(self.data_file)
+        store = get_classroom_store(self.data_file)
+        snapshot = store.load()
+        untouched = service.get_by_id(2)
+
+        updated = service.update(1, {"section": "C"})
+        self.assertEqual(updated["section"], "C")
+        self.assertIs(store.load(), snapshot)
+        self.assertIs(service.get_by_id(2), untouched)
+        self.assertEqual(service.get_by_id(1)["section"], "C")
+
+        self.assertTrue(service.delete(2))
+        self.assertEqual([s["id"] for s in service.get_all()], [1])
+        with open(self.data_file, 'r', encoding='utf-8') as f:
+            self.assertEqual([s["section"] for s in json.load(f)["sections"]], ["C"])
+
+    def test_ids_are_never_reused(self):
+        """Test the persisted sequence survives deleting the newest record"""
+        post_service = PostService(self.data_file)
+        topic_service = TopicService(self.data_file)
+        self.assertEqual(topic_service.create_topic(1, "Week 2", "material")["id"], 2)
+        self.assertTrue(post_service.delete_post(2))
+
+        store = get_classroom_store(self.data_file)
+        store.invalidate()
+        self.assertEqual(store.next_id("posts"), 3)
+        self.assertEqual(store.next_id("posts"), 4)
+        self.assertEqual(store.next_id("topics"), 3)
+
+    def test_create_post_is_one_indexed_write(self):
+        """Test a new material lands in the snapshot, index and file at once"""
+        service = PostService(self.data_file)
+        store = get_classroom_store(self.data_file)
+        snapshot = store.load()
+
+        post = service.create_post(1, "Slides", "", "material", "Faculty", topic_id=1,
+                                   attachment={"name": "w1.pdf", "type": "pdf", "file_path": "attachments/w1.pdf"})
+        self.assertEqual(post["id"], 3)
+        self.assertEqual(post["attachment"]["type"], "PDF")
+        self.assertIs(store.load(), snapshot)
+        self.assertIn(post, store.get_index().posts_for_topic(1, 1))
+        with open(self.data_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["posts"][-1]["title"], "Slides")
+
+    def test_posts_grouped_by_topic(self):
+        """Test Classworks groups: untitled first, then every topic by title"""
+        topic_service = TopicService(self.data_file)
+        post_service = PostService(self.data_file)
+        topic_service.create_topic(1, "Assessments", "assessment")
+        post_service.create_post(1, "Notes", "", "material", "Faculty")
+        post_service.create_post(1, "Orphan", "", "material", "Faculty", topic_id=99)
+
+        groups = post_service.get_posts_grouped_by_topic(1)
+        self.assertEqual([title for title, _ in groups], ["", "Assessments", "Week 1"])
+        self.assertEqual(sorted(p["title"] for p in groups[0][1]), ["Notes", "Orphan"])
+        self.assertEqual(groups[1][1], [])
+        self.assertEqual([p["id"] for p in groups[2][1]], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,15 +2,66 @@
 """
 Grade data manager for persistent storage of grades
 Handles reading/writing grades to JSON file
+
+Journal mode (default): grades_data.json is a snapshot and every edit is
+appended as one small JSON line to grades_data.json.journal. On startup the
+snapshot is loaded and the journal replayed; once the journal reaches
+COMPACT_THRESHOLD records it is folded back into the snapshot.
+
+With ACADEMICS_STORAGE=sqlite (or backend="sqlite") grades are kept in the
+grades table of grades_data.db instead, one row per edited grade.
+
+Edits made inside ``with manager.batch():`` are applied in memory right away
+and persisted once, in a single write, when the outermost batch exits. With
+the persistence worker running, journal and SQLite writes are handed to the
+worker thread instead of being made on the caller's thread.
 """
+import copy
 import json
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
+from frontend.services.Academics.data.persistence_worker import get_persistence_worker
+from frontend.services.Academics.data.storage_config import BACKEND_SQLITE, sqlite_path, storage_backend
+
+DEFAULT_GRADES_FILE = 'frontend/services/Academics/data/grades_data.json'
+
 class GradeDataManager:
-    def __init__(self, data_file='frontend/services/Academics/data/grades_data.json'):
+    # Journal records before they are compacted into the snapshot
+    COMPACT_THRESHOLD = 200
+    
+    def __init__(self, data_file=DEFAULT_GRADES_FILE, use_journal=True, backend=None):
         self.data_file = data_file
-        self.ensure_data_file()
+        self.journal_file = f"{data_file}.journal"
+        
+        # SQLite backend replaces both the snapshot and the journal
+        self._db = None
+        if (backend or storage_backend()) == BACKEND_SQLITE:
+            from frontend.services.Academics.data.sqlite_store import GradeDatabase
+            self._db = GradeDatabase(sqlite_path(data_file))
+            use_journal = False
+        self.use_journal = use_journal
+        
+        # In-memory state for journal mode: snapshot + replayed journal
+        self._lock = threading.RLock()
+        self._grades = None
+        self._snapshot_signature = None
+        self._journal_offset = 0
+        self._journal_records = 0
+        
+        # Edits waiting for the enclosing batch() to finish
+        self._batch_depth = 0
+        self._pending = []
+        # Edits applied in memory but not yet written by the persistence worker
+        self._unwritten = []
+        # Held for a whole file/DB write; self._lock only around its bookkeeping
+        self._io_lock = threading.RLock()
+        self._writing = False
+        
+        if self._db is None:
+            self.ensure_data_file()
     
     def ensure_data_file(self):
         """Ensure grades data file exists"""
@@ -25,6 +76,25 @@ class GradeDataManager:
     
     def load_grades(self):
         """Load all grades from file"""
+        return self._copy(self._live_grades())
+    
+    def _live_grades(self):
+        """Grades as cached in memory (journal/SQLite) or freshly read; not for callers"""
+        if self._db is not None:
+            # Unwritten edits live only in the cached rows; don't reread yet
+            return self._db.load(refresh=not (self._unwritten or self._writing))
+        if self.use_journal:
+            return self._current_grades()
+        
+        return self._read_grades_file()
+    
+    def _copy(self, grades):
+        # Edits are applied to the cached dict, so callers get their own copy
+        if self.use_journal or self._db is not None:
+            return copy.deepcopy(grades)
+        return grades
+    
+    def _read_grades_file(self):
         try:
             with open(self.data_file, 'r') as f:
                 data = json.load(f)
@@ -34,6 +104,10 @@ class GradeDataManager:
     
     def save_grades(self, grades_data):
         """Save all grades to file"""
+        # Copied once here: the record is written later and may be kept as the cache
+        self._commit({'op': 'all', 'grades': copy.deepcopy(grades_data)})
+    
+    def _write_grades_file(self, grades_data):
         data = {
             "grades": grades_data,
             "last_updated": datetime.now().isoformat()
@@ -43,57 +117,53 @@ class GradeDataManager:
     
     def get_student_grades(self, student_id, class_id):
         """Get grades for a specific student in a class"""
-        all_grades = self.load_grades()
+        all_grades = self._live_grades()
         class_key = f"class_{class_id}"
         
         if class_key in all_grades and student_id in all_grades[class_key]:
-            return all_grades[class_key][student_id]
+            return self._copy(all_grades[class_key][student_id])
         return {}
     
     def save_student_grade(self, student_id, class_id, component_key, value, is_draft=True):
         """Save a single grade for a student"""
-        all_grades = self.load_grades()
-        class_key = f"class_{class_id}"
-        
-        if class_key not in all_grades:
-            all_grades[class_key] = {}
-        
-        if student_id not in all_grades[class_key]:
-            all_grades[class_key][student_id] = {}
-        
-        all_grades[class_key][student_id][component_key] = {
+        record = {
+            'op': 'set',
+            'class': f"class_{class_id}",
+            'student': student_id,
+            'component': component_key,
             'value': value,
             'is_draft': is_draft,
             'updated_at': datetime.now().isoformat()
         }
         
-        self.save_grades(all_grades)
+        self._commit(record)
     
     def get_class_grades(self, class_id):
         """Get all grades for a class"""
-        all_grades = self.load_grades()
+        all_grades = self._live_grades()
         class_key = f"class_{class_id}"
-        return all_grades.get(class_key, {})
+        return self._copy(all_grades.get(class_key, {}))
     
     def save_class_grades(self, class_id, class_grades):
         """Save all grades for a class"""
-        all_grades = self.load_grades()
-        class_key = f"class_{class_id}"
-        all_grades[class_key] = class_grades
-        self.save_grades(all_grades)
+        record = {
+            'op': 'class',
+            'class': f"class_{class_id}",
+            'grades': copy.deepcopy(class_grades)
+        }
+        
+        self._commit(record)
     
     def bulk_upload_grades(self, class_id, component_key):
         """Mark all grades for a component as uploaded"""
-        all_grades = self.load_grades()
-        class_key = f"class_{class_id}"
-        
-        if class_key in all_grades:
-            for student_id in all_grades[class_key]:
-                if component_key in all_grades[class_key][student_id]:
-                    all_grades[class_key][student_id][component_key]['is_draft'] = False
-                    all_grades[class_key][student_id][component_key]['updated_at'] = datetime.now().isoformat()
+        record = {
+            'op': 'upload',
+            'class': f"class_{class_id}",
+            'component': component_key,
+            'updated_at': datetime.now().isoformat()
+        }
         
-        self.save_grades(all_grades)
+        self._commit(record)
     
     def get_uploaded_grades_for_student(self, student_id, class_id):
         """Get only uploaded (non-draft) grades for a student"""
@@ -104,4 +174,244 @@ class GradeDataManager:
             if not grade_data.get('is_draft', True):
                 uploaded_grades[component_key] = grade_data
         
-        return uploaded_grades
\ No newline at end of file
+        return uploaded_grades
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group many edits into one persisted write.
+        
+        Edits are applied in memory immediately; the journal append (or the
+        whole-file rewrite when use_journal=False) happens once on exit. If
+        the block raises, the pending edits are discarded.
+        """
+        rollback = False
+        try:
+            with self._lock:
+                self._batch_depth += 1
+                try:
+                    yield self
+                except BaseException:
+                    self._batch_depth -= 1
+                    if self._batch_depth == 0:
+                        self._pending = []
+                        rollback = True
+                    raise
+                else:
+                    self._batch_depth -= 1
+                    if self._batch_depth == 0:
+                        self._flush_pending()
+        finally:
+            if rollback:
+                # Outside self._lock: it may have to wait for the worker's write
+                self._discard_pending()
+    
+    def _commit(self, record):
+        """Apply an edit; persist it now or when the enclosing batch ends"""
+        with self._lock:
+            if self.use_journal or self._db is not None:
+                self._apply(self._live_grades(), record)
+            self._pending.append(record)
+            if self._batch_depth == 0:
+                self._flush_pending()
+    
+    def _flush_pending(self):
+        records, self._pending = self._pending, []
+        if not records:
+            return
+        
+        worker = get_persistence_worker()
+        if worker is not None and (self.use_journal or self._db is not None):
+            # Memory already holds the edits; the worker writes them out
+            self._unwritten.extend(records)
+            worker.schedule(self, self._write_unwritten)
+            return
+        self._persist(records)
+    
+    def _write_unwritten(self):
+        """Persist every edit handed to the worker since its last run"""
+        with self._io_lock:
+            with self._lock:
+                records, self._unwritten = self._unwritten, []
+                if not records:
+                    return
+                # Serialized under the lock, written to disk without it, so
+                # edits on the GUI thread never wait for the file or DB write
+                write = self._prepare_write(records)
+                self._writing = True
+            try:
+                write()
+            except Exception:
+                with self._lock:
+                    self._unwritten[:0] = records
+                raise
+            finally:
+                with self._lock:
+                    self._writing = False
+    
+    def _persist(self, records):
+        self._prepare_write(records)()
+    
+    def _prepare_write(self, records):
+        """Serialize applied records; returns the call that writes them out"""
+        if self._db is not None:
+            statements = self._db.prepare(records)
+            return lambda: self._db.execute(statements)
+        if self.use_journal:
+            if any(record.get('op') == 'all' for record in records):
+                # A full replacement becomes the new snapshot instead of a journal line
+                text = self._snapshot_text(self._grades)
+                return lambda: self._write_snapshot(text)
+            payload = ''.join(json.dumps(r, separators=(',', ':')) + '\n' for r in records)
+            return lambda: self._append_journal(payload, len(records))
+        return lambda: self._rewrite_grades_file(records)
+    
+    def _rewrite_grades_file(self, records):
+        all_grades = self._read_grades_file()
+        for record in records:
+            self._apply(all_grades, record)
+        self._write_grades_file(all_grades)
+    
+    def _discard_pending(self):
+        with self._io_lock, self._lock:
+            # Edits from earlier, completed batches must survive the rollback
+            self._write_unwritten()
+            if self._db is not None:
+                self._db.invalidate()
+            elif self.use_journal:
+                # Rebuild memory from snapshot + journal, which never saw the edits
+                self._grades = None
+    
+    # ------------------------------------------------------------------
+    # Journal mode
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _apply(all_grades, record):
+        """Apply one edit record to an in-memory grades dict"""
+        op = record.get('op')
+        if op == 'all':
+            # Records own their grades (copied when built), so they are reused
+            if record['grades'] is not all_grades:
+                all_grades.clear()
+                all_grades.update(record['grades'])
+            return
+        
+        class_key = record['class']
+        if op == 'set':
+            student_grades = all_grades.setdefault(class_key, {}).setdefault(record['student'], {})
+            student_grades[record['component']] = {
+                'value': record['value'],
+                'is_draft': record['is_draft'],
+                'updated_at': record['updated_at']
+            }
+        elif op == 'upload':
+            for student_grades in all_grades.get(class_key, {}).values():
+                grade = student_grades.get(record['component'])
+                if grade is not None:
+                    grade['is_draft'] = False
+                    grade['updated_at'] = record['updated_at']
+        elif op == 'class':
+            all_grades[class_key] = record['grades']
+    
+    def _stat(self, path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    def _current_grades(self):
+        """Snapshot plus every journal record not applied yet"""
+        with self._lock:
+            if (self._unwritten or self._writing) and self._grades is not None:
+                # Memory is ahead of the files until the worker catches up
+                return self._grades
+            
+            signature = self._stat(self.data_file)
+            journal_stat = self._stat(self.journal_file)
+            journal_size = journal_stat[1] if journal_stat else 0
+            
+            # Snapshot rewritten or journal truncated (compacted elsewhere)
+            if (self._grades is None or signature != self._snapshot_signature
+                    or journal_size < self._journal_offset):
+                try:
+                    with open(self.data_file, 'r') as f:
+                        self._grades = json.load(f).get('grades', {})
+                except (FileNotFoundError, json.JSONDecodeError):
+                    self._grades = {}
+                self._snapshot_signature = signature
+                self._journal_offset = 0
+                self._journal_records = 0
+            
+            if journal_size > self._journal_offset:
+                self._replay_journal()
+            
+            return self._grades
+    
+    def _replay_journal(self):
+        with open(self.journal_file, 'rb') as f:
+            f.seek(self._journal_offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Torn write at the tail; pick it up once it is complete
+                    break
+                self._journal_offset += len(line)
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._apply(self._grades, record)
+                self._journal_records += 1
+    
+    def _append_journal(self, payload, count):
+        """Append count already-applied, serialized records in one write"""
+        with open(self.journal_file, 'ab') as f:
+            start = f.tell()
+            f.write(payload.encode('utf-8'))
+            f.flush()
+            end = f.tell()
+        
+        with self._lock:
+            # Only skip our own lines if nobody else appended meanwhile
+            if start == self._journal_offset:
+                self._journal_offset = end
+            self._journal_records += count
+            if self._journal_records < self.COMPACT_THRESHOLD:
+                return
+            text = self._snapshot_text(self._current_grades())
+        self._write_snapshot(text)
+    
+    def compact(self):
+        """Fold the journal into the snapshot and truncate the journal"""
+        with self._io_lock:
+            with self._lock:
+                text = self._snapshot_text(self._current_grades())
+            self._write_snapshot(text)
+    
+    @staticmethod
+    def _snapshot_text(grades):
+        data = {
+            "grades": grades,
+            "last_updated": datetime.now().isoformat()
+        }
+        return json.dumps(data, indent=4)
+    
+    def _write_snapshot(self, text):
+        """Replace the snapshot with text from _snapshot_text() and empty the journal"""
+        temp_file = f"{self.data_file}.tmp"
+        with open(temp_file, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.data_file)
+        
+        # The snapshot now contains every record, so drop the journal
+        with open(self.journal_file, 'w'):
+            pass
+        
+        signature = self._stat(self.data_file)
+        with self._lock:
+            self._snapshot_signature = signature
+            self._journal_offset = 0
+            self._journal_records = 0
@@ -0,0 +1,128 @@
+import json
+import os
+import tempfile
+import unittest
+
+from frontend.services.Academics.data.grade_manager import GradeDataManager
+
+
+class TestGradeJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data_file = os.path.join(self.tmp_dir.name, "grades_data.json")
+        self.manager = GradeDataManager(self.data_file)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _snapshot(self):
+        with open(self.data_file, 'r') as f:
+            return json.load(f)["grades"]
+
+    def test_edit_appends_without_rewriting_snapshot(self):
+        """Test a grade edit only appends one journal line"""
+        self.manager.save_student_grade("101", 1, "quiz1_midterm", "30/40")
+
+        self.assertEqual(self._snapshot(), {})
+        with open(self.manager.journal_file, 'r') as f:
+            self.assertEqual(len(f.readlines()), 1)
+        self.assertEqual(
+            self.manager.get_student_grades("101", 1)["quiz1_midterm"]["value"], "30/40"
+        )
+
+    def test_journal_replayed_on_startup(self):
+        """Test a new manager sees snapshot plus journal"""
+        self.manager.save_student_grade("101", 1, "quiz1_midterm", "30/40")
+        self.manager.save_student_grade("102", 1, "quiz1_midterm", "20/40")
+        self.manager.bulk_upload_grades(1, "quiz1_midterm")
+
+        reopened = GradeDataManager(self.data_file)
+        class_grades = reopened.get_class_grades(1)
+        self.assertEqual(class_grades["102"]["quiz1_midterm"]["value"], "20/40")
+        self.assertFalse(class_grades["101"]["quiz1_midterm"]["is_draft"])
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        """Test the journal is compacted once it reaches the threshold"""
+        self.manager.COMPACT_THRESHOLD = 3
+        for i in range(3):
+            self.manager.save_student_grade(str(100 + i), 1, "pt1_midterm", "50/50")
+
+        self.assertEqual(len(self._snapshot()["class_1"]), 3)
+        self.assertEqual(os.path.getsize(self.manager.journal_file), 0)
+
+        # Other instances notice the compaction and stay consistent
+        reopened = GradeDataManager(self.data_file)
+        self.assertEqual(len(reopened.get_class_grades(1)), 3)
+
+    def test_torn_tail_is_ignored(self):
+        """Test an incomplete last journal line is skipped on replay"""
+        self.manager.save_student_grade("101", 1, "quiz1_midterm", "30/40")
+        with open(self.manager.journal_file, 'a') as f:
+            f.write('{"op":"set","class":"class_1"')
+
+        reopened = GradeDataManager(self.data_file)
+        self.assertEqual(list(reopened.get_class_grades(1)), ["101"])
+
+    def test_returned_grades_are_copies(self):
+        """Test mutating returned or saved grades leaves the manager's grades alone"""
+        self.manager.save_student_grade("101", 1, "quiz1_midterm", "30/40")
+        class_grades = self.manager.get_class_grades(1)
+        class_grades["101"]["quiz1_midterm"]["value"] = "0/40"
+        class_grades["102"] = {}
+        self.assertEqual(self.manager.load_grades()["class_1"]["101"]["quiz1_midterm"]["value"], "30/40")
+        self.assertEqual(list(self.manager.load_grades()["class_1"]), ["101"])
+
+        saved = {"103": {"quiz1_midterm": {"value": "40/40", "is_draft": True}}}
+        self.manager.save_class_grades(2, saved)
+        saved["103"]["quiz1_midterm"]["value"] = "0/40"
+        self.assertEqual(self.manager.get_student_grades("103", 2)["quiz1_midterm"]["value"], "40/40")
+
+    def test_snapshot_mode_rewrites_file(self):
+        """Test use_journal=False keeps the whole-file behaviour"""
+        manager = GradeDataManager(self.data_file, use_journal=False)
+        manager.save_student_grade("101", 1, "quiz1_midterm", "30/40")
+        self.assertEqual(self._snapshot()["class_1"]["101"]["quiz1_midterm"]["value"], "30/40")
+        self.assertFalse(os.path.exists(manager.journal_file))
+
+    def test_batch_appends_once(self):
+        """Test a batch is persisted as one write at the end"""
+        with self.manager.batch():
+            for i in range(5):
+                self.manager.save_student_grade(str(100 + i), 1, "quiz1_midterm", "10/40")
+            self.manager.bulk_upload_grades(1, "quiz1_midterm")
+            # Visible in memory, not on disk yet
+            self.assertEqual(len(self.manager.get_class_grades(1)), 5)
+            self.assertFalse(os.path.exists(self.manager.journal_file))
+
+        with open(self.manager.journal_file, 'r') as f:
+            self.assertEqual(len(f.readlines()), 6)
+        reopened = GradeDataManager(self.data_file)
+        self.assertFalse(reopened.get_class_grades(1)["104"]["quiz1_midterm"]["is_draft"])
+
+    def test_failed_batch_rolls_back(self):
+        """Test an exception inside a batch discards its edits"""
+        self.manager.save_student_grade("101", 1, "quiz1_midterm", "30/40")
+        with self.assertRaises(RuntimeError):
+            with self.manager.batch():
+                self.manager.save_student_grade("101", 1, "quiz1_midterm", "0/40")
+                self.manager.save_student_grade("102", 1, "quiz1_midterm", "0/40")
+                raise RuntimeError("boom")
+
+        self.assertEqual(list(self.manager.get_class_grades(1)), ["101"])
+        self.assertEqual(
+            self.manager.get_student_grades("101", 1)["quiz1_midterm"]["value"], "30/40"
+        )
+
+    def test_snapshot_mode_batch_rewrites_once(self):
+        """Test use_journal=False batches rewrite the file once"""
+        manager = GradeDataManager(self.data_file, use_journal=False)
+        with manager.batch():
+            manager.save_student_grade("101", 1, "quiz1_midterm", "30/40")
+            manager.save_student_grade("102", 1, "quiz1_midterm", "20/40")
+            self.assertEqual(self._snapshot(), {})
+        self.assertEqual(len(self._snapshot()["class_1"]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
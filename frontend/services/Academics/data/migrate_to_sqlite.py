@@ -0,0 +1,97 @@
+# data/migrate_to_sqlite.py
+"""
+One-shot migration of the Academics JSON files to the SQLite backend.
+
+    python -m frontend.services.Academics.data.migrate_to_sqlite [--overwrite]
+
+Copies classroom_data.json into classroom_data.db and grades_data.json (with
+its journal replayed) into grades_data.db. The JSON files are left untouched;
+set ACADEMICS_STORAGE=sqlite afterwards to run the services on the databases.
+"""
+import argparse
+import json
+import os
+from typing import Dict
+
+from frontend.services.Academics.data.classroom_store import DEFAULT_DATA_FILE
+from frontend.services.Academics.data.grade_manager import DEFAULT_GRADES_FILE, GradeDataManager
+from frontend.services.Academics.data.sqlite_store import TABLES, GradeDatabase, SqliteClassroomStore
+from frontend.services.Academics.data.storage_config import BACKEND_JSON, sqlite_path
+
+
+def _prepare_target(db_file: str, overwrite: bool) -> None:
+    if not os.path.exists(db_file):
+        return
+    if not overwrite:
+        raise FileExistsError(f"{db_file} already exists (use overwrite to replace it)")
+    for path in (db_file, f"{db_file}-wal", f"{db_file}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def migrate(
+        classroom_file: str = DEFAULT_DATA_FILE,
+        grades_file: str = DEFAULT_GRADES_FILE,
+        overwrite: bool = False
+) -> Dict[str, int]:
+    """
+    Copy the JSON data files into their SQLite databases.
+
+    Args:
+        classroom_file: Path to the unified classroom_data.json
+        grades_file: Path to grades_data.json
+        overwrite: Replace databases that already exist
+
+    Returns:
+        Number of rows written per table
+
+    Raises:
+        FileExistsError: If a database exists and overwrite is False
+    """
+    counts: Dict[str, int] = {}
+
+    if os.path.exists(classroom_file):
+        with open(classroom_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        db_file = sqlite_path(classroom_file)
+        _prepare_target(db_file, overwrite)
+        store = SqliteClassroomStore(db_file)
+        try:
+            store.save(data)
+        finally:
+            store.close()
+        for table in TABLES:
+            counts[table] = len(data.get(table) or [])
+
+    if os.path.exists(grades_file):
+        grades = GradeDataManager(grades_file, backend=BACKEND_JSON).load_grades()
+        db_file = sqlite_path(grades_file)
+        _prepare_target(db_file, overwrite)
+        database = GradeDatabase(db_file)
+        try:
+            database.replace_all(grades)
+        finally:
+            database.close()
+        counts["grades"] = sum(
+            len(student_grades)
+            for class_grades in grades.values()
+            for student_grades in class_grades.values()
+        )
+
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migrate Academics JSON data to SQLite")
+    parser.add_argument("--classroom-file", default=DEFAULT_DATA_FILE)
+    parser.add_argument("--grades-file", default=DEFAULT_GRADES_FILE)
+    parser.add_argument("--overwrite", action="store_true", help="replace existing databases")
+    args = parser.parse_args()
+
+    counts = migrate(args.classroom_file, args.grades_file, args.overwrite)
+    for table, count in counts.items():
+        print(f"{table}: {count} rows")
+
+
+if __name__ == '__main__':
+    main()
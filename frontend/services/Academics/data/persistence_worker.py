@@ -0,0 +1,136 @@
+# data/persistence_worker.py
+"""
+Background writer for the Academics data files.
+
+Stores and managers call schedule(key, job) whenever their in-memory state
+becomes dirty. The worker waits DEFAULT_DELAY seconds from the first
+notification, coalescing every later one for the same key, then runs the
+latest job for that key on its own thread. The GUI thread only updates
+memory; serialization, fsync and os.replace happen here.
+
+Background writes are opt-in: the application calls
+start_persistence_worker() at startup. Without a running worker every
+store writes synchronously, which is what tests and scripts rely on.
+"""
+import atexit
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds between the first dirty notification and the write
+DEFAULT_DELAY = 0.2
+
+
+class PersistenceWorker:
+    """Single thread running debounced write jobs, one pending job per key."""
+
+    def __init__(self, delay: float = DEFAULT_DELAY):
+        self.delay = delay
+        self._cond = threading.Condition()
+        self._pending: Dict[Any, Tuple[float, Callable[[], None]]] = {}
+        self._running = False
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="PersistenceWorker", daemon=True)
+        self._thread.start()
+
+    def schedule(self, key: Any, job: Callable[[], None]) -> None:
+        """
+        Run job after the debounce delay, replacing any job pending for key.
+
+        The delay counts from the first notification, so a steady stream of
+        edits is still written at least every `delay` seconds.
+        """
+        with self._cond:
+            if not self._stopped:
+                entry = self._pending.get(key)
+                deadline = entry[0] if entry else time.monotonic() + self.delay
+                self._pending[key] = (deadline, job)
+                self._cond.notify_all()
+                return
+        # Stopped (e.g. during interpreter shutdown): write synchronously
+        job()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Run every pending job now and wait until all writes have finished.
+
+        Returns:
+            bool: False if timeout expired first
+        """
+        with self._cond:
+            now = time.monotonic()
+            self._pending = {key: (now, job) for key, (_, job) in self._pending.items()}
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._pending and not self._running, timeout)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Flush, then end the worker thread."""
+        self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped and not self._pending:
+                        return
+                    now = time.monotonic()
+                    due = [key for key, (deadline, _) in self._pending.items() if deadline <= now]
+                    if due:
+                        break
+                    wait = None
+                    if self._pending:
+                        wait = min(deadline for deadline, _ in self._pending.values()) - now
+                    self._cond.wait(wait)
+                jobs = [self._pending.pop(key)[1] for key in due]
+                self._running = True
+
+            for job in jobs:
+                try:
+                    job()
+                except Exception:
+                    logger.exception("Background write failed")
+
+            with self._cond:
+                self._running = False
+                self._cond.notify_all()
+
+
+_worker: Optional[PersistenceWorker] = None
+_worker_lock = threading.Lock()
+
+
+def start_persistence_worker(delay: float = DEFAULT_DELAY) -> PersistenceWorker:
+    """Start the process-wide worker (idempotent); pending writes are flushed at exit."""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = PersistenceWorker(delay)
+            atexit.register(stop_persistence_worker)
+        return _worker
+
+
+def get_persistence_worker() -> Optional[PersistenceWorker]:
+    """The running worker, or None when writes are synchronous."""
+    return _worker
+
+
+def flush_pending_writes(timeout: Optional[float] = None) -> bool:
+    """Write everything that is still pending; call before the app quits."""
+    worker = _worker
+    return worker.flush(timeout) if worker else True
+
+
+def stop_persistence_worker() -> None:
+    """Flush and stop the worker; later writes are synchronous again."""
+    global _worker
+    with _worker_lock:
+        worker, _worker = _worker, None
+    if worker:
+        worker.stop()
@@ -0,0 +1,132 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from frontend.services.Academics.data.classroom_store import get_classroom_store
+from frontend.services.Academics.data.grade_manager import GradeDataManager
+from frontend.services.Academics.data.persistence_worker import (
+    PersistenceWorker,
+    flush_pending_writes,
+    start_persistence_worker,
+    stop_persistence_worker
+)
+
+
+class TestPersistenceWorker(unittest.TestCase):
+
+    def test_jobs_for_one_key_are_coalesced(self):
+        """Test only the latest job per key runs once the delay expires"""
+        worker = PersistenceWorker(delay=0.05)
+        calls = []
+        done = threading.Event()
+        worker.schedule("file", lambda: calls.append(1))
+        worker.schedule("file", lambda: (calls.append(2), done.set()))
+
+        self.assertTrue(done.wait(2))
+        worker.stop()
+        self.assertEqual(calls, [2])
+
+    def test_flush_runs_pending_jobs_now(self):
+        """Test flush() does not wait for the debounce delay"""
+        worker = PersistenceWorker(delay=60)
+        calls = []
+        worker.schedule("a", lambda: calls.append("a"))
+        worker.schedule("b", lambda: calls.append("b"))
+
+        self.assertTrue(worker.flush(timeout=2))
+        self.assertEqual(sorted(calls), ["a", "b"])
+        worker.stop()
+
+
+class TestBackgroundWrites(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data_file = os.path.join(self.tmp_dir.name, "classroom_data.json")
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump({"topics": [], "posts": []}, f)
+        # Long delay: nothing reaches disk until the test flushes
+        start_persistence_worker(delay=60)
+
+    def tearDown(self):
+        stop_persistence_worker()
+        self.tmp_dir.cleanup()
+
+    def _read(self):
+        with open(self.data_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_store_write_is_deferred_until_flush(self):
+        """Test writes update memory at once and the file on flush"""
+        store = get_classroom_store(self.data_file)
+        store.insert("posts", {"id": 1, "class_id": 1})
+        store.insert("posts", {"id": 2, "class_id": 1})
+
+        self.assertEqual(self._read()["posts"], [])
+        self.assertEqual(len(store.get_index().posts_for_class(1)), 2)
+
+        self.assertTrue(flush_pending_writes(timeout=2))
+        self.assertEqual([p["id"] for p in self._read()["posts"]], [1, 2])
+        self.assertFalse(os.path.exists(f"{self.data_file}.tmp"))
+
+    def test_grade_journal_written_by_worker(self):
+        """Test grade edits reach the journal on flush"""
+        grades_file = os.path.join(self.tmp_dir.name, "grades_data.json")
+        manager = GradeDataManager(grades_file)
+        manager.save_student_grade("101", 1, "quiz1_midterm", "30/40")
+        manager.save_student_grade("102", 1, "quiz1_midterm", "20/40")
+
+        self.assertFalse(os.path.exists(manager.journal_file))
+        self.assertEqual(len(manager.get_class_grades(1)), 2)
+
+        self.assertTrue(flush_pending_writes(timeout=2))
+        with open(manager.journal_file, 'r') as f:
+            self.assertEqual(len(f.readlines()), 2)
+        self.assertEqual(len(GradeDataManager(grades_file).get_class_grades(1)), 2)
+
+    def test_saved_class_grades_are_written_as_given(self):
+        """Test changing the caller's dict after a save does not change what is written"""
+        grades_file = os.path.join(self.tmp_dir.name, "grades_data.json")
+        manager = GradeDataManager(grades_file)
+        class_grades = {"101": {"quiz1_midterm": {"value": "30/40", "is_draft": True}}}
+        manager.save_class_grades(1, class_grades)
+        class_grades["101"]["quiz1_midterm"]["value"] = "0/40"
+
+        self.assertTrue(flush_pending_writes(timeout=2))
+        reopened = GradeDataManager(grades_file)
+        self.assertEqual(reopened.get_student_grades("101", 1)["quiz1_midterm"]["value"], "30/40")
+
+    def test_grade_edit_does_not_wait_for_journal_write(self):
+        """Test a grade edit goes through while the worker is writing"""
+        grades_file = os.path.join(self.tmp_dir.name, "grades_data.json")
+        manager = GradeDataManager(grades_file)
+        writing, release = threading.Event(), threading.Event()
+        append_journal = manager._append_journal
+
+        def slow_append(payload, count):
+            writing.set()
+            release.wait(5)
+            append_journal(payload, count)
+
+        manager._append_journal = slow_append
+        manager.save_student_grade("101", 1, "quiz1_midterm", "30/40")
+        flusher = threading.Thread(target=flush_pending_writes, args=(5,))
+        flusher.start()
+        self.assertTrue(writing.wait(2))
+
+        edit = threading.Thread(target=manager.save_student_grade, args=("102", 1, "quiz1_midterm", "20/40"))
+        edit.start()
+        edit.join(2)
+        self.assertFalse(edit.is_alive())
+        self.assertEqual(len(manager.get_class_grades(1)), 2)
+
+        release.set()
+        self.assertTrue(flush_pending_writes(timeout=2))
+        flusher.join(2)
+        self.assertEqual(len(GradeDataManager(grades_file).get_class_grades(1)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# data/readonly.py
+"""
+Read-only views of JSON records.
+
+FrozenDict and FrozenList are real dict/list subclasses, so they serialize,
+compare and iterate like the records they wrap, but every mutator raises
+TypeError. copy() (and copy.copy / copy.deepcopy) returns an ordinary,
+fully writable deep copy, so a caller that wants to edit a record pays for
+the copy only then.
+"""
+from typing import Any
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only; use copy() to get an editable copy")
+
+
+class FrozenDict(dict):
+    """A dict whose contents cannot be changed."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self) -> dict:
+        return thaw(self)
+
+    def __copy__(self) -> dict:
+        return thaw(self)
+
+    def __deepcopy__(self, memo) -> dict:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """A list whose contents cannot be changed."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def copy(self) -> list:
+        return thaw(self)
+
+    def __copy__(self) -> list:
+        return thaw(self)
+
+    def __deepcopy__(self, memo) -> list:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Return a read-only deep view of a JSON value."""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return an ordinary, writable deep copy of a (possibly frozen) JSON value."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
@@ -0,0 +1,170 @@
+# data/record_query.py
+"""
+Hash and prefix indexes over one collection, with a small query API.
+
+A RecordQuery keeps, for each indexed field, value -> records (hash index)
+and, for each prefix field, a sorted list of lower-cased values (prefix
+index). query() intersects the candidate sets of the indexed criteria,
+checks any remaining filters on those candidates only, then sorts and
+slices a page. The owning ClassroomIndex keeps it current on every
+insert/replace/remove.
+"""
+import bisect
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+Bucket = Dict[int, Dict]
+Extractor = Callable[[Dict], Iterable[Any]]
+
+
+def field(name: str) -> Extractor:
+    """Extractor for a plain field (records without the field are not indexed)."""
+    return lambda record: (record[name],) if name in record else ()
+
+
+def schedule_days(record: Dict) -> Iterable[Any]:
+    """Extractor for the days a class meets."""
+    return {s.get('day') for s in record.get('schedules') or [] if isinstance(s, dict)}
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _sort_key(value: Any) -> Tuple:
+    # None last; strings case-insensitively; mixed types grouped by type name
+    if value is None:
+        return (1, '', '')
+    if isinstance(value, str):
+        return (0, 'str', value.lower())
+    return (0, type(value).__name__, value)
+
+
+class RecordQuery:
+    """Indexes over one collection's records."""
+
+    def __init__(
+            self,
+            records: Iterable[Dict],
+            indexed: Dict[str, Extractor],
+            prefixed: Sequence[str] = ()
+    ):
+        self._indexed = indexed
+        self._prefixed = tuple(prefixed)
+        self._records: Bucket = {}
+        self._hash: Dict[str, Dict[Any, Bucket]] = {name: {} for name in indexed}
+        self._prefix: Dict[str, List[Tuple[str, int]]] = {name: [] for name in self._prefixed}
+        for record in records:
+            self.add(record)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def add(self, record: Dict) -> None:
+        key = id(record)
+        self._records[key] = record
+        for name, extract in self._indexed.items():
+            for value in extract(record):
+                if _hashable(value):
+                    self._hash[name].setdefault(value, {})[key] = record
+        for name in self._prefixed:
+            bisect.insort(self._prefix[name], (self._prefix_value(record, name), key))
+
+    def remove(self, record: Dict) -> None:
+        key = id(record)
+        if self._records.pop(key, None) is None:
+            return
+        for name, extract in self._indexed.items():
+            for value in extract(record):
+                bucket = self._hash[name].get(value) if _hashable(value) else None
+                if bucket is not None:
+                    bucket.pop(key, None)
+                    if not bucket:
+                        del self._hash[name][value]
+        for name in self._prefixed:
+            entries = self._prefix[name]
+            position = bisect.bisect_left(entries, (self._prefix_value(record, name), key))
+            if position < len(entries) and entries[position][1] == key:
+                del entries[position]
+
+    @staticmethod
+    def _prefix_value(record: Dict, name: str) -> str:
+        value = record.get(name)
+        return '' if value is None else str(value).lower()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(
+            self,
+            filters: Optional[Dict[str, Any]] = None,
+            prefix: Optional[Dict[str, str]] = None,
+            sort_by: Optional[str] = None,
+            descending: bool = False,
+            offset: int = 0,
+            limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Filter, sort and page the records.
+
+        Args:
+            filters: field -> value (equality) or list/tuple/set of values (in)
+            prefix: field -> case-insensitive prefix
+            sort_by: Field to sort by (default 'id')
+            descending: Reverse the sort order
+            offset: Number of matching records to skip
+            limit: Page size (None for all remaining)
+
+        Returns:
+            Dict: 'items' (the page), 'total' (all matches), 'offset', 'limit'
+        """
+        candidates: Optional[List[Bucket]] = []
+        remaining: List[Tuple[str, Any]] = []
+
+        for name, value in (filters or {}).items():
+            values = list(value) if isinstance(value, (list, tuple, set, frozenset)) else [value]
+            if name in self._hash and all(_hashable(v) for v in values):
+                matches: Bucket = {}
+                for v in values:
+                    matches.update(self._hash[name].get(v, {}))
+                candidates.append(matches)
+            else:
+                remaining.append((name, values))
+
+        for name, text in (prefix or {}).items():
+            text = str(text).lower()
+            if name in self._prefix:
+                entries = self._prefix[name]
+                low = bisect.bisect_left(entries, (text, -1))
+                high = bisect.bisect_left(entries, (text + '\U0010ffff', -1))
+                candidates.append({key: self._records[key] for _, key in entries[low:high]})
+            else:
+                remaining.append((name, text))
+
+        if candidates:
+            candidates.sort(key=len)
+            matched = [r for key, r in candidates[0].items()
+                       if all(key in other for other in candidates[1:])]
+        else:
+            matched = list(self._records.values())
+
+        for name, expected in remaining:
+            if isinstance(expected, str):
+                matched = [r for r in matched if str(r.get(name) or '').lower().startswith(expected)]
+            else:
+                matched = [r for r in matched if name in r and r[name] in expected]
+
+        sort_field = sort_by or 'id'
+        matched.sort(key=lambda r: _sort_key(r.get(sort_field)), reverse=descending)
+
+        offset = max(offset, 0)
+        page = matched[offset:] if limit is None else matched[offset:offset + max(limit, 0)]
+        return {'items': page, 'total': len(matched), 'offset': offset, 'limit': limit}
@@ -0,0 +1,105 @@
+import json
+import os
+import tempfile
+import unittest
+
+from frontend.services.Academics.data.record_query import RecordQuery, field, schedule_days
+from frontend.services.Academics.Tagging.class_service import ClassService
+from frontend.services.Academics.Tagging.section_service import SectionService
+
+
+def _class(class_id, code, room, *days):
+    return {"id": class_id, "code": code, "title": f"Course {code}", "room": room,
+            "schedules": [{"day": day} for day in days]}
+
+
+class TestRecordQuery(unittest.TestCase):
+
+    def setUp(self):
+        self.classes = [
+            _class(3, "IT 101", "R1", "Monday"),
+            _class(1, "IT 102", "R2", "Monday", "Friday"),
+            _class(2, "CS 101", "R1", "Tuesday"),
+        ]
+        self.query = RecordQuery(self.classes, {"room": field("room"), "day": schedule_days}, ("code",))
+
+    def _ids(self, **criteria):
+        return [r["id"] for r in self.query.query(**criteria)["items"]]
+
+    def test_filters_prefix_and_in(self):
+        """Test equality, in-lists, case-insensitive prefixes and unindexed fields"""
+        self.assertEqual(self._ids(filters={"room": "R1"}), [2, 3])
+        self.assertEqual(self._ids(filters={"day": ["Friday", "Tuesday"]}), [1, 2])
+        self.assertEqual(self._ids(prefix={"code": "it 1"}), [1, 3])
+        self.assertEqual(self._ids(prefix={"code": "it"}, filters={"day": "Monday", "room": "R1"}), [3])
+        self.assertEqual(self._ids(prefix={"title": "course cs"}), [2])
+        self.assertEqual(self._ids(filters={"title": "Course IT 102"}), [1])
+
+    def test_sort_and_pages(self):
+        """Test sorting and offset/limit against the full match count"""
+        page = self.query.query(sort_by="code", descending=True, offset=1, limit=1)
+        self.assertEqual([r["id"] for r in page["items"]], [3])
+        self.assertEqual(page["total"], 3)
+        self.assertEqual(self._ids(offset=2, limit=5), [3])
+
+    def test_indexes_follow_add_and_remove(self):
+        """Test the hash and prefix indexes are maintained on mutation"""
+        self.query.remove(self.classes[0])
+        extra = _class(4, "IT 103", "R1", "Monday")
+        self.query.add(extra)
+        self.assertEqual(self._ids(filters={"room": "R1"}), [2, 4])
+        self.assertEqual(self._ids(prefix={"code": "IT"}), [1, 4])
+        self.assertEqual(len(self.query), 3)
+
+
+class TestServiceQueries(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data_file = os.path.join(self.tmp_dir.name, "classroom_data.json")
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump({"sections": [
+                {"id": 1, "program": "BS Information Technology", "year": "3rd", "section": "C",
+                 "type": "Lecture", "curriculum": "2023"},
+                {"id": 2, "program": "BS Computer Science", "year": "1st", "section": "A",
+                 "type": "Laboratory", "curriculum": "2023"},
+            ], "classes": []}, f)
+        self.sections = SectionService(self.data_file)
+        self.service = ClassService(self.data_file, section_service=self.sections)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _create(self, code, section_id, instructor, day):
+        return self.service.create({
+            "code": code, "title": "Course", "units": 3, "section_id": section_id,
+            "type": "Lecture", "room": "R1", "instructor": instructor,
+            "schedules": [{"day": day, "start_time": "08:00 AM", "end_time": "09:00 AM"}],
+        })
+
+    def test_class_query_tracks_writes(self):
+        """Test class queries see create, update and delete without reloading"""
+        first = self._create("IT 1", 1, "Ana", "Monday")
+        self._create("IT 2", 2, "Ben", "Tuesday")
+        self._create("CS 3", 1, "Ana", "Wednesday")
+
+        result = self.service.query(filters={"instructor": "Ana"}, prefix={"code": "it"})
+        self.assertEqual([c["code"] for c in result["items"]], ["IT 1"])
+
+        self.service.update(first["id"], {"instructor": "Cy"})
+        self.assertEqual(self.service.query(filters={"instructor": "Ana"})["total"], 1)
+        self.assertEqual(len(self.service.search({"section_id": [1, 2]})), 3)
+
+        self.service.delete(first["id"])
+        page = self.service.query(filters={"day": ["Monday", "Tuesday"]}, limit=1)
+        self.assertEqual((page["total"], page["items"][0]["code"]), (1, "IT 2"))
+
+    def test_section_query(self):
+        """Test section prefix search and sorting"""
+        result = self.sections.query(prefix={"program": "bs c"}, sort_by="section")
+        self.assertEqual([s["id"] for s in result["items"]], [2])
+        self.assertEqual([s["id"] for s in self.sections.query(sort_by="section")["items"]], [2, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
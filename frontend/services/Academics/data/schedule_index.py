@@ -0,0 +1,164 @@
+# data/schedule_index.py
+"""
+Interval indexes over class schedules for conflict checks.
+
+Each schedule entry is stored once per (room, day) and once per
+(instructor, day) with its times pre-parsed to minutes after midnight.
+Entries of a bucket are kept sorted by start, together with the longest
+duration in the bucket, so every interval overlapping [start, end) has its
+start in (start - longest, end) and is found with two bisections.
+overlapping_pairs() sweeps every bucket once to list all clashes in a term.
+"""
+import bisect
+import heapq
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (start, end, class record, schedule entry)
+Interval = Tuple[int, int, Dict, Dict]
+
+
+def parse_minutes(time_str: str) -> int:
+    """
+    Minutes after midnight of a 'HH:MM AM/PM' time ('HH:MMAM' also accepted).
+
+    Raises:
+        ValueError: If the string is not in that format
+    """
+    text = str(time_str).strip().upper()
+    if text[-2:] in ('AM', 'PM') and text[-3:-2] != ' ':
+        text = text[:-2] + ' ' + text[-2:]
+    try:
+        parsed = datetime.strptime(text, "%I:%M %p")
+    except ValueError:
+        raise ValueError(f"Time '{time_str}' must be in format 'HH:MM AM' or 'HH:MM PM'")
+    return parsed.hour * 60 + parsed.minute
+
+
+DAY_ORDER = {day: i for i, day in enumerate(
+    ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'))}
+
+
+def _bucket_order(item: Tuple[Tuple[Any, str], Any]) -> Tuple[str, int]:
+    (owner, day), _ = item
+    return str(owner), DAY_ORDER.get(day, len(DAY_ORDER))
+
+
+def instructor_key(instructor: Any) -> str:
+    """Instructors are matched case- and whitespace-insensitively."""
+    return str(instructor or '').strip().lower()
+
+
+class IntervalBucket:
+    """Intervals of one (owner, day), sorted by start."""
+
+    def __init__(self):
+        self._starts: List[Tuple[int, int]] = []
+        self._intervals: List[Interval] = []
+        self._longest = 0
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def add(self, interval: Interval) -> None:
+        # id() of the schedule entry breaks ties between equal starts
+        key = (interval[0], id(interval[3]))
+        position = bisect.bisect_left(self._starts, key)
+        self._starts.insert(position, key)
+        self._intervals.insert(position, interval)
+        self._longest = max(self._longest, interval[1] - interval[0])
+
+    def remove(self, interval: Interval) -> None:
+        key = (interval[0], id(interval[3]))
+        position = bisect.bisect_left(self._starts, key)
+        if position < len(self._starts) and self._starts[position] == key:
+            del self._starts[position]
+            del self._intervals[position]
+            self._longest = max((e - s for s, e, _, _ in self._intervals), default=0)
+
+    def overlapping(self, start: int, end: int) -> List[Interval]:
+        """Intervals with s < end and e > start, in start order."""
+        low = bisect.bisect_right(self._starts, (start - self._longest, float('inf')))
+        high = bisect.bisect_left(self._starts, (end, -1))
+        return [iv for iv in self._intervals[low:high] if iv[1] > start]
+
+    def overlapping_pairs(self) -> Iterator[Tuple[Interval, Interval]]:
+        """
+        Sweep line over the sorted intervals: every overlapping pair of
+        different classes, in O(n log n + pairs).
+        """
+        active: List[Tuple[int, int, Interval]] = []
+        for seq, interval in enumerate(self._intervals):
+            start = interval[0]
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            for _, _, earlier in active:
+                if earlier[2] is not interval[2]:
+                    yield earlier, interval
+            heapq.heappush(active, (interval[1], seq, interval))
+
+
+class ScheduleIndex:
+    """Room and instructor interval indexes over the 'classes' collection."""
+
+    def __init__(self, classes: Optional[List[Dict]] = None):
+        self._rooms: Dict[Tuple[Any, str], IntervalBucket] = {}
+        self._instructors: Dict[Tuple[str, str], IntervalBucket] = {}
+        # id(class record) -> its intervals, for removal
+        self._by_class: Dict[int, List[Interval]] = {}
+        for record in classes or []:
+            self.add_class(record)
+
+    def add_class(self, record: Dict) -> None:
+        intervals = []
+        for schedule in record.get('schedules') or []:
+            try:
+                start = parse_minutes(schedule['start_time'])
+                end = parse_minutes(schedule['end_time'])
+                day = schedule['day']
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping schedule of class {record.get('id')}: {e}")
+                continue
+            interval = (start, end, record, schedule)
+            self._bucket(self._rooms, (record.get('room'), day)).add(interval)
+            self._bucket(self._instructors, (instructor_key(record.get('instructor')), day)).add(interval)
+            intervals.append(interval)
+        self._by_class[id(record)] = intervals
+
+    def remove_class(self, record: Dict) -> None:
+        for interval in self._by_class.pop(id(record), []):
+            day = interval[3]['day']
+            self._rooms[(record.get('room'), day)].remove(interval)
+            self._instructors[(instructor_key(record.get('instructor')), day)].remove(interval)
+
+    def room_overlaps(self, room: Any, day: str, start: int, end: int) -> List[Interval]:
+        """Scheduled intervals in room on day that overlap [start, end)."""
+        bucket = self._rooms.get((room, day))
+        return bucket.overlapping(start, end) if bucket else []
+
+    def instructor_overlaps(self, instructor: Any, day: str, start: int, end: int) -> List[Interval]:
+        """Intervals instructor teaches on day that overlap [start, end)."""
+        bucket = self._instructors.get((instructor_key(instructor), day))
+        return bucket.overlapping(start, end) if bucket else []
+
+    def room_clashes(self) -> Iterator[Tuple[Any, str, Interval, Interval]]:
+        """(room, day, earlier, later) for every pair sharing a room."""
+        for (room, day), bucket in sorted(self._rooms.items(), key=_bucket_order):
+            for earlier, later in bucket.overlapping_pairs():
+                yield room, day, earlier, later
+
+    def instructor_clashes(self) -> Iterator[Tuple[str, str, Interval, Interval]]:
+        """(instructor, day, earlier, later) for every pair one instructor teaches."""
+        for (_, day), bucket in sorted(self._instructors.items(), key=_bucket_order):
+            for earlier, later in bucket.overlapping_pairs():
+                yield earlier[2].get('instructor'), day, earlier, later
+
+    @staticmethod
+    def _bucket(index: Dict, key: Tuple) -> IntervalBucket:
+        bucket = index.get(key)
+        if bucket is None:
+            bucket = index[key] = IntervalBucket()
+        return bucket
@@ -0,0 +1,140 @@
+import json
+import os
+import tempfile
+import unittest
+
+from frontend.services.Academics.data.classroom_store import get_classroom_store
+from frontend.services.Academics.data.schedule_index import ScheduleIndex, parse_minutes
+from frontend.services.Academics.Tagging.class_import import read_class_rows
+from frontend.services.Academics.Tagging.class_service import ClassService, ScheduleConflictError
+from frontend.services.Academics.Tagging.section_service import SectionService
+
+
+def _class(class_id, room, instructor, *slots):
+    return {
+        "id": class_id, "code": f"IT {class_id}", "title": "Course", "room": room,
+        "instructor": instructor,
+        "schedules": [{"day": day, "start_time": start, "end_time": end} for day, start, end in slots],
+    }
+
+
+class TestScheduleIndex(unittest.TestCase):
+
+    def test_parse_minutes(self):
+        """Test both accepted time spellings"""
+        self.assertEqual(parse_minutes("07:30 AM"), 450)
+        self.assertEqual(parse_minutes("1:00PM"), 780)
+        self.assertEqual(parse_minutes("12:00 AM"), 0)
+        with self.assertRaises(ValueError):
+            parse_minutes("25:00")
+
+    def test_overlaps_by_room_and_instructor(self):
+        """Test half-open overlap in the room and instructor buckets"""
+        long_class = _class(1, "R1", "Ana", ("Monday", "07:00 AM", "12:00 PM"))
+        short_class = _class(2, "R1", "Ben", ("Monday", "01:00 PM", "02:00 PM"))
+        index = ScheduleIndex([long_class, short_class])
+
+        def ids(intervals):
+            return [iv[2]["id"] for iv in intervals]
+
+        self.assertEqual(ids(index.room_overlaps("R1", "Monday", 660, 810)), [1, 2])
+        self.assertEqual(ids(index.room_overlaps("R1", "Monday", 720, 780)), [])
+        self.assertEqual(ids(index.room_overlaps("R1", "Tuesday", 660, 810)), [])
+        self.assertEqual(ids(index.instructor_overlaps(" ana ", "Monday", 600, 610)), [1])
+
+        index.remove_class(long_class)
+        self.assertEqual(ids(index.room_overlaps("R1", "Monday", 420, 810)), [2])
+
+    def test_sweep_finds_every_clashing_pair(self):
+        """Test the sweep pairs nested and chained overlaps, not touching ones"""
+        index = ScheduleIndex([
+            _class(1, "R1", "Ana", ("Monday", "07:00 AM", "12:00 PM")),
+            _class(2, "R1", "Ben", ("Monday", "08:00 AM", "09:00 AM")),
+            _class(3, "R1", "Cy", ("Monday", "08:30 AM", "10:00 AM")),
+            _class(4, "R1", "Ana", ("Monday", "12:00 PM", "01:00 PM")),
+        ])
+        pairs = [(a[2]["id"], b[2]["id"]) for _, _, a, b in index.room_clashes()]
+        self.assertEqual(sorted(pairs), [(1, 2), (1, 3), (2, 3)])
+        self.assertEqual(list(index.instructor_clashes()), [])
+
+
+class TestClassServiceConflicts(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data_file = os.path.join(self.tmp_dir.name, "classroom_data.json")
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump({"sections": [{"id": 1, "program": "BS Information Technology",
+                                     "year": "3rd", "section": "C"}], "classes": []}, f)
+        self.service = ClassService(self.data_file, section_service=SectionService(self.data_file))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _create(self, room, instructor, start, end):
+        return self.service.create({
+            "code": "IT 95", "title": "Course", "units": 3, "section_id": 1, "type": "Lecture",
+            "room": room, "instructor": instructor,
+            "schedules": [{"day": "Monday", "start_time": start, "end_time": end}],
+        })
+
+    def test_index_follows_create_update_delete(self):
+        """Test conflicts reflect every write without reloading"""
+        first = self._create("R1", "Ana", "08:00 AM", "10:00 AM")
+        with self.assertRaises(ScheduleConflictError):
+            self._create("R1", "Ben", "09:00 AM", "11:00 AM")
+        with self.assertRaises(ScheduleConflictError):
+            self._create("R2", "ANA", "09:00 AM", "11:00 AM")
+
+        self.service.update(first["id"], {"room": "R3"})
+        second = self._create("R1", "Ben", "09:00 AM", "11:00 AM")
+        self.assertEqual(self.service.update(second["id"], {"room": "R1"})["room"], "R1")
+
+        self.assertTrue(self.service.delete(first["id"]))
+        self._create("R2", "Ana", "09:00 AM", "11:00 AM")
+
+    def test_conflict_report(self):
+        """Test the report lists clashes saved without conflict checks"""
+        self._create("R1", "Ana", "08:00 AM", "10:00 AM")
+        self.service.create({
+            "code": "IT 96", "title": "Other", "units": 3, "section_id": 1, "type": "Lecture",
+            "room": "R1", "instructor": "Ana",
+            "schedules": [{"day": "Monday", "start_time": "09:00 AM", "end_time": "11:00 AM"}],
+        }, check_conflicts=False)
+
+        report = self.service.get_conflict_report()
+        self.assertEqual([c["kind"] for c in report], ["room", "faculty"])
+        self.assertEqual(report[0]["room"], "R1")
+        self.assertEqual((report[0]["first"]["code"], report[0]["second"]["code"]), ("IT 95", "IT 96"))
+
+
+    def test_create_many_from_csv(self):
+        """Test one write for the batch, with per-row validation and conflicts"""
+        self._create("R1", "Ana", "08:00 AM", "10:00 AM")
+        csv_file = os.path.join(self.tmp_dir.name, "classes.csv")
+        with open(csv_file, 'w', encoding='utf-8') as f:
+            f.write("code,title,units,section_id,room,instructor,type,schedules\n"
+                    "IT 1,A,3,1,R2,Ben,Lecture,Monday 08:00 AM-09:00 AM; Friday 08:00 AM-09:00 AM\n"
+                    "IT 2,B,3,1,R2,Cy,Lecture,Monday 08:30 AM-09:30 AM\n"
+                    "IT 3,C,3,1,R1,Dee,Lecture,Monday 09:00 AM-11:00 AM\n"
+                    "IT 4,D,3,9,R4,Eve,Lecture,Monday 09:00 AM-11:00 AM\n"
+                    "IT 5,E,3,1,R5,Ben,Laboratory,Tuesday 01:00 PM-04:00 PM\n")
+
+        store = get_classroom_store(self.data_file)
+        version = store._stat_signature()
+        result = self.service.create_many(read_class_rows(csv_file))
+
+        self.assertEqual([c["code"] for c in result["created"]], ["IT 1", "IT 5"])
+        self.assertEqual([e["row"] for e in result["errors"]], [2, 3, 4])
+        self.assertIn("Conflict with IT 1", result["errors"][0]["error"])
+        self.assertIn("Conflict with IT 95", result["errors"][1]["error"])
+        self.assertIn("does not exist", result["errors"][2]["error"])
+        self.assertEqual(result["created"][0]["section_name"], "BSIT-3C")
+        self.assertEqual(len(result["created"][0]["schedules"]), 2)
+        self.assertNotEqual(store._stat_signature(), version)
+        self.assertEqual(len(self.service.get_all()), 3)
+        self.assertEqual(len(self.service.get_conflict_report()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,482 @@
+# data/sharded_store.py
+"""
+Per-class sharded layout for the classroom data.
+
+    classroom_data/catalog.json              classes, sections, users, ...
+    classroom_data/sequences.json            id counters (see ClassroomStore.next_id)
+    classroom_data/classes/class_<id>.json   posts, topics and syllabus of one class
+
+A write rewrites only the catalog or the one shard it touches, and
+class_index() reads just the shard of the classroom being opened. The first
+time the layout is opened it is split out of classroom_data.json, which is
+left in place untouched.
+"""
+import json
+import logging
+import os
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from frontend.services.Academics.data.classroom_index import ClassroomIndex
+from frontend.services.Academics.data.classroom_store import SEQUENCES_KEY, ClassroomStore, write_atomic
+from frontend.services.Academics.data.persistence_worker import get_persistence_worker
+
+logger = logging.getLogger(__name__)
+
+# Collections stored per class; everything else lives in the catalog
+SHARD_COLLECTIONS = ("posts", "topics", "syllabus")
+
+CATALOG_FILE = "catalog.json"
+SEQUENCES_FILE = "sequences.json"
+SHARD_DIR = "classes"
+
+
+def shard_key(class_id: Any) -> str:
+    return str(class_id)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, indent=4, ensure_ascii=False)
+
+
+def _empty_shard() -> Dict[str, List[Dict]]:
+    return {collection: [] for collection in SHARD_COLLECTIONS}
+
+
+def split_document(data: Dict) -> Tuple[Dict, Dict[str, Dict]]:
+    """Split a unified document into (catalog, {shard key: shard}), leaving out id counters."""
+    catalog = {key: value for key, value in data.items()
+               if key not in SHARD_COLLECTIONS and key != SEQUENCES_KEY}
+    shards: Dict[str, Dict] = defaultdict(_empty_shard)
+    for collection in SHARD_COLLECTIONS:
+        for record in data.get(collection) or []:
+            shards[shard_key(record.get("class_id"))][collection].append(record)
+    return catalog, dict(shards)
+
+
+class ShardedClassroomStore(ClassroomStore):
+    """
+    ClassroomStore over a catalog file plus one shard file per class.
+
+    load() still returns the merged document for callers that need all of
+    it; it is rebuilt from the cached catalog and shards, rereading only the
+    files that changed on disk.
+    """
+
+    def __init__(self, root: str, source_file: Optional[str] = None):
+        super().__init__(root)
+        self.root = root
+        self.source_file = source_file
+        self.catalog_file = os.path.join(root, CATALOG_FILE)
+        self.sequences_file = os.path.join(root, SEQUENCES_FILE)
+        self.shard_dir = os.path.join(root, SHARD_DIR)
+
+        self._catalog: Optional[Dict] = None
+        self._sequences: Optional[Dict] = None
+        self._shards: Dict[str, Dict] = {}
+        self._class_indexes: Dict[str, ClassroomIndex] = {}
+        # Per file: stat signature and text as last read or written
+        self._signatures: Dict[str, Optional[Tuple[int, int, int]]] = {}
+        self._texts: Dict[str, str] = {}
+        # Per file: objects waiting for the background writer, and versions
+        self._unwritten: Dict[str, Any] = {}
+        self._file_versions: Dict[str, int] = defaultdict(int)
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    def shard_file(self, key: str) -> str:
+        return os.path.join(self.shard_dir, f"class_{key}.json")
+
+    def _shard_keys_on_disk(self) -> List[str]:
+        try:
+            names = os.listdir(self.shard_dir)
+        except FileNotFoundError:
+            return []
+        return [name[len("class_"):-len(".json")] for name in names
+                if name.startswith("class_") and name.endswith(".json")]
+
+    def _all_shard_keys(self) -> List[str]:
+        """Shard keys on disk or in memory, in the catalog's class order."""
+        keys = set(self._shard_keys_on_disk()) | set(self._shards)
+        order = {shard_key(c.get("id")): i for i, c in enumerate((self._catalog or {}).get("classes") or [])}
+        return sorted(keys, key=lambda k: (order.get(k, len(order)), k))
+
+    def _ensure_layout(self, create: bool = False) -> None:
+        """
+        Create the layout, splitting source_file the first time.
+
+        Raises:
+            FileNotFoundError: If neither the layout nor source_file exists
+                and create is False
+        """
+        if os.path.exists(self.catalog_file):
+            return
+        if self.source_file and os.path.exists(self.source_file):
+            with open(self.source_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            catalog, shards = split_document(data)
+            sequences = data.get(SEQUENCES_KEY)
+        elif create:
+            catalog, shards, sequences = {}, {}, None
+        else:
+            raise FileNotFoundError(f"Data file not found: {self.catalog_file}")
+
+        os.makedirs(self.shard_dir, exist_ok=True)
+        for key, shard in shards.items():
+            write_atomic(self.shard_file(key), _dumps(shard))
+        if sequences:
+            write_atomic(self.sequences_file, _dumps({SEQUENCES_KEY: sequences}))
+        # Catalog last: its presence marks a complete layout
+        write_atomic(self.catalog_file, _dumps(catalog))
+        logger.info(f"Split {self.source_file} into {len(shards)} class shards under {self.root}")
+
+    def _stat(self, path: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _changed_on_disk(self, path: str) -> bool:
+        if path in self._unwritten:
+            # Memory is ahead of the file until the worker writes it
+            return False
+        return self._stat(path) != self._signatures.get(path)
+
+    def _read(self, path: str, default: Any) -> Any:
+        signature = self._stat(path)
+        if signature is None:
+            value, text = default, None
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            value = json.loads(text)
+        self._signatures[path] = signature
+        if text is None:
+            self._texts.pop(path, None)
+        else:
+            self._texts[path] = text
+        return value
+
+    def _put(self, path: str, value: Any, text: Optional[str] = None) -> None:
+        """Persist one file (skipped if text shows it is unchanged)."""
+        if text is not None and text == self._texts.get(path):
+            return
+
+        worker = get_persistence_worker()
+        if worker is not None:
+            self._unwritten[path] = value
+            self._file_versions[path] += 1
+            worker.schedule((self, path), lambda: self._write_in_background(path))
+            return
+
+        if text is None:
+            text = _dumps(value)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, text)
+        self._texts[path] = text
+        self._signatures[path] = self._stat(path)
+
+    def _write_in_background(self, path: str) -> None:
+        """Worker job: write the latest state of one file."""
+        with self._lock:
+            if path not in self._unwritten:
+                return
+            version = self._file_versions[path]
+            value = self._unwritten[path]
+
+        # Serialized without the lock, as in ClassroomStore._write_in_background
+        try:
+            text = _dumps(value)
+        except RuntimeError:
+            text = None
+        with self._lock:
+            if self._file_versions[path] != version:
+                return
+            if text is None:
+                text = _dumps(self._unwritten[path])
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_atomic(path, text)
+        except Exception:
+            logger.exception(f"Background write of {path} failed")
+            return
+
+        with self._lock:
+            if self._file_versions[path] == version:
+                self._unwritten.pop(path, None)
+                self._texts[path] = text
+                self._signatures[path] = self._stat(path)
+
+    # ------------------------------------------------------------------
+    # Catalog and shards
+    # ------------------------------------------------------------------
+
+    def _load_catalog(self, create: bool = False) -> Dict:
+        self._ensure_layout(create)
+        if self._catalog is None or self._changed_on_disk(self.catalog_file):
+            self._catalog = self._read(self.catalog_file, {})
+            self._data = None
+            self._clear_frozen()
+        return self._catalog
+
+    def _load_sequences(self) -> Dict:
+        catalog = self._load_catalog(create=True)
+        if self._sequences is None or self._changed_on_disk(self.sequences_file):
+            sequences = self._read(self.sequences_file, None)
+            if sequences is None:
+                # Layouts split before sequences.json kept the counters in the catalog
+                sequences = {SEQUENCES_KEY: catalog.pop(SEQUENCES_KEY, {})}
+            self._sequences = sequences
+            if self._data is not None:
+                self._data[SEQUENCES_KEY] = sequences[SEQUENCES_KEY]
+        return self._sequences
+
+    def _load_shard(self, key: str) -> Dict:
+        path = self.shard_file(key)
+        if key not in self._shards or self._changed_on_disk(path):
+            shard = self._read(path, None) or _empty_shard()
+            for collection in SHARD_COLLECTIONS:
+                shard.setdefault(collection, [])
+            self._shards[key] = shard
+            self._class_indexes.pop(key, None)
+            self._data = None
+        return self._shards[key]
+
+    def _put_shard(self, key: str) -> None:
+        self._put(self.shard_file(key), self._shards[key])
+
+    def collection(self, collection: str) -> List[Dict]:
+        if collection in SHARD_COLLECTIONS:
+            return super().collection(collection)
+        # Catalog collections never need the shards
+        with self._lock:
+            return self._load_catalog().get(collection) or []
+
+    # ------------------------------------------------------------------
+    # ClassroomStore interface
+    # ------------------------------------------------------------------
+
+    def load(self) -> Dict:
+        """Merged document of the catalog and every shard."""
+        with self._lock:
+            catalog = self._load_catalog()
+            for key in self._all_shard_keys():
+                self._load_shard(key)
+
+            if self._data is None:
+                data = dict(catalog)
+                data.pop(SEQUENCES_KEY, None)
+                sequences = self._load_sequences().get(SEQUENCES_KEY)
+                if sequences:
+                    data[SEQUENCES_KEY] = sequences
+                shards = [self._shards[key] for key in self._all_shard_keys()]
+                for collection in SHARD_COLLECTIONS:
+                    data[collection] = [record for shard in shards for record in shard[collection]]
+                self._data = data
+                self._index_valid = False
+                self._clear_frozen()
+            return self._data
+
+    def class_index(self, class_id: Any) -> ClassroomIndex:
+        """Indexes over the shard of class_id only."""
+        with self._lock:
+            self._load_catalog()
+            key = shard_key(class_id)
+            shard = self._load_shard(key)
+            index = self._class_indexes.get(key)
+            if index is None:
+                index = ClassroomIndex(shard)
+                self._class_indexes[key] = index
+            return index
+
+    def _write(self, data: Dict) -> None:
+        """Write the catalog and the shards whose content changed."""
+        self._ensure_layout(create=True)
+        self.load()
+        catalog, shards = split_document(data)
+        for key in self._shards:
+            shards.setdefault(key, _empty_shard())
+
+        try:
+            for key, shard in shards.items():
+                path = self.shard_file(key)
+                self._put(path, shard, _dumps(shard))
+            self._put(self.catalog_file, catalog, _dumps(catalog))
+            if SEQUENCES_KEY in data:
+                sequences = {SEQUENCES_KEY: data[SEQUENCES_KEY]}
+                self._put(self.sequences_file, sequences, _dumps(sequences))
+                self._sequences = sequences
+        except Exception:
+            self.invalidate()
+            raise
+
+        self._catalog = catalog
+        self._shards = shards
+        self._class_indexes = {}
+        self._data = data
+
+    def insert(self, collection: str, record: Dict) -> Dict:
+        """Append a record, writing only its shard (or the catalog)."""
+        with self._lock:
+            catalog = self._load_catalog(create=True)
+            if collection not in SHARD_COLLECTIONS:
+                catalog.setdefault(collection, []).append(record)
+                self._after_catalog_change(collection, new=[record])
+                return record
+
+            key = shard_key(record.get("class_id"))
+            shard = self._load_shard(key)
+            shard[collection].append(record)
+            self._put_shard(key)
+
+            if key in self._class_indexes:
+                self._class_indexes[key].add(collection, record)
+            if self._data is not None:
+                self._data.setdefault(collection, []).append(record)
+                if self._index_valid and self._index is not None:
+                    self._index.add(collection, record)
+            self._frozen_lists.pop(collection, None)
+            return record
+
+    def insert_many(self, collection: str, records: List[Dict]) -> List[Dict]:
+        """Append several records, writing each affected file once."""
+        with self._lock:
+            if not records:
+                return records
+            catalog = self._load_catalog(create=True)
+            if collection not in SHARD_COLLECTIONS:
+                catalog.setdefault(collection, []).extend(records)
+                self._after_catalog_change(collection, new=records)
+                return records
+
+            keys = []
+            for record in records:
+                key = shard_key(record.get("class_id"))
+                self._load_shard(key)[collection].append(record)
+                if key not in keys:
+                    keys.append(key)
+            for key in keys:
+                self._put_shard(key)
+            self._after_shard_change(collection, [])
+            return records
+
+    def replace(self, collection: str, record_id: Any, record: Dict) -> Optional[Dict]:
+        """Swap the record whose id is record_id, rewriting one file."""
+        with self._lock:
+            if collection not in SHARD_COLLECTIONS:
+                records = self._load_catalog().get(collection) or []
+                position = self._position(records, record_id)
+                if position is None:
+                    return None
+                old = records[position]
+                records[position] = record
+                self._after_catalog_change(collection, [old], [record])
+                return old
+
+            self._load_catalog()
+            # Look in the new record's shard first, then everywhere
+            keys = [shard_key(record.get("class_id"))]
+            keys += [k for k in self._all_shard_keys() if k != keys[0]]
+            for key in keys:
+                records = self._load_shard(key)[collection]
+                position = self._position(records, record_id)
+                if position is not None:
+                    break
+            else:
+                return None
+
+            old = records[position]
+            if shard_key(record.get("class_id")) == key:
+                records[position] = record
+            else:
+                del records[position]
+                self._load_shard(shard_key(record.get("class_id")))[collection].append(record)
+                self._put_shard(shard_key(record.get("class_id")))
+            self._put_shard(key)
+            self._after_shard_change(collection, [old])
+            return old
+
+    def remove(self, collection: str, records: Iterable[Dict]) -> int:
+        """Remove record objects, rewriting only the files that held them."""
+        with self._lock:
+            doomed = {id(r): r for r in records}
+            if not doomed:
+                return 0
+            self._seed_sequence(collection)
+
+            if collection not in SHARD_COLLECTIONS:
+                catalog = self._load_catalog()
+                current = catalog.get(collection) or []
+                kept = [r for r in current if id(r) not in doomed]
+                if len(kept) == len(current):
+                    return 0
+                catalog[collection] = kept
+                self._after_catalog_change(collection, doomed.values())
+                return len(current) - len(kept)
+
+            self._load_catalog()
+            removed = 0
+            for key in {shard_key(r.get("class_id")) for r in doomed.values()}:
+                shard = self._load_shard(key)
+                kept = [r for r in shard[collection] if id(r) not in doomed]
+                if len(kept) != len(shard[collection]):
+                    removed += len(shard[collection]) - len(kept)
+                    shard[collection] = kept
+                    self._put_shard(key)
+            if removed:
+                self._after_shard_change(collection, doomed.values())
+            return removed
+
+    def _sequence_document(self) -> Dict:
+        # Counters have their own file: allocating an id loads no shards and
+        # rewrites neither the catalog nor a shard
+        return self._load_sequences()
+
+    def _persist_sequences(self, sequences: Dict[str, int]) -> None:
+        self._put(self.sequences_file, self._sequences)
+        if self._data is not None:
+            self._data[SEQUENCES_KEY] = sequences
+
+    def invalidate(self) -> None:
+        with self._lock:
+            super().invalidate()
+            self._catalog = None
+            self._sequences = None
+            self._shards = {}
+            self._class_indexes = {}
+            self._signatures = {}
+            self._texts = {}
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _position(records: List[Dict], record_id: Any) -> Optional[int]:
+        for position, record in enumerate(records):
+            if record.get("id") == record_id:
+                return position
+        return None
+
+    def _after_catalog_change(self, collection: str, old: Iterable[Dict] = (),
+                              new: Iterable[Dict] = ()) -> None:
+        self._put(self.catalog_file, self._catalog)
+        if self._data is not None:
+            # The merged document shares the catalog's lists, but not reassigned ones
+            self._data[collection] = self._catalog[collection]
+            if self._index_valid and self._index is not None:
+                for record in old:
+                    self._index.remove(collection, record)
+                for record in new:
+                    self._index.add(collection, record)
+        self._forget_frozen(collection, old)
+
+    def _after_shard_change(self, collection: str, old: Iterable[Dict]) -> None:
+        # Shard indexes and the merged document are cheap to rebuild lazily
+        self._class_indexes = {}
+        self._data = None
+        self._forget_frozen(collection, old)
@@ -0,0 +1,126 @@
+import json
+import os
+import tempfile
+import unittest
+
+from frontend.services.Academics.data.classroom_store import SEQUENCES_KEY, get_classroom_store
+from frontend.services.Academics.data.sharded_store import ShardedClassroomStore
+from frontend.services.Academics.data.storage_config import STORAGE_ENV_VAR, sharded_root
+from frontend.services.Academics.Classroom.post_service import PostService
+
+DATA = {
+    "users": [{"id": 1, "name": "Faculty", "role": "faculty"}],
+    "classes": [
+        {"id": 1, "code": "IT 95", "section_id": 1, "schedules": []},
+        {"id": 2, "code": "IT 96", "section_id": 1, "schedules": []},
+    ],
+    "sections": [{"id": 1, "program": "BS Information Technology", "year": "3rd", "section": "C"}],
+    "topics": [{"id": 1, "class_id": 1, "title": "Week 1", "type": "material"}],
+    "posts": [
+        {"id": 1, "class_id": 1, "topic_id": 1, "type": "material", "title": "A"},
+        {"id": 2, "class_id": 2, "topic_id": None, "type": "material", "title": "B"},
+    ],
+    "syllabus": [{"id": 1, "class_id": 1, "title": "Syllabus"}],
+}
+
+
+class TestShardedBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data_file = os.path.join(self.tmp_dir.name, "classroom_data.json")
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump(DATA, f)
+
+        self._old_backend = os.environ.get(STORAGE_ENV_VAR)
+        os.environ[STORAGE_ENV_VAR] = "sharded"
+        self.store = get_classroom_store(self.data_file)
+        self.root = sharded_root(self.data_file)
+
+    def tearDown(self):
+        if self._old_backend is None:
+            os.environ.pop(STORAGE_ENV_VAR, None)
+        else:
+            os.environ[STORAGE_ENV_VAR] = self._old_backend
+        self.tmp_dir.cleanup()
+
+    def _mtimes(self):
+        files = [self.store.catalog_file, self.store.shard_file("1"), self.store.shard_file("2")]
+        return {path: os.stat(path).st_mtime_ns for path in files}
+
+    def test_split_round_trip(self):
+        """Test the source file is split once and merges back unchanged"""
+        self.assertIsInstance(self.store, ShardedClassroomStore)
+        self.assertEqual(self.store.load(), DATA)
+
+        with open(self.store.catalog_file, 'r', encoding='utf-8') as f:
+            self.assertNotIn("posts", json.load(f))
+        with open(self.store.shard_file("2"), 'r', encoding='utf-8') as f:
+            self.assertEqual([p["title"] for p in json.load(f)["posts"]], ["B"])
+
+        # A fresh store reads the layout, not the (stale) source file
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump({}, f)
+        self.assertEqual(ShardedClassroomStore(self.root, self.data_file).load(), DATA)
+
+    def test_opening_a_class_reads_only_its_shard(self):
+        """Test class-scoped reads load the catalog and one shard"""
+        service = PostService(self.data_file)
+        self.assertEqual(service.get_syllabus_by_class_id(1)["title"], "Syllabus")
+        self.assertEqual([p["title"] for p in service.get_posts_by_class_id(1)], ["A"])
+        self.assertEqual(set(self.store._shards), {"1"})
+
+    def test_insert_writes_only_its_shard(self):
+        """Test a new post rewrites its class shard and nothing else"""
+        self.store.load()
+        before = self._mtimes()
+        self.store.insert("posts", {"id": 3, "class_id": 2, "type": "material", "title": "C"})
+        after = self._mtimes()
+
+        changed = {path for path in before if before[path] != after[path]}
+        self.assertEqual(changed, {self.store.shard_file("2")})
+        self.assertEqual(len(self.store.class_index(2).posts_for_class(2)), 2)
+        self.assertEqual(len(self.store.load()["posts"]), 3)
+
+    def test_new_post_writes_its_shard_and_counters(self):
+        """Test creating a post rewrites its shard and the id counters, not the catalog"""
+        self.store.load()
+        before = self._mtimes()
+        post = PostService(self.data_file).create_post(2, "C", "", "material", "Faculty")
+        after = self._mtimes()
+
+        changed = {path for path in before if before[path] != after[path]}
+        self.assertEqual(changed, {self.store.shard_file("2")})
+        self.assertEqual(post["id"], 3)
+        with open(self.store.sequences_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), {SEQUENCES_KEY: {"posts": 3}})
+        with open(self.store.catalog_file, 'r', encoding='utf-8') as f:
+            self.assertNotIn(SEQUENCES_KEY, json.load(f))
+
+    def test_counters_move_out_of_an_older_catalog(self):
+        """Test counters kept in catalog.json by an older layout are carried over"""
+        self.store.load()
+        with open(self.store.catalog_file, 'r', encoding='utf-8') as f:
+            catalog = json.load(f)
+        catalog[SEQUENCES_KEY] = {"posts": 10}
+        with open(self.store.catalog_file, 'w', encoding='utf-8') as f:
+            json.dump(catalog, f)
+
+        store = ShardedClassroomStore(self.root, self.data_file)
+        self.assertEqual(store.next_id("posts"), 11)
+        self.assertEqual(store.load()[SEQUENCES_KEY], {"posts": 11})
+
+    def test_save_skips_unchanged_files(self):
+        """Test a full save writes only the files whose content changed"""
+        data = self.store.load()
+        before = self._mtimes()
+        data["classes"][0]["code"] = "IT 99"
+        self.store.save(data)
+        after = self._mtimes()
+
+        changed = {path for path in before if before[path] != after[path]}
+        self.assertEqual(changed, {self.store.catalog_file})
+
+
+if __name__ == '__main__':
+    unittest.main()
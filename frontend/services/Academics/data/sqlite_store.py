@@ -0,0 +1,462 @@
+# data/sqlite_store.py
+"""
+SQLite backend for the Academics data.
+
+Each collection of classroom_data.json becomes a table holding its lookup
+columns next to the full record as JSON, so services get back exactly the
+dicts they got from the JSON file. Inserts, deletes and edits only touch the
+rows involved instead of reserializing the whole document.
+
+Grades live in their own table, one row per (class, student, component).
+"""
+import json
+import logging
+import sqlite3
+import threading
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from frontend.services.Academics.data.classroom_store import SEQUENCES_KEY, ClassroomStore
+
+logger = logging.getLogger(__name__)
+
+# Lookup columns per collection table; the whole record is kept in `data`
+TABLES = {
+    "classes": ("id", "section_id", "code"),
+    "sections": ("id", "program", "year", "section"),
+    "topics": ("id", "class_id", "title"),
+    "posts": ("id", "class_id", "topic_id", "type"),
+    "syllabus": ("id", "class_id"),
+}
+
+INDEXES = (
+    ("classes", ("id",)),
+    ("classes", ("section_id",)),
+    ("sections", ("id",)),
+    ("topics", ("id",)),
+    ("topics", ("class_id",)),
+    ("posts", ("id",)),
+    ("posts", ("class_id", "topic_id")),
+    ("syllabus", ("class_id",)),
+)
+
+# (row_id, id key, serialized record) as last read from / written to a table
+SyncedRow = Tuple[int, str, str]
+
+
+def connect(db_file: str) -> sqlite3.Connection:
+    """Open a connection and make sure every table exists."""
+    conn = sqlite3.connect(db_file, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    with conn:
+        for table, columns in TABLES.items():
+            cols = ", ".join(f'"{c}"' for c in columns)
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                f"(row_id INTEGER PRIMARY KEY AUTOINCREMENT, {cols}, data TEXT NOT NULL)"
+            )
+        for table, columns in INDEXES:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_{'_'.join(columns)} "
+                f"ON {table} ({', '.join(columns)})"
+            )
+        # Top-level values without a table of their own (users, enrollments, ...)
+        conn.execute("CREATE TABLE IF NOT EXISTS documents (key TEXT PRIMARY KEY, data TEXT NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS grades ("
+            "class_key TEXT NOT NULL, student_id TEXT NOT NULL, component TEXT NOT NULL, "
+            "value TEXT, is_draft INTEGER NOT NULL DEFAULT 1, updated_at TEXT, "
+            "PRIMARY KEY (class_key, student_id, component))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_grades_component ON grades (class_key, component)")
+    return conn
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _column_value(value: Any) -> Any:
+    """Lookup columns hold scalars; anything nested is stored as JSON text."""
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    return _dumps(value)
+
+
+def _data_version(conn: sqlite3.Connection) -> int:
+    """Changes whenever another connection commits to the database."""
+    return conn.execute("PRAGMA data_version").fetchone()[0]
+
+
+class SqliteClassroomStore(ClassroomStore):
+    """
+    ClassroomStore kept in an SQLite database instead of a JSON file.
+
+    load() assembles the same document the JSON store returns and caches it
+    until another connection commits. save() writes only the rows that
+    changed; insert(), replace() and remove() are single-row statements.
+    """
+
+    def __init__(self, db_file: str):
+        super().__init__(db_file)
+        self._conn = connect(db_file)
+        self._data_version: Optional[int] = None
+        self._synced: Dict[str, List[SyncedRow]] = {}
+        self._documents: Dict[str, str] = {}
+
+    def load(self) -> Dict:
+        """Return the shared snapshot, rereading only after an outside commit."""
+        with self._lock:
+            version = _data_version(self._conn)
+            if self._data is None or version != self._data_version:
+                self._read_all()
+                self._data_version = version
+                self._index_valid = False
+                self._clear_frozen()
+                logger.debug(f"Read {self.data_file}")
+            return self._data
+
+    def _read_all(self) -> None:
+        data: Dict[str, Any] = {}
+        synced: Dict[str, List[SyncedRow]] = {}
+        for table in TABLES:
+            rows = self._conn.execute(
+                f"SELECT row_id, id, data FROM {table} ORDER BY row_id"
+            ).fetchall()
+            data[table] = [json.loads(text) for _, _, text in rows]
+            synced[table] = [(row_id, _dumps(key), text) for row_id, key, text in rows]
+
+        documents = dict(self._conn.execute("SELECT key, data FROM documents"))
+        for key, text in documents.items():
+            data[key] = json.loads(text)
+
+        self._data = data
+        self._synced = synced
+        self._documents = documents
+
+    def _write(self, data: Dict) -> None:
+        """Bring the tables in line with data, touching only changed rows."""
+        try:
+            with self._conn:
+                synced = {
+                    table: self._sync_table(table, data.get(table) or [])
+                    for table in TABLES
+                }
+                documents = self._sync_documents(data)
+        except Exception:
+            self.invalidate()
+            raise
+
+        self._data = data
+        self._synced = synced
+        self._documents = documents
+
+    def _sync_table(self, table: str, records: List[Dict]) -> List[SyncedRow]:
+        # Match records to existing rows by their id, in order for duplicates
+        old_rows: Dict[str, deque] = defaultdict(deque)
+        for row in self._synced.get(table, []):
+            old_rows[row[1]].append(row)
+
+        synced = []
+        for record in records:
+            key = _dumps(record.get("id"))
+            text = _dumps(record)
+            candidates = old_rows.get(key)
+            if candidates:
+                row_id, _, old_text = candidates.popleft()
+                if old_text != text:
+                    self._update_row(table, row_id, record, text)
+            else:
+                row_id = self._insert_row(table, record, text)
+            synced.append((row_id, key, text))
+
+        stale = [(row[0],) for rows in old_rows.values() for row in rows]
+        if stale:
+            self._conn.executemany(f"DELETE FROM {table} WHERE row_id = ?", stale)
+        return synced
+
+    def _sync_documents(self, data: Dict) -> Dict[str, str]:
+        documents = {key: _dumps(value) for key, value in data.items() if key not in TABLES}
+        for key, text in documents.items():
+            if self._documents.get(key) != text:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO documents (key, data) VALUES (?, ?)", (key, text)
+                )
+        stale = [(key,) for key in self._documents if key not in documents]
+        if stale:
+            self._conn.executemany("DELETE FROM documents WHERE key = ?", stale)
+        return documents
+
+    def _insert_row(self, table: str, record: Dict, text: str) -> int:
+        columns = TABLES[table]
+        cols = ", ".join(f'"{c}"' for c in columns)
+        marks = ", ".join("?" for _ in columns)
+        cursor = self._conn.execute(
+            f"INSERT INTO {table} ({cols}, data) VALUES ({marks}, ?)",
+            [_column_value(record.get(c)) for c in columns] + [text],
+        )
+        return cursor.lastrowid
+
+    def _update_row(self, table: str, row_id: int, record: Dict, text: str) -> None:
+        columns = TABLES[table]
+        assignments = ", ".join(f'"{c}" = ?' for c in columns)
+        self._conn.execute(
+            f"UPDATE {table} SET {assignments}, data = ? WHERE row_id = ?",
+            [_column_value(record.get(c)) for c in columns] + [text, row_id],
+        )
+
+    def insert(self, collection: str, record: Dict) -> Dict:
+        """Insert one row, index it and add it to the snapshot."""
+        if collection not in TABLES:
+            return super().insert(collection, record)
+
+        with self._lock:
+            index = self._writable_index()
+            text = _dumps(record)
+            try:
+                with self._conn:
+                    row_id = self._insert_row(collection, record, text)
+            except Exception:
+                self.invalidate()
+                raise
+
+            self._data.setdefault(collection, []).append(record)
+            self._synced.setdefault(collection, []).append(
+                (row_id, _dumps(record.get("id")), text)
+            )
+            index.add(collection, record)
+            self._frozen_lists.pop(collection, None)
+            return record
+
+    def insert_many(self, collection: str, records: List[Dict]) -> List[Dict]:
+        """Insert several rows in one transaction."""
+        if collection not in TABLES:
+            return super().insert_many(collection, records)
+
+        with self._lock:
+            index = self._writable_index()
+            texts = [_dumps(record) for record in records]
+            try:
+                with self._conn:
+                    row_ids = [self._insert_row(collection, r, t) for r, t in zip(records, texts)]
+            except Exception:
+                self.invalidate()
+                raise
+
+            self._data.setdefault(collection, []).extend(records)
+            self._synced.setdefault(collection, []).extend(
+                (row_id, _dumps(record.get("id")), text)
+                for row_id, record, text in zip(row_ids, records, texts)
+            )
+            for record in records:
+                index.add(collection, record)
+            self._frozen_lists.pop(collection, None)
+            return records
+
+    def replace(self, collection: str, record_id: Any, record: Dict) -> Optional[Dict]:
+        """Update the one row of the record whose id is record_id."""
+        with self._lock:
+            self._writable_index()
+            current = self._data.get(collection) or []
+            synced = self._synced.get(collection)
+            if collection not in TABLES or synced is None or len(synced) != len(current):
+                return super().replace(collection, record_id, record)
+
+            for position, old in enumerate(current):
+                if old.get("id") == record_id:
+                    break
+            else:
+                return None
+
+            text = _dumps(record)
+            row_id = synced[position][0]
+            try:
+                with self._conn:
+                    self._update_row(collection, row_id, record, text)
+            except Exception:
+                self.invalidate()
+                raise
+
+            current[position] = record
+            synced[position] = (row_id, _dumps(record.get("id")), text)
+            index = self.get_index()
+            index.remove(collection, old)
+            index.add(collection, record)
+            self._forget_frozen(collection, [old])
+            return old
+
+    def remove(self, collection: str, records: Iterable[Dict]) -> int:
+        """Delete the rows of the given record objects."""
+        with self._lock:
+            index = self._writable_index()
+            self._seed_sequence(collection)
+            doomed = {id(r): r for r in records}
+            current = self._data.get(collection) or []
+            synced = self._synced.get(collection)
+            # Fall back to a full sync if the list was edited without save()
+            if not doomed or synced is None or len(synced) != len(current):
+                return super().remove(collection, doomed.values())
+
+            kept, kept_synced, row_ids = [], [], []
+            for record, row in zip(current, synced):
+                if id(record) in doomed:
+                    row_ids.append((row[0],))
+                else:
+                    kept.append(record)
+                    kept_synced.append(row)
+            if not row_ids:
+                return 0
+
+            try:
+                with self._conn:
+                    self._conn.executemany(f"DELETE FROM {collection} WHERE row_id = ?", row_ids)
+            except Exception:
+                self.invalidate()
+                raise
+
+            self._data[collection] = kept
+            self._synced[collection] = kept_synced
+            for record in doomed.values():
+                index.remove(collection, record)
+            self._forget_frozen(collection, doomed.values())
+            return len(row_ids)
+
+    def _persist_sequences(self, sequences: Dict[str, int]) -> None:
+        # insert() writes one row, so the counters need their own statement
+        text = _dumps(sequences)
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO documents (key, data) VALUES (?, ?)",
+                    (SEQUENCES_KEY, text)
+                )
+        except Exception:
+            self.invalidate()
+            raise
+        self._documents[SEQUENCES_KEY] = text
+
+    def invalidate(self) -> None:
+        with self._lock:
+            super().invalidate()
+            self._data_version = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _insert_class(class_key: str, class_grades: Dict) -> Tuple[str, List[Tuple]]:
+    return (
+        "INSERT OR REPLACE INTO grades VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (class_key, student_id, component, grade.get('value'),
+             int(bool(grade.get('is_draft', True))), grade.get('updated_at'))
+            for student_id, student_grades in class_grades.items()
+            for component, grade in student_grades.items()
+        ],
+    )
+
+
+class GradeDatabase:
+    """
+    grades table behind GradeDataManager.
+
+    load() returns {class_key: {student_id: {component: grade}}} like
+    grades_data.json and is cached until another connection commits.
+    GradeDataManager applies edits to that dict itself and hands the same
+    edit records to write().
+    """
+
+    def __init__(self, db_file: str):
+        self.db_file = db_file
+        self._lock = threading.RLock()
+        self._conn = connect(db_file)
+        self._grades: Optional[Dict] = None
+        self._data_version: Optional[int] = None
+
+    def load(self, refresh: bool = True) -> Dict:
+        """Cached grades; refresh=False skips the check for outside commits."""
+        grades = self._grades
+        if not refresh and grades is not None:
+            # No lock: a write in progress must not hold up readers of the cache
+            return grades
+        with self._lock:
+            version = _data_version(self._conn)
+            if self._grades is None or version != self._data_version:
+                grades: Dict[str, Dict] = {}
+                rows = self._conn.execute(
+                    "SELECT class_key, student_id, component, value, is_draft, updated_at FROM grades"
+                )
+                for class_key, student_id, component, value, is_draft, updated_at in rows:
+                    grades.setdefault(class_key, {}).setdefault(student_id, {})[component] = {
+                        'value': value,
+                        'is_draft': bool(is_draft),
+                        'updated_at': updated_at
+                    }
+                self._grades = grades
+                self._data_version = version
+            return self._grades
+
+    def write(self, records: List[Dict]) -> None:
+        """Persist GradeDataManager edit records in one transaction."""
+        self.execute(self.prepare(records))
+
+    @staticmethod
+    def prepare(records: List[Dict]) -> List[Tuple[str, List[Tuple]]]:
+        """
+        Turn edit records into (sql, parameter rows) statements.
+
+        The statements hold no references to the records, so they can be
+        executed after the records' dicts have changed again.
+        """
+        statements: List[Tuple[str, List[Tuple]]] = []
+        for record in records:
+            op = record.get('op')
+            if op == 'all':
+                statements.append(("DELETE FROM grades", [()]))
+                for class_key, class_grades in record['grades'].items():
+                    statements.append(_insert_class(class_key, class_grades))
+                continue
+
+            class_key = record['class']
+            if op == 'set':
+                statements.append((
+                    "INSERT OR REPLACE INTO grades VALUES (?, ?, ?, ?, ?, ?)",
+                    [(class_key, record['student'], record['component'], record['value'],
+                      int(bool(record['is_draft'])), record['updated_at'])],
+                ))
+            elif op == 'upload':
+                statements.append((
+                    "UPDATE grades SET is_draft = 0, updated_at = ? WHERE class_key = ? AND component = ?",
+                    [(record['updated_at'], class_key, record['component'])],
+                ))
+            elif op == 'class':
+                statements.append(("DELETE FROM grades WHERE class_key = ?", [(class_key,)]))
+                statements.append(_insert_class(class_key, record['grades']))
+        return statements
+
+    def execute(self, statements: List[Tuple[str, List[Tuple]]]) -> None:
+        """Run statements from prepare() in one transaction."""
+        with self._lock:
+            try:
+                with self._conn:
+                    for sql, rows in statements:
+                        self._conn.executemany(sql, rows)
+            except Exception:
+                self.invalidate()
+                raise
+
+    def replace_all(self, grades: Dict) -> None:
+        """Replace every stored grade (GradeDataManager.save_grades)."""
+        with self._lock:
+            self.write([{'op': 'all', 'grades': grades}])
+            self._grades = grades
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._grades = None
+            self._data_version = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
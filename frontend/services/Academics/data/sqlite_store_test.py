@@ -0,0 +1,117 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from frontend.services.Academics.data.classroom_store import get_classroom_store
+from frontend.services.Academics.data.grade_manager import GradeDataManager
+from frontend.services.Academics.data.migrate_to_sqlite import migrate
+from frontend.services.Academics.data.sqlite_store import SqliteClassroomStore
+from frontend.services.Academics.data.storage_config import STORAGE_ENV_VAR, sqlite_path
+from frontend.services.Academics.Classroom.post_service import PostService
+from frontend.services.Academics.Classroom.topic_service import TopicService
+
+DATA = {
+    "users": [{"id": 1, "name": "Faculty", "role": "faculty"}],
+    "classes": [{"id": 1, "code": "IT 95", "section_id": 1, "schedules": []}],
+    "sections": [{"id": 1, "program": "BS Information Technology", "year": "3rd", "section": "C"}],
+    "topics": [{"id": 1, "class_id": 1, "title": "Week 1", "type": "material"}],
+    "posts": [
+        {"id": 0, "class_id": 1, "topic_id": None, "type": "material", "title": "Syllabus"},
+        {"id": 1, "class_id": 1, "topic_id": 1, "type": "material", "title": "A"},
+    ],
+    "enrollments": [],
+    "syllabus": [{"id": 1, "class_id": 1, "title": "Syllabus"}],
+}
+
+
+class TestSqliteBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data_file = os.path.join(self.tmp_dir.name, "classroom_data.json")
+        self.grades_file = os.path.join(self.tmp_dir.name, "grades_data.json")
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump(DATA, f)
+        migrate(self.data_file, self.grades_file)
+
+        self._old_backend = os.environ.get(STORAGE_ENV_VAR)
+        os.environ[STORAGE_ENV_VAR] = "sqlite"
+
+    def tearDown(self):
+        if self._old_backend is None:
+            os.environ.pop(STORAGE_ENV_VAR, None)
+        else:
+            os.environ[STORAGE_ENV_VAR] = self._old_backend
+        self.tmp_dir.cleanup()
+
+    def _rows(self, sql):
+        conn = sqlite3.connect(sqlite_path(self.data_file))
+        try:
+            return conn.execute(sql).fetchall()
+        finally:
+            conn.close()
+
+    def test_migration_round_trip(self):
+        """Test the migrated database yields the original document"""
+        store = get_classroom_store(self.data_file)
+        self.assertIsInstance(store, SqliteClassroomStore)
+        self.assertEqual(store.load(), DATA)
+
+        with self.assertRaises(FileExistsError):
+            migrate(self.data_file, self.grades_file)
+
+    def test_services_run_on_sqlite(self):
+        """Test services write single rows through the shared store"""
+        topic = TopicService(self.data_file).create_topic(1, "Week 2", "material")
+        self.assertTrue(PostService(self.data_file).delete_post(0))
+
+        self.assertEqual(self._rows("SELECT id FROM posts"), [(1,)])
+        self.assertIn((topic["id"], "Week 2"), self._rows("SELECT id, title FROM topics"))
+
+        reopened = SqliteClassroomStore(sqlite_path(self.data_file))
+        self.assertEqual(reopened.get_index().find_topic(1, "Week 2")["id"], topic["id"])
+        reopened.close()
+
+    def test_save_rewrites_only_changed_rows(self):
+        """Test save() leaves unchanged rows alone"""
+        store = get_classroom_store(self.data_file)
+        before = self._rows("SELECT row_id, data FROM posts")
+
+        data = store.load()
+        data["posts"][1]["title"] = "Renamed"
+        store.save(data)
+
+        after = self._rows("SELECT row_id, data FROM posts")
+        self.assertEqual(after[0], before[0])
+        self.assertEqual(after[1][0], before[1][0])
+        self.assertEqual(json.loads(after[1][1])["title"], "Renamed")
+
+    def test_reload_after_outside_commit(self):
+        """Test the snapshot follows writes from another connection"""
+        store = get_classroom_store(self.data_file)
+        self.assertEqual(len(store.get_index().posts_for_class(1)), 2)
+
+        other = SqliteClassroomStore(sqlite_path(self.data_file))
+        other.insert("posts", {"id": 7, "class_id": 1, "topic_id": None, "type": "assessment"})
+        other.close()
+
+        self.assertEqual(len(store.get_index().posts_for_class(1)), 3)
+
+    def test_grades_on_sqlite(self):
+        """Test grade edits and batches land in the grades table"""
+        manager = GradeDataManager(self.grades_file)
+        with manager.batch():
+            manager.save_student_grade("101", 1, "quiz1_midterm", "30/40")
+            manager.save_student_grade("102", 1, "quiz1_midterm", "20/40")
+        manager.bulk_upload_grades(1, "quiz1_midterm")
+
+        reopened = GradeDataManager(self.grades_file)
+        class_grades = reopened.get_class_grades(1)
+        self.assertEqual(class_grades["102"]["quiz1_midterm"]["value"], "20/40")
+        self.assertFalse(class_grades["101"]["quiz1_midterm"]["is_draft"])
+
+
+if __name__ == '__main__':
+    unittest.main()
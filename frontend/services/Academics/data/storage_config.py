@@ -0,0 +1,36 @@
+# data/storage_config.py
+"""
+Storage backend selection for the Academics services.
+
+ACADEMICS_STORAGE=json (default) keeps the JSON files. ACADEMICS_STORAGE=sqlite
+stores the same data in an SQLite database next to each JSON file
+(classroom_data.json -> classroom_data.db). Run migrate_to_sqlite once before
+switching an existing installation. ACADEMICS_STORAGE=sharded keeps JSON but
+splits classroom_data.json into a catalog plus one file per class under
+classroom_data/ (see sharded_store); the split happens on first use.
+"""
+import os
+
+STORAGE_ENV_VAR = "ACADEMICS_STORAGE"
+BACKEND_JSON = "json"
+BACKEND_SQLITE = "sqlite"
+BACKEND_SHARDED = "sharded"
+
+
+def storage_backend() -> str:
+    """Return the configured backend name ("json", "sqlite" or "sharded")."""
+    backend = os.environ.get(STORAGE_ENV_VAR, BACKEND_JSON).strip().lower()
+    if backend not in (BACKEND_JSON, BACKEND_SQLITE, BACKEND_SHARDED):
+        raise ValueError(f"Unknown {STORAGE_ENV_VAR} backend: {backend!r}")
+    return backend
+
+
+def sqlite_path(data_file: str) -> str:
+    """Database file used in place of a JSON data file."""
+    root, ext = os.path.splitext(data_file)
+    return data_file if ext == ".db" else f"{root}.db"
+
+
+def sharded_root(data_file: str) -> str:
+    """Directory holding the sharded layout of a JSON data file."""
+    return os.path.splitext(data_file)[0]
@@ -0,0 +1,288 @@
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex, QSortFilterProxyModel, QVariant
+
+
+class _TopicNode:
+    """A topic row and its posts (newest first). title "" is the untitled group."""
+    __slots__ = ('title', 'posts')
+
+    def __init__(self, title, posts):
+        self.title = title
+        self.posts = list(posts)
+
+
+class ClassworksTreeModel(QAbstractItemModel):
+    """
+    Two-level tree of a class's classworks: topic rows, each with its posts
+    as children. The untitled group is always the first topic row.
+
+    set_groups() applies a reload as row insertions/removals (a new material
+    is one inserted row); add_post() and remove_post() touch a single row.
+    Filtering is done by ClassworksFilterProxyModel, not here.
+    """
+
+    # Custom roles
+    IsTopicRole = Qt.ItemDataRole.UserRole + 1
+    PostRole = Qt.ItemDataRole.UserRole + 2
+    PostTypeRole = Qt.ItemDataRole.UserRole + 3
+    TopicTitleRole = Qt.ItemDataRole.UserRole + 4
+    DateTextRole = Qt.ItemDataRole.UserRole + 5
+
+    def __init__(self, format_date=None, parent=None):
+        super().__init__(parent)
+        self._format_date = format_date or str
+        self._topics = [_TopicNode("", [])]
+        self._date_texts = {}  # id(post) -> (post, formatted date)
+
+    # ------------------------------------------------------------------
+    # Structure
+    # ------------------------------------------------------------------
+
+    def index(self, row, column, parent=QModelIndex()):
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row < len(self._topics):
+                return self.createIndex(row, 0)
+            return QModelIndex()
+        node = self._node(parent)
+        if node is not None and row < len(node.posts):
+            # Post rows point at their topic node
+            return self.createIndex(row, 0, node)
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer()
+        if node is None:
+            return QModelIndex()
+        return self.createIndex(self._topic_row(node), 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._topics)
+        node = self._node(parent)
+        return len(node.posts) if node is not None else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def _node(self, index):
+        """Topic node of a topic row, or None for post rows."""
+        if index.internalPointer() is not None:
+            return None
+        return self._topics[index.row()]
+
+    def _topic_row(self, node):
+        for row, topic in enumerate(self._topics):
+            if topic is node:
+                return row
+        return -1
+
+    def _topic_index(self, title):
+        for row, topic in enumerate(self._topics):
+            if topic.title == title:
+                return row
+        return -1
+
+    # ------------------------------------------------------------------
+    # Data
+    # ------------------------------------------------------------------
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+
+        node = index.internalPointer()
+        if node is None:
+            topic = self._topics[index.row()]
+            if role == Qt.ItemDataRole.DisplayRole or role == self.TopicTitleRole:
+                return topic.title
+            elif role == self.IsTopicRole:
+                return True
+            return QVariant()
+
+        post = node.posts[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return post.get("title", "")
+        elif role == self.IsTopicRole:
+            return False
+        elif role == self.PostRole:
+            return post
+        elif role == self.PostTypeRole:
+            return post.get("type")
+        elif role == self.TopicTitleRole:
+            return node.title
+        elif role == self.DateTextRole:
+            cached = self._date_texts.get(id(post))
+            if cached is None or cached[0] is not post:
+                cached = self._date_texts[id(post)] = (post, self._format_date(post.get("date", "")))
+            return cached[1]
+        return QVariant()
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled
+
+    def topic_titles(self):
+        """Titles of the topic rows, untitled group excluded."""
+        return [topic.title for topic in self._topics if topic.title]
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def set_groups(self, groups):
+        """
+        Show [(topic title, posts newest first)] as from
+        PostController.get_classworks_by_topic(), emitting only what changed.
+        """
+        groups = [(title or "", list(posts)) for title, posts in groups]
+        if not groups or groups[0][0] != "":
+            groups.insert(0, ("", []))
+        titles = [title for title, _ in groups]
+        title_set = set(titles)
+        kept = [t.title for t in self._topics if t.title in title_set]
+        kept_set = set(kept)
+        if len(title_set) != len(titles) or kept != [t for t in titles if t in kept_set]:
+            self.beginResetModel()
+            self._topics = [_TopicNode(title, posts) for title, posts in groups]
+            self._date_texts = {}
+            self.endResetModel()
+            return
+
+        # Removed topics, bottom-up
+        for row in range(len(self._topics) - 1, -1, -1):
+            if self._topics[row].title not in title_set:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._topics[row]
+                self.endRemoveRows()
+
+        for row, (title, posts) in enumerate(groups):
+            if row < len(self._topics) and self._topics[row].title == title:
+                self._sync_posts(row, posts)
+            else:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._topics.insert(row, _TopicNode(title, posts))
+                self.endInsertRows()
+
+    def _topic_changed(self, topic_row):
+        # Lets the filter proxy re-check a topic whose posts changed
+        index = self.index(topic_row, 0)
+        self.dataChanged.emit(index, index)
+
+    def _sync_posts(self, topic_row, posts):
+        node = self._topics[topic_row]
+        parent = self.index(topic_row, 0)
+        new_ids = [p.get("id") for p in posts]
+        id_set = set(new_ids)
+        kept = [p.get("id") for p in node.posts if p.get("id") in id_set]
+        kept_set = set(kept)
+        if len(id_set) != len(new_ids) or kept != [i for i in new_ids if i in kept_set]:
+            # Reordered within the topic: replace its children
+            if node.posts:
+                self.beginRemoveRows(parent, 0, len(node.posts) - 1)
+                node.posts = []
+                self.endRemoveRows()
+            if posts:
+                self.beginInsertRows(parent, 0, len(posts) - 1)
+                node.posts = list(posts)
+                self.endInsertRows()
+            self._topic_changed(topic_row)
+            return
+
+        changed = False
+        for row in range(len(node.posts) - 1, -1, -1):
+            if node.posts[row].get("id") not in id_set:
+                self.beginRemoveRows(parent, row, row)
+                del node.posts[row]
+                self.endRemoveRows()
+                changed = True
+
+        for row, post in enumerate(posts):
+            if row < len(node.posts) and node.posts[row].get("id") == post.get("id"):
+                if node.posts[row] != post:
+                    node.posts[row] = post
+                    index = self.index(row, 0, parent)
+                    self.dataChanged.emit(index, index)
+            else:
+                self.beginInsertRows(parent, row, row)
+                node.posts.insert(row, post)
+                self.endInsertRows()
+                changed = True
+        if changed:
+            self._topic_changed(topic_row)
+
+    def add_topic(self, title):
+        """Add an empty topic row in title order; its row number."""
+        row = self._topic_index(title)
+        if row != -1:
+            return row
+        row = 1 + sum(1 for t in self._topics[1:] if t.title < title)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._topics.insert(row, _TopicNode(title, []))
+        self.endInsertRows()
+        return row
+
+    def add_post(self, post, topic_title=""):
+        """Insert one post under its topic (created if needed), keeping newest first."""
+        topic_row = self.add_topic(topic_title) if topic_title else 0
+        node = self._topics[topic_row]
+        date = post.get("date", "")
+        row = sum(1 for p in node.posts if p.get("date", "") >= date)
+        self.beginInsertRows(self.index(topic_row, 0), row, row)
+        node.posts.insert(row, post)
+        self.endInsertRows()
+        self._topic_changed(topic_row)
+
+    def remove_post(self, post_id):
+        """Remove a post by id; False if it is not in the model."""
+        for topic_row, node in enumerate(self._topics):
+            for row, post in enumerate(node.posts):
+                if post.get("id") == post_id:
+                    self.beginRemoveRows(self.index(topic_row, 0), row, row)
+                    del node.posts[row]
+                    self._date_texts.pop(id(post), None)
+                    self.endRemoveRows()
+                    self._topic_changed(topic_row)
+                    return True
+        return False
+
+    def clear(self):
+        self.beginResetModel()
+        self._topics = [_TopicNode("", [])]
+        self._date_texts = {}
+        self.endResetModel()
+
+
+class ClassworksFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters a ClassworksTreeModel by post type and/or topic title. Topic rows
+    are shown only when they pass the topic filter and have a visible post;
+    the untitled group is hidden by any topic filter.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._post_type = None
+        self._topic_title = None
+
+    def set_filter(self, post_type=None, topic_title=None):
+        if (post_type, topic_title) != (self._post_type, self._topic_title):
+            self._post_type = post_type
+            self._topic_title = topic_title
+            self.invalidateFilter()
+
+    def _type_matches(self, index):
+        return self._post_type is None or index.data(ClassworksTreeModel.PostTypeRole) == self._post_type
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        index = model.index(source_row, 0, source_parent)
+        if source_parent.isValid():
+            return self._type_matches(index)
+
+        if self._topic_title is not None and index.data(ClassworksTreeModel.TopicTitleRole) != self._topic_title:
+            return False
+        return any(self._type_matches(model.index(row, 0, index)) for row in range(model.rowCount(index)))
@@ -0,0 +1,188 @@
+"""
+Column-oriented grade storage
+
+Student IDs and component keys are interned to row and column numbers. Each
+component column keeps its cells in flat arrays indexed by row: the parsed
+percentage, score and max score as floats, the parse flags as bytes, the
+entered text as an index into a shared pool of distinct texts, and whether
+the cell exists and is a draft as bits. Memory grows with the number of
+cells, not with one Python object per grade.
+"""
+from array import array
+
+from .grade_item import GradeItem, parse_grade
+
+
+def _bit(bits, i):
+    return bits[i >> 3] >> (i & 7) & 1
+
+
+def _set_bit(bits, i, on):
+    if on:
+        bits[i >> 3] |= 1 << (i & 7)
+    else:
+        bits[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+
+
+class GradeColumn:
+    """Cells of one component, one slot per student row."""
+    __slots__ = ('exists', 'drafts', 'texts', 'flags', 'percentage', 'score', 'max_score')
+
+    def __init__(self, rows=0):
+        self.exists = bytearray((rows + 7) // 8)
+        self.drafts = bytearray((rows + 7) // 8)
+        self.texts = array('i', bytes(4 * rows))
+        self.flags = array('b', bytes(rows))
+        self.percentage = array('d', bytes(8 * rows))
+        self.score = array('d', bytes(8 * rows))
+        self.max_score = array('d', bytes(8 * rows))
+
+    def add_row(self):
+        row = len(self.flags)
+        if row % 8 == 0:
+            self.exists.append(0)
+            self.drafts.append(0)
+        self.texts.append(0)
+        self.flags.append(0)
+        self.percentage.append(0.0)
+        self.score.append(0.0)
+        self.max_score.append(0.0)
+
+    def has(self, row):
+        return _bit(self.exists, row) == 1
+
+
+class GradeColumnStore:
+    """Grades of one class: {student_id: {component_key: cell}} stored by column."""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._rows = {}           # student_id -> row
+        self._student_ids = []    # row -> student_id
+        self._columns = {}        # component_key -> GradeColumn
+        self._texts = [""]        # text id -> text; 0 is the empty value
+        self._text_ids = {"": 0}
+
+    # ------------------------------------------------------------------
+    # Rows and columns
+    # ------------------------------------------------------------------
+
+    def add_student(self, student_id):
+        """Row of a student, adding an empty one if needed."""
+        row = self._rows.get(student_id)
+        if row is None:
+            row = self._rows[student_id] = len(self._student_ids)
+            self._student_ids.append(student_id)
+            for column in self._columns.values():
+                column.add_row()
+        return row
+
+    def has_student(self, student_id):
+        return student_id in self._rows
+
+    def student_ids(self):
+        return list(self._student_ids)
+
+    def row(self, student_id):
+        """Row number of a student, or None."""
+        return self._rows.get(student_id)
+
+    def column(self, component_key):
+        """GradeColumn of a component, or None if no grade was ever entered for it."""
+        return self._columns.get(component_key)
+
+    def _column_for(self, component_key):
+        column = self._columns.get(component_key)
+        if column is None:
+            column = self._columns[component_key] = GradeColumn(len(self._student_ids))
+        return column
+
+    def _text_id(self, text):
+        text_id = self._text_ids.get(text)
+        if text_id is None:
+            text_id = self._text_ids[text] = len(self._texts)
+            self._texts.append(text)
+        return text_id
+
+    # ------------------------------------------------------------------
+    # Cells
+    # ------------------------------------------------------------------
+
+    def has(self, student_id, component_key):
+        row = self._rows.get(student_id)
+        column = self._columns.get(component_key)
+        return row is not None and column is not None and column.has(row)
+
+    def get(self, student_id, component_key):
+        """(value, is_draft) of a cell, or None if it does not exist."""
+        row = self._rows.get(student_id)
+        column = self._columns.get(component_key)
+        if row is None or column is None or not column.has(row):
+            return None
+        return self._texts[column.texts[row]], _bit(column.drafts, row) == 1
+
+    def get_item(self, student_id, component_key):
+        """A GradeItem copy of a cell (empty if the cell does not exist)."""
+        item = GradeItem()
+        row = self._rows.get(student_id)
+        column = self._columns.get(component_key)
+        if row is not None and column is not None and column.has(row):
+            item.set_parsed(
+                self._texts[column.texts[row]], _bit(column.drafts, row) == 1,
+                column.flags[row], column.percentage[row], column.score[row], column.max_score[row]
+            )
+        return item
+
+    def set(self, student_id, component_key, value, is_draft=True):
+        row = self.add_student(student_id)
+        column = self._column_for(component_key)
+        value = value if value is not None else ""
+        column.texts[row] = self._text_id(value)
+        (column.flags[row], column.percentage[row],
+         column.score[row], column.max_score[row]) = parse_grade(value)
+        _set_bit(column.exists, row, True)
+        _set_bit(column.drafts, row, is_draft)
+
+    def set_draft(self, student_id, component_key, is_draft):
+        """Change only the draft status of an existing cell; False if there is none."""
+        row = self._rows.get(student_id)
+        column = self._columns.get(component_key)
+        if row is None or column is None or not column.has(row):
+            return False
+        _set_bit(column.drafts, row, is_draft)
+        return True
+
+    def discard(self, student_id, component_key):
+        """Remove a cell (the student row stays)."""
+        row = self._rows.get(student_id)
+        column = self._columns.get(component_key)
+        if row is None or column is None:
+            return
+        column.texts[row] = 0
+        column.flags[row] = 0
+        column.percentage[row] = column.score[row] = column.max_score[row] = 0.0
+        _set_bit(column.exists, row, False)
+        _set_bit(column.drafts, row, False)
+
+    def clear_student(self, student_id):
+        """Remove every cell of a student, keeping (or adding) the row."""
+        self.add_student(student_id)
+        for key, _, _ in self.student_cells(student_id):
+            self.discard(student_id, key)
+
+    def student_cells(self, student_id):
+        """(component_key, value, is_draft) of every existing cell of a student."""
+        row = self._rows.get(student_id)
+        if row is None:
+            return []
+        return [(key, self._texts[column.texts[row]], _bit(column.drafts, row) == 1)
+                for key, column in self._columns.items() if column.has(row)]
+
+    def students_with(self, component_key):
+        """IDs of students that have a cell in a component."""
+        column = self._columns.get(component_key)
+        if column is None:
+            return []
+        return [student_id for student_id, row in self._rows.items() if column.has(row)]
@@ -1,5 +1,7 @@
+from contextlib import contextmanager, nullcontext
 from PyQt6.QtCore import QObject, pyqtSignal
-from .grade_item import GradeItem
+from .grade_column_store import GradeColumnStore
+from .rubric_plan import compile_rubric_plan
 import sys
 import os
 import json
@@ -24,6 +26,7 @@ class GradeDataModel(QObject):
     data_reset = pyqtSignal()
     data_updated = pyqtSignal()
     columns_changed = pyqtSignal()
+    grade_changed = pyqtSignal(str, str)  # student_id, component_key; sent even inside batch()
 
     def __init__(self, class_id=1):
         super().__init__()
@@ -80,6 +83,8 @@ class GradeDataModel(QObject):
             'exam': 'exams'
         }
         
+        self.rubric_plan = self._compile_rubric_plan()
+        
         # Column expansion states
         self.column_states = {
             'midterm_expanded': False,
@@ -87,8 +92,17 @@ class GradeDataModel(QObject):
         }
         self._initialize_component_states()
         
-        # Grade storage: {student_id: {component_key: GradeItem}}
-        self.grades = {}
+        # Grade storage: {student_id: {component_key: cell}}, stored by column
+        self.grades = GradeColumnStore()
+        
+        # batch() state: nesting depth, pending signal, cells to restore on failure
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._batch_undo = {}
+
+    def _compile_rubric_plan(self):
+        """Resolve the rubric into the RubricPlan grade calculations run against"""
+        return compile_rubric_plan(self.rubric_config, self.components, self.get_component_type_key)
 
     def _initialize_component_states(self):
         """Initialize column states for all component types"""
@@ -138,8 +152,7 @@ class GradeDataModel(QObject):
         
         # Initialize grades storage for each student
         for student in self.students:
-            if student['id'] not in self.grades:
-                self.grades[student['id']] = {}
+            self.grades.add_student(student['id'])
         
         # Load grades from persistent storage
         self._load_grades_from_storage()
@@ -171,8 +184,7 @@ class GradeDataModel(QObject):
             
             # Initialize grades storage
             for student in self.students:
-                if student['id'] not in self.grades:
-                    self.grades[student['id']] = {}
+                self.grades.add_student(student['id'])
             
             # Load grades from persistent storage
             self._load_grades_from_storage()
@@ -197,14 +209,11 @@ class GradeDataModel(QObject):
         class_grades = self.grade_manager.get_class_grades(self.class_id)
         
         for student_id, student_grades in class_grades.items():
-            if student_id not in self.grades:
-                self.grades[student_id] = {}
+            self.grades.add_student(student_id)
             
             for component_key, grade_data in student_grades.items():
-                grade_item = GradeItem()
-                grade_item.value = grade_data.get('value', '')
-                grade_item.is_draft = grade_data.get('is_draft', True)
-                self.grades[student_id][component_key] = grade_item
+                self.grades.set(student_id, component_key,
+                                grade_data.get('value', ''), grade_data.get('is_draft', True))
 
     def load_sample_data(self):
         """Load sample student data (fallback)"""
@@ -225,7 +234,7 @@ class GradeDataModel(QObject):
             ]
         
         for student in self.students:
-            self.grades[student['id']] = {}
+            self.grades.clear_student(student['id'])
         
         # Load grades from storage
         self._load_grades_from_storage()
@@ -257,16 +266,63 @@ class GradeDataModel(QObject):
             self.column_states[key] = value
             self.columns_changed.emit()
 
+    @contextmanager
+    def batch(self):
+        """
+        Apply many grade edits as one transaction.
+        Storage is written once and data_updated is emitted once at the end;
+        if the block raises, the touched grades are restored and nothing is saved.
+        """
+        manager_batch = self.grade_manager.batch() if self.grade_manager else nullcontext()
+        
+        self._batch_depth += 1
+        try:
+            with manager_batch:
+                yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._rollback_batch()
+            raise
+        
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._batch_undo = {}
+            if self._batch_dirty:
+                self._batch_dirty = False
+                self.data_updated.emit()
+
+    def _remember_cell(self, student_id, component_key):
+        """Record a cell's state before its first change inside a batch"""
+        if self._batch_depth == 0:
+            return
+        key = (student_id, component_key)
+        if key not in self._batch_undo:
+            self._batch_undo[key] = self.grades.get(student_id, component_key)
+
+    def _rollback_batch(self):
+        for (student_id, component_key), state in self._batch_undo.items():
+            if state is None:
+                self.grades.discard(student_id, component_key)
+            else:
+                self.grades.set(student_id, component_key, *state)
+            self.grade_changed.emit(student_id, component_key)
+        self._batch_undo = {}
+        self._batch_dirty = False
+
+    def _notify_updated(self):
+        """Emit data_updated now, or once when the enclosing batch ends"""
+        if self._batch_depth:
+            self._batch_dirty = True
+        else:
+            self.data_updated.emit()
+
     def set_grade(self, student_id, component_key, value, is_draft=True):
         """Set grade for a student's component"""
-        if student_id not in self.grades:
-            self.grades[student_id] = {}
+        self._remember_cell(student_id, component_key)
         
-        if component_key not in self.grades[student_id]:
-            self.grades[student_id][component_key] = GradeItem()
-        
-        self.grades[student_id][component_key].value = value
-        self.grades[student_id][component_key].is_draft = is_draft
+        self.grades.set(student_id, component_key, value, is_draft)
+        self.grade_changed.emit(student_id, component_key)
         
         # Save to persistent storage
         if self.grade_manager:
@@ -274,30 +330,38 @@ class GradeDataModel(QObject):
                 student_id, self.class_id, component_key, value, is_draft
             )
         
-        self.data_updated.emit()
+        self._notify_updated()
 
     def get_grade(self, student_id, component_key):
-        """Get grade item for a student's component"""
-        if student_id in self.grades and component_key in self.grades[student_id]:
-            return self.grades[student_id][component_key]
-        return GradeItem()
+        """Get a copy of a student's component grade (edit it through set_grade)"""
+        return self.grades.get_item(student_id, component_key)
 
     def bulk_set_grades(self, component_key, value):
         """Set grade value for all students in a component"""
-        for student_id in self.grades.keys():
-            self.set_grade(student_id, component_key, value, is_draft=True)
+        with self.batch():
+            for student_id in self.grades.student_ids():
+                self.set_grade(student_id, component_key, value, is_draft=True)
 
     def upload_grades(self, component_key):
         """Mark grades as uploaded (not draft) for a component"""
-        for student_id in self.grades.keys():
-            if component_key in self.grades[student_id]:
-                self.grades[student_id][component_key].is_draft = False
-        
-        # Bulk upload in storage
-        if self.grade_manager:
-            self.grade_manager.bulk_upload_grades(self.class_id, component_key)
-        
-        self.data_updated.emit()
+        with self.batch():
+            for student_id in self.grades.students_with(component_key):
+                self._remember_cell(student_id, component_key)
+                self.grades.set_draft(student_id, component_key, False)
+            
+            # Bulk upload in storage
+            if self.grade_manager:
+                self.grade_manager.bulk_upload_grades(self.class_id, component_key)
+            
+            self._notify_updated()
+
+    def keep_as_draft(self, component_key):
+        """Mark every entered grade of a component as draft again"""
+        with self.batch():
+            for student_id in self.grades.students_with(component_key):
+                value, _ = self.grades.get(student_id, component_key)
+                if value:
+                    self.set_grade(student_id, component_key, value, is_draft=True)
 
     def get_component_type_key(self, component_name, term=None):
         """Get the component type key for a component name"""
@@ -368,6 +432,7 @@ class GradeDataModel(QObject):
             else:
                 self.component_type_mapping[comp_name] = 'performance_tasks'
         
+        self.rubric_plan = self._compile_rubric_plan()
         self._initialize_component_states()
         self.columns_changed.emit()
 
@@ -389,10 +454,9 @@ class GradeDataModel(QObject):
         """Get only uploaded grades for a student (for student view)"""
         uploaded_grades = {}
         
-        if student_id in self.grades:
-            for component_key, grade_item in self.grades[student_id].items():
-                if not grade_item.is_draft:
-                    uploaded_grades[component_key] = grade_item
+        for component_key, _, is_draft in self.grades.student_cells(student_id):
+            if not is_draft:
+                uploaded_grades[component_key] = self.grades.get_item(student_id, component_key)
         
         return uploaded_grades
 
@@ -421,7 +485,7 @@ class GradeDataModel(QObject):
         # TODO: Implement API call to Django backend
         # Example structure:
         # headers = {'Authorization': f'Bearer {token}'}
-        # payload = {'grades': self.grades}
+        # payload = {'grades': {sid: dict of (value, is_draft) per component}}
         # response = requests.post(f'{api_url}/api/grades/class/{self.class_id}/sync/', 
         #                         json=payload, headers=headers)
         pass
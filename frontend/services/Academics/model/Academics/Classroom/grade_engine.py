@@ -0,0 +1,131 @@
+"""
+Whole-class grade computation.
+
+GradeEngine reads the class's students x components score matrix straight
+from the model's column store (see GradeColumnStore) and computes the term
+grades, final grade and component averages of every requested student in one
+pass over the matrix columns, as laid out by the model's compiled RubricPlan.
+Results are cached per student: editing a grade only drops that student's
+row, which is recomputed on its own when next read.
+"""
+from array import array
+
+from .grade_item import PARSED, PRESENT
+
+
+class GradeEngine:
+    """Cached term and final grades for every student of a GradeDataModel."""
+
+    def __init__(self, model):
+        self.model = model
+        self._plan = None
+        # student_id -> {'midterm_avg', 'finalterm_avg', 'final_grade', 'components'}
+        self._results = {}
+
+    def invalidate(self):
+        """Forget every result (students or their grades reloaded)."""
+        self._plan = None
+        self._results = {}
+
+    def invalidate_student(self, student_id):
+        """Forget one student's results after one of their grades changed."""
+        self._results.pop(student_id, None)
+
+    def student_grades(self, student_id):
+        """{'midterm_avg', 'finalterm_avg', 'final_grade'} as 2-decimal strings."""
+        result = self._result(student_id)
+        return {key: result[key] for key in ('midterm_avg', 'finalterm_avg', 'final_grade')}
+
+    def component_average(self, student_id, component_name, term):
+        """Summed 'score/max' of a component's items in a term, or ''."""
+        averages = self._result(student_id)['components']
+        group = self._plan.group_for(component_name, term)
+        if group is None:
+            # Not a rubric component: resolve its type the slow way
+            group = (self.model.get_component_type_key(component_name, term), term)
+        return averages.get(group, "")
+
+    # ------------------------------------------------------------------
+    # Computation
+    # ------------------------------------------------------------------
+
+    def _result(self, student_id):
+        if self._plan is not self.model.rubric_plan:
+            # Rubric recompiled since the cached results were computed
+            self._plan = self.model.rubric_plan
+            self._results = {}
+        result = self._results.get(student_id)
+        if result is None:
+            # Fill every missing row in the same pass (the whole class after a reset)
+            missing = [s['id'] for s in self.model.students if s['id'] not in self._results]
+            if student_id not in missing:
+                missing.append(student_id)
+            self._compute(missing)
+            result = self._results[student_id]
+        return result
+
+    def _compute(self, student_ids):
+        plan = self._plan
+        rows = len(student_ids)
+        grades = self.model.grades
+        # The grade store is already columnar: read its arrays in place
+        columns = [grades.column(key) for key in plan.columns]
+        # (result row, store row) of the students that have grades
+        cells = []
+        for row, student_id in enumerate(student_ids):
+            cell = grades.row(student_id)
+            if cell is not None:
+                cells.append((row, cell))
+
+        # Term averages: mean percentage per component, weighted, for all rows
+        term_totals = []
+        for term in plan.terms:
+            totals = array('d', [0.0]) * rows
+            for component in term.components:
+                sums = array('d', [0.0]) * rows
+                counts = array('l', [0]) * rows
+                for column in component.group:
+                    cells_of = columns[column]
+                    if cells_of is None:
+                        continue
+                    flags, percentages = cells_of.flags, cells_of.percentage
+                    for row, cell in cells:
+                        if flags[cell] & PRESENT:
+                            sums[row] += percentages[cell]
+                            counts[row] += 1
+                for row in range(rows):
+                    if counts[row]:
+                        totals[row] += (sums[row] / counts[row]) * component.weight
+            term_totals.append((term.weight, totals))
+
+        # Component averages: summed score over summed max per group
+        averages = {}
+        for group_key, group in plan.groups.items():
+            total_scores = array('d', [0.0]) * rows
+            total_maxes = array('d', [0.0]) * rows
+            counts = array('l', [0]) * rows
+            for column in group:
+                cells_of = columns[column]
+                if cells_of is None:
+                    continue
+                flags, scores, max_scores = cells_of.flags, cells_of.score, cells_of.max_score
+                for row, cell in cells:
+                    if flags[cell] & PARSED:
+                        total_scores[row] += scores[cell]
+                        total_maxes[row] += max_scores[cell]
+                        counts[row] += 1
+            averages[group_key] = [
+                f"{total_scores[row]:.1f}/{total_maxes[row]:.1f}"
+                if counts[row] > 0 and total_maxes[row] > 0 else ""
+                for row in range(rows)
+            ]
+
+        (midterm_pct, midterm), (final_pct, finalterm) = term_totals
+        for row, student_id in enumerate(student_ids):
+            final_grade = (midterm[row] * midterm_pct) + (finalterm[row] * final_pct)
+            self._results[student_id] = {
+                'midterm_avg': f"{midterm[row]:.2f}",
+                'finalterm_avg': f"{finalterm[row]:.2f}",
+                'final_grade': f"{final_grade:.2f}",
+                'components': {key: texts[row] for key, texts in averages.items()},
+            }
@@ -0,0 +1,135 @@
+import unittest
+from types import SimpleNamespace
+
+from frontend.services.Academics.model.Academics.Classroom.grade_column_store import GradeColumnStore
+from frontend.services.Academics.model.Academics.Classroom.grade_engine import GradeEngine
+from frontend.services.Academics.model.Academics.Classroom.grade_item import GradeItem, parse_grade
+from frontend.services.Academics.model.Academics.Classroom.rubric_plan import compile_rubric_plan
+
+
+def _item(value):
+    item = GradeItem()
+    item.value = value
+    return item
+
+
+def _type_key(component_name, term=None):
+    if 'exam' in component_name:
+        return 'exams_midterm' if term == 'midterm' else 'exams_final'
+    return 'quizzes'
+
+
+class TestGradeEngine(unittest.TestCase):
+
+    def setUp(self):
+        rubric = {'term_percentage': 0, 'components': {'quiz': 50, 'exam': 50}}
+        grades = GradeColumnStore()
+        for key, value in (('quiz1_midterm', '30/40'), ('quiz2_midterm', 'n/a'),
+                           ('midtermexam_midterm', '80/100'), ('quiz1_finalterm', '40/40'),
+                           ('finalexam_finalterm', '')):
+            grades.set('A', key, value)
+        grades.add_student('B')
+        self.model = SimpleNamespace(
+            students=[{'id': 'A'}, {'id': 'B'}],
+            grades=grades,
+            components={'quizzes': ['Quiz 1', 'Quiz 2'], 'exams_midterm': ['Midterm Exam'],
+                        'exams_final': ['Final Exam']},
+            rubric_config={'midterm': dict(rubric, term_percentage=40),
+                           'final': dict(rubric, term_percentage=60)},
+            get_component_type_key=_type_key,
+        )
+        self._compile()
+        self.engine = GradeEngine(self.model)
+
+    def _compile(self):
+        self.model.rubric_plan = compile_rubric_plan(
+            self.model.rubric_config, self.model.components, _type_key)
+
+    def test_parse_grade(self):
+        """Test readable, unreadable and empty grades"""
+        self.assertEqual(parse_grade('30/40'), (3, 75.0, 30.0, 40.0))
+        self.assertEqual(parse_grade('30/0'), (3, 0.0, 30.0, 0.0))
+        self.assertEqual(parse_grade('abc'), (1, 0.0, 0.0, 0.0))
+        self.assertEqual(parse_grade(''), (0, 0.0, 0.0, 0.0))
+
+    def test_grade_item_parses_on_assignment(self):
+        """Test GradeItem keeps the parsed numbers in step with its value"""
+        item = _item('38/40')
+        self.assertEqual((item.score, item.max_score, item.percentage, item.is_valid), (38.0, 40.0, 95.0, True))
+        item.value = '38/x'
+        self.assertEqual((item.get_numeric_score(), item.is_valid), (0.0, False))
+        with self.assertRaises(AttributeError):
+            item.note = 'late'
+
+    def test_whole_class_grades(self):
+        """Test term, final and component averages for every student"""
+        self.assertEqual(self.engine.student_grades('A'),
+                         {'midterm_avg': '58.75', 'finalterm_avg': '50.00', 'final_grade': '53.50'})
+        self.assertEqual(self.engine.component_average('A', 'quiz', 'midterm'), '30.0/40.0')
+        self.assertEqual(self.engine.component_average('A', 'exam', 'finalterm'), '')
+        self.assertEqual(self.engine.student_grades('B')['final_grade'], '0.00')
+
+    def test_edit_recomputes_only_that_row(self):
+        """Test invalidate_student leaves the other cached rows alone; a new plan drops all"""
+        self.engine.student_grades('A')
+        cached = self.engine._results['A']
+
+        self.model.grades.set('B', 'finalexam_finalterm', '90/100')
+        self.engine.invalidate_student('B')
+        self.assertEqual(self.engine.student_grades('B')['finalterm_avg'], '45.00')
+        self.assertIs(self.engine._results['A'], cached)
+
+        self.model.rubric_config['final']['term_percentage'] = 100
+        self._compile()
+        self.assertEqual(self.engine.student_grades('B')['final_grade'], '45.00')
+
+
+class TestGradeColumnStore(unittest.TestCase):
+
+    def test_facade_over_columns(self):
+        """Test cells, draft bits and per-student views of the column store"""
+        store = GradeColumnStore()
+        store.set('A', 'pt1_midterm', '38/40')
+        store.set('B', 'pt1_midterm', '38/40', is_draft=False)
+        for student in 'CDEFGHIJ':
+            store.add_student(student)
+        store.set('J', 'quiz1_midterm', '')
+
+        self.assertEqual(store.get('B', 'pt1_midterm'), ('38/40', False))
+        self.assertIsNone(store.get('C', 'pt1_midterm'))
+        self.assertEqual(store.get_item('A', 'pt1_midterm').percentage, 95.0)
+        self.assertEqual(store.get_item('C', 'pt1_midterm').value, '')
+        self.assertEqual(store.students_with('quiz1_midterm'), ['J'])
+
+        self.assertTrue(store.set_draft('A', 'pt1_midterm', False))
+        self.assertFalse(store.set_draft('C', 'pt1_midterm', False))
+        self.assertEqual(store.student_cells('A'), [('pt1_midterm', '38/40', False)])
+
+        store.discard('A', 'pt1_midterm')
+        self.assertEqual(store.students_with('pt1_midterm'), ['B'])
+        self.assertEqual(len(store.column('pt1_midterm').flags), 10)
+
+
+class TestRubricPlan(unittest.TestCase):
+
+    def test_plan_is_resolved_and_immutable(self):
+        """Test keys, groups and weights are precomputed and cannot be changed"""
+        plan = compile_rubric_plan(
+            {'midterm': {'term_percentage': 40, 'components': {'quiz': 100}},
+             'final': {'term_percentage': 60, 'components': {'exam': 100}}},
+            {'quizzes': ['Quiz 1'], 'exams_final': ['Final Exam']},
+            _type_key,
+        )
+        self.assertEqual(plan.columns, ('quiz1_midterm', 'finalexam_midterm',
+                                        'quiz1_finalterm', 'finalexam_finalterm'))
+        self.assertEqual([t.weight for t in plan.terms], [0.4, 0.6])
+        self.assertEqual(plan.terms[1].components[0].group, (3,))
+        self.assertEqual(plan.group_for('Quiz', 'midterm'), ('quizzes', 'midterm'))
+        with self.assertRaises(AttributeError):
+            plan.terms[0].weight = 1
+        with self.assertRaises(TypeError):
+            plan.groups[('quizzes', 'midterm')] = (0,)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,23 +2,61 @@
 Grade Item data structure
 """
 
+# parse_grade() flags
+PRESENT = 1   # a value was entered; counts towards the percentage average
+PARSED = 2    # the value reads "score/max"; counts towards the score sum
+
+
+def parse_grade(value):
+    """
+    Parse a grade like '35/40'.
+
+    Returns:
+        (flags, percentage, score, max_score); percentage is 0.0 when the
+        value is unreadable or max_score is not positive
+    """
+    if not value:
+        return 0, 0.0, 0.0, 0.0
+    if '/' not in value:
+        return PRESENT, 0.0, 0.0, 0.0
+    parts = value.split('/')
+    try:
+        score = float(parts[0])
+        max_score = float(parts[1])
+    except (ValueError, IndexError):
+        return PRESENT, 0.0, 0.0, 0.0
+    percentage = (score / max_score) * 100 if max_score > 0 else 0.0
+    return PRESENT | PARSED, percentage, score, max_score
+
+
 class GradeItem:
+    """One grade cell. The value is parsed once, when it is assigned."""
+    __slots__ = ('_value', 'is_draft', 'flags', 'percentage', 'score', 'max_score')
+
     def __init__(self):
         self.value = ""
         self.is_draft = True
-    
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self.flags, self.percentage, self.score, self.max_score = parse_grade(value)
+
+    def set_parsed(self, value, is_draft, flags, percentage, score, max_score):
+        """Fill the item from a value that has already been parsed"""
+        self._value = value
+        self.is_draft = is_draft
+        self.flags, self.percentage, self.score, self.max_score = flags, percentage, score, max_score
+
+    @property
+    def is_valid(self):
+        """True if the value reads 'score/max' (False for empty or malformed input)"""
+        return bool(self.flags & PARSED)
+
     def get_numeric_score(self):
         """Get numeric score percentage from value like '35/40'"""
-        if not self.value or '/' not in self.value:
-            return 0.0
-        
-        try:
-            parts = self.value.split('/')
-            score = float(parts[0])
-            max_score = float(parts[1])
-            if max_score > 0:
-                return (score / max_score) * 100
-        except (ValueError, IndexError, ZeroDivisionError):
-            pass
-        
-        return 0.0
\ No newline at end of file
+        return self.percentage
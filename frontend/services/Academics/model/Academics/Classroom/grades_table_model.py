@@ -187,6 +187,19 @@ class GradesTableModel(QAbstractTableModel):
                 index = self.index(row, col)
                 self.dataChanged.emit(index, index)
     
+    def _emit_column_changes(self, col):
+        """Emit one dataChanged for a grade column and one for the calculated columns"""
+        last_row = self.rowCount() - 1
+        if last_row < 0:
+            return
+        self.dataChanged.emit(self.index(0, col), self.index(last_row, col))
+        
+        calculated = [c for c, info in enumerate(self.columns)
+                      if info.get('type') in ['calculated', 'expandable_main', 'expandable_component']]
+        if calculated:
+            self.dataChanged.emit(self.index(0, min(calculated)),
+                                  self.index(last_row, max(calculated)))
+    
     def bulk_set_grades(self, col, value):
         """Set grade value for all students in a column"""
         col_info = self.columns[col]
@@ -195,24 +208,30 @@ class GradesTableModel(QAbstractTableModel):
         
         component_key = col_info.get('component_key', '')
         self.data_model.bulk_set_grades(component_key, value)
+        self._emit_column_changes(col)
+    
+    def upload_column_grades(self, col):
+        """Mark all grades in column as uploaded"""
+        col_info = self.columns[col]
+        if col_info.get('type') != 'grade_input':
+            return
+        
+        component_key = col_info.get('component_key', '')
+        self.data_model.upload_grades(component_key)
         
         # Emit changes for entire column
         top_left = self.index(0, col)
         bottom_right = self.index(self.rowCount() - 1, col)
         self.dataChanged.emit(top_left, bottom_right)
-        
-        # Update calculated columns
-        for row in range(self.rowCount()):
-            self._emit_calculated_changes(row)
     
-    def upload_column_grades(self, col):
-        """Mark all grades in column as uploaded"""
+    def draft_column_grades(self, col):
+        """Mark all entered grades in column as draft again"""
         col_info = self.columns[col]
         if col_info.get('type') != 'grade_input':
             return
         
         component_key = col_info.get('component_key', '')
-        self.data_model.upload_grades(component_key)
+        self.data_model.keep_as_draft(component_key)
         
         # Emit changes for entire column
         top_left = self.index(0, col)
@@ -0,0 +1,99 @@
+"""
+Compiled rubric plan
+
+GradeDataModel compiles its rubric_config and components into a RubricPlan
+whenever the rubric changes. The plan holds everything grade calculations
+need already resolved (grade column keys, component groups, weights as
+fractions), so computing grades does no string or dict work.
+"""
+from types import MappingProxyType
+
+TERMS = (('midterm', 'midterm'), ('finalterm', 'final'))
+
+
+def component_key(item_name, term):
+    """Grade column key of a component item, e.g. ('Quiz 1', 'midterm') -> 'quiz1_midterm'"""
+    return f"{item_name.lower().replace(' ', '')}_{term}"
+
+
+class _Frozen:
+    """Attributes are set once in __init__ and cannot change afterwards."""
+    __slots__ = ()
+
+    def _set(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+class WeightedComponent(_Frozen):
+    """A rubric component of one term: its weight and the group it averages."""
+    __slots__ = ('name', 'weight', 'group')
+
+    def __init__(self, name, weight, group):
+        self._set(name=name, weight=weight, group=group)
+
+
+class TermPlan(_Frozen):
+    """One term: its share of the final grade and its weighted components."""
+    __slots__ = ('term', 'term_key', 'weight', 'components')
+
+    def __init__(self, term, term_key, weight, components):
+        self._set(term=term, term_key=term_key, weight=weight, components=tuple(components))
+
+
+class RubricPlan(_Frozen):
+    """
+    columns: every grade column key, in matrix order
+    groups: (type_key, term) -> column numbers of that component type's items
+    terms: TermPlan per term, midterm first
+    """
+    __slots__ = ('columns', 'groups', 'terms', '_group_of')
+
+    def __init__(self, columns, groups, terms, group_of):
+        self._set(
+            columns=tuple(columns),
+            groups=MappingProxyType(dict(groups)),
+            terms=tuple(terms),
+            _group_of=MappingProxyType(dict(group_of)),
+        )
+
+    def group_for(self, component_name, term):
+        """(type_key, term) group of a rubric component, or None if it is not in the rubric."""
+        return self._group_of.get((component_name.lower(), term))
+
+
+def compile_rubric_plan(rubric_config, components, type_key_for):
+    """
+    Build the RubricPlan of a rubric.
+
+    Args:
+        rubric_config: {'midterm'|'final': {'term_percentage', 'components': {name: percentage}}}
+        components: {type_key: [item names]}
+        type_key_for: Maps (component name, term) to its type key
+    """
+    columns = {}
+    groups = {}
+    for term, _ in TERMS:
+        for type_key, items in components.items():
+            groups[(type_key, term)] = tuple(
+                columns.setdefault(component_key(item, term), len(columns)) for item in items
+            )
+
+    terms = []
+    group_of = {}
+    for term, term_key in TERMS:
+        config = rubric_config[term_key]
+        weighted = []
+        for name, percentage in config['components'].items():
+            group = (type_key_for(name, term), term)
+            group_of[(name.lower(), term)] = group
+            weighted.append(WeightedComponent(name, percentage / 100, groups.get(group, ())))
+        terms.append(TermPlan(term, term_key, config['term_percentage'] / 100, weighted))
+
+    return RubricPlan(columns, groups, terms, group_of)
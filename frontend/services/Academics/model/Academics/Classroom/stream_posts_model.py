@@ -0,0 +1,114 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QVariant
+
+
+class StreamPostsModel(QAbstractListModel):
+    """
+    List model of a class's stream posts, newest first (as the service sorts them).
+    set_posts() applies a reload as row removals/insertions instead of a reset,
+    so the view keeps its scroll position and only touched rows repaint.
+    """
+
+    # Custom roles
+    PostRole = Qt.ItemDataRole.UserRole + 1
+    PostIdRole = Qt.ItemDataRole.UserRole + 2
+    DateTextRole = Qt.ItemDataRole.UserRole + 3
+
+    def __init__(self, format_date=None, parent=None):
+        super().__init__(parent)
+        self._format_date = format_date or str
+        self._posts = []
+        self._date_texts = []  # formatted once per post, not on every paint
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._posts)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._posts):
+            return QVariant()
+
+        post = self._posts[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return post.get("title", "")
+        elif role == self.DateTextRole:
+            return self._date_texts[index.row()]
+        elif role == self.PostRole:
+            return post
+        elif role == self.PostIdRole:
+            return post.get("id")
+        return QVariant()
+
+    def post_at(self, row):
+        if 0 <= row < len(self._posts):
+            return self._posts[row]
+        return None
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def set_posts(self, posts):
+        """Replace the posts, emitting only the rows that changed."""
+        posts = list(posts)
+        new_ids = [p.get("id") for p in posts]
+        new_id_set = set(new_ids)
+        kept = [p.get("id") for p in self._posts if p.get("id") in new_id_set]
+        kept_set = set(kept)
+        if len(new_id_set) != len(new_ids) or kept != [i for i in new_ids if i in kept_set]:
+            # Duplicate ids or reordered posts: not worth diffing
+            self.beginResetModel()
+            self._posts = posts
+            self._date_texts = [self._format(p) for p in posts]
+            self.endResetModel()
+            return
+
+        # Removed posts, bottom-up so earlier rows keep their numbers
+        for row in range(len(self._posts) - 1, -1, -1):
+            if self._posts[row].get("id") not in new_id_set:
+                self._remove_row(row)
+
+        # New posts, top-down; changed ones are refreshed in place
+        for row, post in enumerate(posts):
+            if row < len(self._posts) and self._posts[row].get("id") == post.get("id"):
+                if self._posts[row] != post:
+                    self._posts[row] = post
+                    self._date_texts[row] = self._format(post)
+                    index = self.index(row)
+                    self.dataChanged.emit(index, index)
+            else:
+                self._insert_row(row, post)
+
+    def add_post(self, post, row=0):
+        """Insert one post (at the top by default)."""
+        self._insert_row(max(0, min(row, len(self._posts))), post)
+
+    def remove_post(self, post_id):
+        """Remove a post by id; False if it is not in the model."""
+        for row, post in enumerate(self._posts):
+            if post.get("id") == post_id:
+                self._remove_row(row)
+                return True
+        return False
+
+    def clear(self):
+        if self._posts:
+            self.beginRemoveRows(QModelIndex(), 0, len(self._posts) - 1)
+            self._posts = []
+            self._date_texts = []
+            self.endRemoveRows()
+
+    def _insert_row(self, row, post):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._posts.insert(row, post)
+        self._date_texts.insert(row, self._format(post))
+        self.endInsertRows()
+
+    def _remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._posts[row]
+        del self._date_texts[row]
+        self.endRemoveRows()
+
+    def _format(self, post):
+        return self._format_date(post.get("date", ""))
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from PyQt6.QtCore import QAbstractTableModel, Qt, QModelIndex, pyqtSignal
 from PyQt6.QtGui import QColor
@@ -40,9 +40,17 @@ def parse_schedules(schedules: List[Dict]) -> str:
 class ClassesTableModel(QAbstractTableModel):
     dataLoaded = pyqtSignal()
 
+    PAGE_SIZE = 100
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._classes: List[Dict] = []
+        # Paged loading (see load_pages): fetch_page(offset, limit) -> {'items', 'total'}
+        self._fetch_page: Optional[Callable[[int, int], Dict]] = None
+        self._page_size = self.PAGE_SIZE
+        self._total = 0
+        self._fetched = 0
+        self._local_ids = set()
         self._headers = [
             "No.",
             "Code",
@@ -59,6 +67,34 @@ class ClassesTableModel(QAbstractTableModel):
     def rowCount(self, parent=QModelIndex()):
         return len(self._classes)
 
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._fetch_page is None:
+            return False
+        return self._fetched < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Append the next page; called by the view as it scrolls to the end."""
+        if not self.canFetchMore(parent):
+            return
+
+        page = self._fetch_page(self._fetched, self._page_size)
+        items = page.get('items') or []
+        self._total = page.get('total', self._total)
+        self._fetched += len(items)
+        if not items:
+            self._fetched = self._total
+            return
+
+        # Classes added through add_class already have a row
+        new_rows = [c for c in items if c.get('id') not in self._local_ids]
+        self._local_ids.difference_update(c.get('id') for c in items)
+        if new_rows:
+            first = len(self._classes)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            self._classes.extend(new_rows)
+            self.endInsertRows()
+        logger.info(f"Fetched {len(new_rows)} more classes ({self._fetched}/{self._total})")
+
     def columnCount(self, parent=QModelIndex()):
         return len(self._headers)
 
@@ -139,13 +175,44 @@ class ClassesTableModel(QAbstractTableModel):
         self._classes.append(class_data)
         self.endInsertRows()
 
+        if self._fetch_page is not None:
+            # It is also in the source, past the fetched pages; fetchMore skips it there
+            self._total += 1
+            self._local_ids.add(class_data.get('id'))
+
     def set_classes(self, classes: List[Dict]) -> None:
         self.beginResetModel()
         self._classes = classes.copy() if classes else []
+        self._fetch_page = None
+        self._total = self._fetched = len(self._classes)
+        self._local_ids = set()
         self.endResetModel()
         self.dataLoaded.emit()
         logger.info(f"Set {len(self._classes)} classes and emitted dataLoaded signal")
 
+    def load_pages(self, fetch_page: Callable[[int, int], Dict], page_size: int = PAGE_SIZE) -> None:
+        """
+        Show the first page of classes and fetch the rest as the view scrolls.
+
+        Args:
+            fetch_page: Called as fetch_page(offset, limit); returns a dict with
+                        'items' (that page) and 'total' (all classes)
+            page_size: Rows fetched per page
+        """
+        page = fetch_page(0, page_size)
+        items = list(page.get('items') or [])
+
+        self.beginResetModel()
+        self._classes = items
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self._total = page.get('total', len(items))
+        self._fetched = len(items)
+        self._local_ids = set()
+        self.endResetModel()
+        self.dataLoaded.emit()
+        logger.info(f"Loaded {len(items)} of {self._total} classes and emitted dataLoaded signal")
+
     def get_class_id(self, row: int) -> Optional[int]:
         """
         Get the class ID for a given row.
@@ -202,6 +269,14 @@ class ClassesTableModel(QAbstractTableModel):
                 self._classes.pop(row)
                 self.endRemoveRows()
 
+                if self._fetch_page is not None:
+                    # Unfetched classes shift up by one in the source
+                    self._total -= 1
+                    if class_id in self._local_ids:
+                        self._local_ids.discard(class_id)
+                    else:
+                        self._fetched -= 1
+
                 logger.info(f"Removed class ID {class_id} from row {row}")
                 return True
 
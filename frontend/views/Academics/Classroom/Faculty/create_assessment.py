@@ -21,7 +21,8 @@ from PyQt6.QtWidgets import (
     QSpacerItem, 
     QSizePolicy, 
     QGridLayout,
-    QScrollArea  # ADD: Scroll area for responsiveness
+    QScrollArea,  # ADD: Scroll area for responsiveness
+    QMessageBox
 )
 
 from PyQt6.QtCore import Qt, QSize, pyqtSignal
@@ -29,10 +30,12 @@ from PyQt6.QtGui import QFont, QPalette, QColor, QCursor
 from frontend.widgets.Academics.labeled_section import LabeledSection
 from frontend.widgets.Academics.dropdown import DropdownMenu
 from frontend.widgets.Academics.upload_class_material_widget import UploadClassMaterialPanel
+from frontend.controller.Academics.Classroom.post_controller import PostController
 
 
 class AssessmentForm(QWidget):
     back_clicked = pyqtSignal()
+    assessment_created = pyqtSignal(dict)
 
     def __init__(self, cls=None, username=None, roles=None, primary_role=None, token=None, post_controller=None, parent=None):
         super().__init__(parent)
@@ -42,7 +45,11 @@ class AssessmentForm(QWidget):
         self.primary_role = primary_role
         self.token = token
         self.post_controller = post_controller
+        if self.post_controller is None:
+            self.post_controller = PostController()
+            self.post_controller.set_class(self.cls.get('id') if self.cls else 1)
         self.initUI()
+        self.load_topics()
         
     def initUI(self):
         self.setStyleSheet("""
@@ -178,38 +185,47 @@ class AssessmentForm(QWidget):
             except:
                 return date_str.split(" ")[0] if " " in date_str else date_str
     
-    def create_assessment_data(self, assessment_data, topic_id):
-        """Create assessment data with proper date formatting"""
-        next_id = self.get_next_post_id()
-        
-        now = datetime.now()
-        created_at = now.strftime("%Y-%m-%d %H:%M:%S")  # Full format for internal use
-        date_posted = self.format_date(created_at)  # Use the same formatting as stream posts
-        
-        # For posts.json format
-        post = {
-            "post_id": next_id,
-            "class_id": self.cls.get('id') if self.cls else 1,
-            "topic_id": topic_id,
-            "type": "assessment",
-            "title": assessment_data['title'],
-            "description": assessment_data.get('description', ''),
-            "instructor": self.username or "Unknown Instructor",
-            "instructor_id": "faculty_001",
-            "date_posted": date_posted,  # This will now be in "Aug 18" format
-            "status": "published",
-            "created_at": created_at,
-            "updated_at": created_at
-        }
+    def create_assessment(self, assessment_data, topic_name=None):
+        """Create the assessment post through the post service (one store write)"""
+        return self.post_controller.create_post(
+            title=assessment_data['title'],
+            content=assessment_data.get('description', ''),
+            type_="assessment",
+            author=self.username or "Unknown Instructor",
+            topic_name=topic_name,
+            attachment=assessment_data.get('attachment')
+        )
+    
+    def load_topics(self):
+        """Load assessment topics of this class from the shared store"""
+        try:
+            topics = self.post_controller.topic_service.get_topics_by_class_id(self.post_controller.current_class_id)
+            topic_items = ["No Topic"] + [t.get('title', 'Untitled') for t in topics if t.get('type') == 'assessment']
+            self.topic_dropdown.clear()
+            for item in topic_items:
+                self.topic_dropdown.addItem(item)
+        except Exception as e:
+            print(f"Error loading topics: {e}")
+    
+    def handle_upload(self):
+        """Create the assessment when the panel's upload button is clicked"""
+        assessment_data = self.upload_panel.get_material_data()
+        selected_topic = self.topic_dropdown.currentText()
+        topic_name = selected_topic if selected_topic != "No Topic" else None
         
-        if assessment_data.get('attachment'):
-            post['attachment'] = {
-                "filename": assessment_data['attachment']['name'],
-                "file_type": assessment_data['attachment']['type'].lower(),
-                "file_path": assessment_data['attachment']['file_path']
-            }
+        try:
+            new_post = self.create_assessment(assessment_data, topic_name)
+        except Exception as e:
+            print(f"Error saving assessment: {e}")
+            new_post = None
         
-        return post
+        if new_post:
+            QMessageBox.information(self, "Success", "Assessment created successfully!")
+            self.assessment_created.emit(new_post)
+            self.upload_panel.clear_form()
+            self.back_clicked.emit()
+        else:
+            QMessageBox.warning(self, "Error", "Failed to create assessment. Please try again.")
     
     def create_left_panel(self):
         """Create responsive left panel"""
@@ -219,10 +235,11 @@ class AssessmentForm(QWidget):
         left_layout.setContentsMargins(0, 0, 0, 0)
         
         # Use the existing UploadClassMaterialPanel but make it responsive
-        upload_panel = UploadClassMaterialPanel()
-        upload_panel.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.upload_panel = UploadClassMaterialPanel()
+        self.upload_panel.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.upload_panel.upload_clicked.connect(self.handle_upload)
         
-        left_layout.addWidget(upload_panel)
+        left_layout.addWidget(self.upload_panel)
         return left_widget
     
     def create_right_panel(self):
@@ -278,8 +295,8 @@ class AssessmentForm(QWidget):
         term_dropdown = DropdownMenu(items=["No Due Date"])
         layout.addWidget(LabeledSection("Term", term_dropdown))
 
-        topic_dropdown = DropdownMenu(items=["Topic 1"])
-        layout.addWidget(LabeledSection("Topic", topic_dropdown))
+        self.topic_dropdown = DropdownMenu(items=["No Topic"])
+        layout.addWidget(LabeledSection("Topic", self.topic_dropdown))
 
         layout.addStretch()
         return right_frame
@@ -1,7 +1,7 @@
 """
 Custom QAbstractTableModel implementation with:
 - Bulk input support in headers (TRULY FIXED: uses viewport as parent)
-- Draft/upload status for grades with three-dot menu in cells
+- Draft/upload status for grades with a delegate-painted three-dot menu in cells
 - Expandable column headers with dynamic colors
 - Component aggregation display
 - Proper expand/collapse indicators
@@ -23,7 +23,7 @@ from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QMenu, QToolButton, QLabel, QStyle 
 )
 from PyQt6.QtCore import (
-    Qt, QAbstractTableModel, QModelIndex, pyqtSignal, QVariant, QPoint, QRect
+    Qt, QAbstractTableModel, QModelIndex, pyqtSignal, QVariant, QPoint, QRect, QEvent
 )
 from PyQt6.QtGui import QColor, QFont, QPainter, QPen, QBrush, QAction
 
@@ -314,80 +314,89 @@ class BulkInputHeaderView(QHeaderView):
             self.bulk_input_changed.emit(column, value)
 
 
-class CellOptionsWidget(QWidget):
-    """Three-dot menu widget that appears in each grade cell"""
+class GradeInputDelegate(QStyledItemDelegate):
+    """
+    Custom delegate for grade input cells with integrated options menu.
+    The three-dot button is painted into each grade cell and hit-tested
+    here, so no widget exists per cell; the menu opens on click.
+    """
+    
+    upload_requested = pyqtSignal(int, int)  # row, column
+    keep_draft_requested = pyqtSignal(int, int)  # row, column
     
-    upload_requested = pyqtSignal()
-    keep_draft_requested = pyqtSignal()
+    BUTTON_WIDTH = 18
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setup_ui()
+        self._menu = None
     
-    def setup_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(2, 0, 2, 0)
-        layout.setSpacing(0)
-        
-        self.options_btn = QToolButton()
-        self.options_btn.setText("⋯")
-        self.options_btn.setFixedSize(16, 16)
-        self.options_btn.setStyleSheet("""
-            QToolButton {
-                background: transparent;
-                border: none;
-                color: #666;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 0px;
-            }
-            QToolButton:hover {
-                background: rgba(0,0,0,0.1);
-                border-radius: 2px;
-            }
-            QToolButton::menu-indicator {
-                image: none;
-            }
-        """)
-        
-        menu = QMenu(self.options_btn)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: white;
-                border: 1px solid #ccc;
-                border-radius: 3px;
-            }
-            QMenu::item {
-                padding: 5px 20px;
-            }
-            QMenu::item:selected {
-                background-color: #E8F5E8;
-            }
-        """)
-        
-        draft_action = menu.addAction("Keep as Draft")
-        draft_action.triggered.connect(self.keep_draft_requested.emit)
-        
-        upload_action = menu.addAction("Upload")
-        upload_action.triggered.connect(self.upload_requested.emit)
-        
-        self.options_btn.setMenu(menu)
-        self.options_btn.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
-        
-        layout.addStretch()
-        layout.addWidget(self.options_btn)
-
-
-class GradeInputDelegate(QStyledItemDelegate):
-    """Custom delegate for grade input cells with integrated options menu"""
+    @classmethod
+    def options_rect(cls, cell_rect):
+        """Area of the three-dot button inside a cell"""
+        return QRect(cell_rect.right() - 20, cell_rect.top() + 2,
+                     cls.BUTTON_WIDTH, cell_rect.height() - 4)
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.option_widgets = {}
+    @staticmethod
+    def _has_options(index):
+        return index.data(GradesTableModel.ComponentKeyRole) is not None
     
     def paint(self, painter, option, index):
         """Custom paint to show cell with options button"""
         super().paint(painter, option, index)
+        if not self._has_options(index):
+            return
+        
+        rect = self.options_rect(option.rect)
+        painter.save()
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(0, 0, 0, 25))
+            painter.drawRoundedRect(QRect(rect.x(), rect.center().y() - 8, rect.width(), 16), 2, 2)
+        font = QFont(option.font)
+        font.setPixelSize(12)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor("#666"))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "⋯")
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        """Open the options menu when the painted button is clicked"""
+        if (event.type() in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease,
+                             QEvent.Type.MouseButtonDblClick)
+                and event.button() == Qt.MouseButton.LeftButton
+                and self._has_options(index)
+                and self.options_rect(option.rect).contains(event.position().toPoint())):
+            # Swallow press/double-click so the cell neither selects nor starts editing
+            if event.type() == QEvent.Type.MouseButtonRelease:
+                self._show_menu(index.row(), index.column(), event.globalPosition().toPoint())
+            return True
+        return super().editorEvent(event, model, option, index)
+    
+    def _show_menu(self, row, col, global_pos):
+        if self._menu is None:
+            self._menu = QMenu(self.parent())
+            self._menu.setStyleSheet("""
+                QMenu {
+                    background-color: white;
+                    border: 1px solid #ccc;
+                    border-radius: 3px;
+                }
+                QMenu::item {
+                    padding: 5px 20px;
+                }
+                QMenu::item:selected {
+                    background-color: #E8F5E8;
+                }
+            """)
+            self._draft_action = self._menu.addAction("Keep as Draft")
+            self._upload_action = self._menu.addAction("Upload")
+        
+        chosen = self._menu.exec(global_pos)
+        if chosen is self._draft_action:
+            self.keep_draft_requested.emit(row, col)
+        elif chosen is self._upload_action:
+            self.upload_requested.emit(row, col)
     
     def createEditor(self, parent, option, index):
         editor = QLineEdit(parent)
@@ -415,7 +424,6 @@ class EnhancedGradesTableView(QTableView):
         
         self.data_model = data_model
         self.controller = controller
-        self.cell_option_widgets = {}
         
         # Setup model
         self.table_model = GradesTableModel(data_model, controller)
@@ -428,6 +436,9 @@ class EnhancedGradesTableView(QTableView):
         # Setup delegate
         self.delegate = GradeInputDelegate(self)
         self.setItemDelegate(self.delegate)
+        self.delegate.upload_requested.connect(self._on_upload_single)
+        self.delegate.keep_draft_requested.connect(self._on_keep_draft_single)
+        self.setMouseTracking(True)  # hover highlight of the painted options button
         
         # Connect signals
         self.custom_header.section_expand_clicked.connect(self._on_header_expand)
@@ -435,7 +446,6 @@ class EnhancedGradesTableView(QTableView):
         self.custom_header.upload_column_clicked.connect(self._on_upload_column)
         self.custom_header.draft_column_clicked.connect(self._on_draft_column)
         self.data_model.columns_changed.connect(self._update_header_colors)
-        self.table_model.dataChanged.connect(self._on_data_changed)
         
         # Table appearance settings
         self.setAlternatingRowColors(True)
@@ -489,52 +499,6 @@ class EnhancedGradesTableView(QTableView):
         
         all_states = dict(self.data_model.column_states)
         self.custom_header.set_expanded_states(expanded_main, all_states)
-        self._create_all_option_widgets()
-    
-    def _create_all_option_widgets(self):
-        """Create option widgets for all grade input cells"""
-        for widget in self.cell_option_widgets.values():
-            widget.deleteLater()
-        self.cell_option_widgets = {}
-        
-        for row in range(self.table_model.rowCount()):
-            for col in range(self.table_model.columnCount()):
-                col_info = self.table_model.columns[col]
-                if col_info.get('type') == 'grade_input':
-                    self._create_option_widget(row, col)
-    
-    def _create_option_widget(self, row, col):
-        """Create option widget for a specific cell"""
-        widget = CellOptionsWidget(self.viewport())
-        widget.upload_requested.connect(
-            lambda r=row, c=col: self._on_upload_single(r, c)
-        )
-        widget.keep_draft_requested.connect(
-            lambda r=row, c=col: self._on_keep_draft_single(r, c)
-        )
-        
-        self._position_option_widget(row, col, widget)
-        widget.show()
-        
-        self.cell_option_widgets[(row, col)] = widget
-    
-    def _position_option_widget(self, row, col, widget):
-        """Position option widget in cell"""
-        rect = self.visualRect(self.table_model.index(row, col))
-        widget.setGeometry(
-            rect.right() - 20,
-            rect.top() + 2,
-            18,
-            rect.height() - 4
-        )
-    
-    def _on_data_changed(self, top_left, bottom_right):
-        """Handle data changes and update widgets"""
-        for row in range(top_left.row(), bottom_right.row() + 1):
-            for col in range(top_left.column(), bottom_right.column() + 1):
-                if (row, col) in self.cell_option_widgets:
-                    widget = self.cell_option_widgets[(row, col)]
-                    self._position_option_widget(row, col, widget)
     
     def load_data(self, columns_info):
         """Load column structure and add bulk widgets"""
@@ -576,9 +540,6 @@ class EnhancedGradesTableView(QTableView):
         
         # Position all bulk widgets
         self.custom_header.reposition_all_bulk_widgets()
-        
-        # Create option widgets for all grade cells
-        self._create_all_option_widgets()
     
     def _on_header_expand(self, section, col_info):
         """Handle header expand/collapse"""
@@ -596,14 +557,7 @@ class EnhancedGradesTableView(QTableView):
     def _on_draft_column(self, column):
         """Handle keep as draft for column"""
         print(f"[DEBUG] Keep as Draft clicked for column {column}")
-        col_info = self.table_model.columns[column]
-        if col_info.get('type') == 'grade_input':
-            component_key = col_info.get('component_key', '')
-            for student_id in self.data_model.grades.keys():
-                if component_key in self.data_model.grades[student_id]:
-                    grade_item = self.data_model.grades[student_id][component_key]
-                    if grade_item.value:
-                        self.data_model.set_grade(student_id, component_key, grade_item.value, is_draft=True)
+        self.table_model.draft_column_grades(column)
     
     def _on_upload_single(self, row, col):
         """Handle upload single grade"""
@@ -628,9 +582,6 @@ class EnhancedGradesTableView(QTableView):
         """Reposition widgets on resize"""
         super().resizeEvent(event)
         self.custom_header.reposition_all_bulk_widgets()
-        
-        for (row, col), widget in self.cell_option_widgets.items():
-            self._position_option_widget(row, col, widget)
     
     def scrollContentsBy(self, dx, dy):
         """Reposition widgets on scroll - bulk widgets auto-handled by viewport parent"""
@@ -638,7 +589,3 @@ class EnhancedGradesTableView(QTableView):
         
         # CRITICAL: Reposition bulk widgets on ANY scroll
         self.custom_header.reposition_all_bulk_widgets()
-        
-        # Reposition option widgets
-        for (row, col), widget in self.cell_option_widgets.items():
-            self._position_option_widget(row, col, widget)
\ No newline at end of file
@@ -1,7 +1,5 @@
 import sys
 import os
-import json
-from datetime import datetime
 
 project_root = (os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../..')))
 if project_root not in sys.path:
@@ -25,6 +23,7 @@ from PyQt6.QtGui import QCursor
 from frontend.widgets.Academics.labeled_section import LabeledSection
 from frontend.widgets.Academics.dropdown import DropdownMenu
 from frontend.widgets.Academics.upload_class_material_widget import UploadClassMaterialPanel
+from frontend.controller.Academics.Classroom.post_controller import PostController
 
 class MaterialForm(QWidget):
     back_clicked = pyqtSignal()
@@ -39,9 +38,10 @@ class MaterialForm(QWidget):
         self.token = token
         self.post_controller = post_controller
         
-        # ADDED: Data file paths
-        self.classroom_data_path = "frontend/services/Academics/data/classroom_data.json"
-        self.posts_data_path = "frontend/services/Academics/data/classroom_data.json"
+        # Posts are created through the controller's services (shared store)
+        if self.post_controller is None:
+            self.post_controller = PostController()
+            self.post_controller.set_class(self.cls.get('id') if self.cls else 1)
         
         self.initUI()
         self.load_topics()  # ADDED: Load topics for dropdown
@@ -206,18 +206,14 @@ class MaterialForm(QWidget):
         layout.addStretch()
         return right_frame
 
-    # ADDED: Load topics from data file
+    # ADDED: Load topics for the dropdown
     def load_topics(self):
-        """Load topics from classroom data"""
+        """Load material topics of this class from the shared store"""
         try:
-            with open(self.classroom_data_path, 'r') as f:
-                data = json.load(f)
+            topics = self.post_controller.topic_service.get_topics_by_class_id(self.post_controller.current_class_id)
             
-            topics = data.get('topics', [])
-            class_id = self.cls.get('id') if self.cls else 1
-            
-            # Filter topics for this class and type material
-            class_topics = [t for t in topics if t.get('class_id') == class_id and t.get('type') == 'material']
+            # Filter topics for type material
+            class_topics = [t for t in topics if t.get('type') == 'material']
             
             # Update dropdown
             topic_items = ["No Topic"] + [t.get('title', 'Untitled') for t in class_topics]
@@ -236,146 +232,29 @@ class MaterialForm(QWidget):
         
         # Get selected topic
         selected_topic = self.topic_dropdown.currentText()
-        topic_id = None
-        if selected_topic != "No Topic":
-            topic_id = self.get_topic_id(selected_topic)
+        topic_name = selected_topic if selected_topic != "No Topic" else None
         
-        # Create post data
-        new_post = self.create_post_data(material_data, topic_id)
+        # One service call: id allocation and a single store write
+        try:
+            new_post = self.post_controller.create_post(
+                title=material_data['title'],
+                content=material_data['description'],
+                type_="material",
+                author=self.username or "Unknown Instructor",
+                topic_name=topic_name,
+                attachment=material_data.get('attachment')
+            )
+        except Exception as e:
+            print(f"Error saving post: {e}")
+            new_post = None
         
-        # Save to data files
-        if self.save_post(new_post):
+        if new_post:
             QMessageBox.information(self, "Success", "Material uploaded successfully!")
             self.material_created.emit(new_post)
             self.upload_panel.clear_form()
             self.back_clicked.emit()
         else:
             QMessageBox.warning(self, "Error", "Failed to upload material. Please try again.")
-
-    # ADDED: Get topic ID
-    def get_topic_id(self, topic_title):
-        """Get topic ID from title"""
-        try:
-            with open(self.classroom_data_path, 'r') as f:
-                data = json.load(f)
-            
-            topics = data.get('topics', [])
-            for topic in topics:
-                if topic.get('title') == topic_title:
-                    return topic.get('id')
-            return None
-        except:
-            return None
-
-    def format_date(self, date_str):
-        """Format date string for display - same as in classroom_stream.py"""
-        if not date_str:
-            return ""
-        try:
-            # Convert "2025-08-18 10:00:00" to "Aug 18"
-            from datetime import datetime
-            dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-            return dt.strftime("%b %d")
-        except:
-            # If parsing fails, try alternative formats
-            try:
-                dt = datetime.strptime(date_str, "%Y-%m-%d")
-                return dt.strftime("%b %d")
-            except:
-                return date_str.split(" ")[0] if " " in date_str else date_str
-        
-    # ADDED: Create post data structure
-    def create_post_data(self, material_data, topic_id):
-        """Create post data matching JSON format"""
-        next_id = self.get_next_post_id()
-        
-        now = datetime.now()
-        # Use the format that works with the format_date function
-        created_at = now.strftime("%Y-%m-%d %H:%M:%S")  # This format: "2025-10-16 14:30:00"
-        date_posted = self.format_date(created_at)  # This should give "Oct 16"
-        
-        # For posts.json format
-        post = {
-            "post_id": next_id,
-            "class_id": self.cls.get('id') if self.cls else 1,
-            "topic_id": topic_id,
-            "type": "material",  # or "assessment" for assessment form
-            "title": material_data['title'],
-            "description": material_data['description'],
-            "instructor": self.username or "Unknown Instructor",
-            "instructor_id": "faculty_001",
-            "date_posted": date_posted,  # This should be in "Oct 16" format
-            "status": "published",
-            "created_at": created_at,  # Keep full format for internal use
-            "updated_at": created_at
-        }
-        
-        if material_data.get('attachment'):
-            post['attachment'] = {
-                "filename": material_data['attachment']['name'],
-                "file_type": material_data['attachment']['type'].lower(),
-                "file_path": material_data['attachment']['file_path']
-            }
-        
-        return post
-    # ADDED: Get next post ID
-    def get_next_post_id(self):
-        """Get the next available post ID"""
-        try:
-            with open(self.posts_data_path, 'r') as f:
-                data = json.load(f)
-            
-            posts = data.get('posts', [])
-            if not posts:
-                return 1
-            
-            max_id = max(p.get('post_id', 0) for p in posts)
-            return max_id + 1
-        except:
-            return 1
-
-    # ADDED: Save post to files
-    def save_post(self, post_data):
-        """Save post to both JSON files"""
-        try:
-            # Save to posts.json
-            with open(self.posts_data_path, 'r') as f:
-                posts_data = json.load(f)
-            
-            posts_data['posts'].append(post_data)
-            
-            with open(self.posts_data_path, 'w') as f:
-                json.dump(posts_data, f, indent=4)
-            
-            # Save to classroom_data.json
-            with open(self.classroom_data_path, 'r') as f:
-                classroom_data = json.load(f)
-            
-            classroom_post = {
-                "id": post_data['post_id'],
-                "topic_id": post_data['topic_id'],
-                "class_id": post_data['class_id'],
-                "title": post_data['title'],
-                "content": post_data['description'],
-                "type": post_data['type'],
-                "attachment": {
-                    "name": post_data['attachment']['filename'] if post_data.get('attachment') else post_data['title'],
-                    "type": post_data['attachment']['file_type'].upper() if post_data.get('attachment') else "PDF"
-                } if post_data.get('attachment') else None,
-                "score": None,
-                "date": post_data['date_posted'],  # Use the formatted date here
-                "author": post_data['instructor']
-            }
-            
-            classroom_data['posts'].append(classroom_post)
-            
-            with open(self.classroom_data_path, 'w') as f:
-                json.dump(classroom_data, f, indent=4)
-            
-            return True
-        except Exception as e:
-            print(f"Error saving post: {e}")
-            return False
     
 def main():
     app = QApplication(sys.argv)
@@ -1,9 +1,10 @@
 # classroom_classworks.py
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QComboBox, QDialog, QLineEdit, QTextEdit, QPushButton, QMenu, QToolButton, QFrame, QScrollArea, QSizePolicy, QSpacerItem
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QComboBox, QDialog, QLineEdit, QTextEdit, QPushButton, QMenu, QToolButton, QFrame, QScrollArea, QSizePolicy, QSpacerItem, QTreeView, QAbstractItemView
 from PyQt6.QtCore import Qt, pyqtSignal, QSize
 from PyQt6.QtGui import QPixmap, QIcon, QFont, QFontDatabase, QAction
 from widgets.Academics.classroom_classworks_content_ui import Ui_ClassroomClassworksContent
-from widgets.Academics.topic_widget import TopicWidget
+from frontend.services.Academics.model.Academics.Classroom.classworks_tree_model import ClassworksTreeModel, ClassworksFilterProxyModel
+from frontend.views.Academics.Classroom.Shared.classworks_delegate import ClassworksDelegate
 from typing import Optional, Dict
 import os
 import datetime
@@ -45,8 +46,6 @@ class ClassroomClassworks(QWidget):
         self.cls = cls
         self.post_controller = post_controller
         self.post_controller.set_class(cls["id"])
-        self.topic_widgets = []
-        self.untitled_frames = []
         
         # Load Poppins font
         self.load_poppins_font()
@@ -56,6 +55,7 @@ class ClassroomClassworks(QWidget):
         self.setup_filter()
         self.connect_signals()
         self.initialize_layout()
+        self.setup_tree()
         self.load_posts()
 
     def setup_styles(self):
@@ -498,195 +498,130 @@ class ClassroomClassworks(QWidget):
         # If all parsing fails, return the original string or part of it
         return date_str.split(" ")[0] if " " in date_str else date_str    
 
+    def setup_tree(self):
+        """Create the classworks tree (topic -> posts) with its filter proxy"""
+        self.tree_model = ClassworksTreeModel(format_date=self.format_date, parent=self)
+        self.filter_model = ClassworksFilterProxyModel(self)
+        self.filter_model.setSourceModel(self.tree_model)
+
+        self.tree_delegate = ClassworksDelegate(show_menu=self.primary_role in ["faculty", "admin"], parent=self)
+        self.tree_delegate.post_clicked.connect(self.post_selected.emit)
+        self.tree_delegate.menu_requested.connect(self.show_post_menu)
+
+        self.tree = QTreeView()
+        self.tree.setModel(self.filter_model)
+        self.tree.setItemDelegate(self.tree_delegate)
+        self.tree.setHeaderHidden(True)
+        self.tree.setRootIsDecorated(False)
+        self.tree.setIndentation(0)
+        self.tree.setItemsExpandable(False)
+        self.tree.setExpandsOnDoubleClick(False)
+        self.tree.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.tree.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.tree.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.tree.setFrameShape(QFrame.Shape.NoFrame)
+        self.tree.setMouseTracking(True)
+        self.tree.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.tree.setStyleSheet("QTreeView { background: transparent; }")
+
+        # Topics are always expanded, including ones the filter brings back
+        self.filter_model.modelReset.connect(self.tree.expandAll)
+        self.filter_model.layoutChanged.connect(self.tree.expandAll)
+        self.filter_model.rowsInserted.connect(self._expand_inserted_topics)
+
+        self.no_posts_label = QLabel("No classworks available")
+        self.no_posts_label.setStyleSheet("""
+            QLabel {
+                color: #666;
+                font-size: 16px;
+                padding: 50px;
+                text-align: center;
+                font-family: "Poppins", Arial, sans-serif;
+            }
+        """)
+        self.no_posts_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        layout = self.ui.scrollAreaWidgetContents.layout()
+        layout.addWidget(self.no_posts_label)
+        layout.addWidget(self.tree, 1)
+
+    def _expand_inserted_topics(self, parent, first, last):
+        if not parent.isValid():
+            for row in range(first, last + 1):
+                self.tree.expand(self.filter_model.index(row, 0))
+
+    def _update_empty_state(self):
+        empty = self.filter_model.rowCount() == 0
+        self.no_posts_label.setVisible(empty)
+        self.tree.setVisible(not empty)
+
     def load_posts(self, filter_topic=None):
-        """Load posts using PostController with clean layout"""
-        filter_type = None
-        topic_name = None
-        if filter_topic == "Material":
-            filter_type = "material"
-        elif filter_topic == "Assessment":
-            filter_type = "assessment"
-        elif filter_topic not in ["All items", "Material", "Assessment"]:
-            topic_name = filter_topic
-        
-        self.post_controller.set_filters(filter_type=filter_type, topic_name=topic_name)
-        posts = self.post_controller.get_classwork_posts()
-
-        # Format dates for display
-        for post in posts:
-            if 'date' in post:
-                post['display_date'] = self.format_date(post['date'])
-            elif 'date_posted' in post:
-                post['display_date'] = self.format_date(post['date_posted'])
-            else:
-                post['display_date'] = ""
-        
-        try:
-            posts.sort(key=lambda x: x.get('date', ''), reverse=True)
-        except:
-            pass
-        
-        scroll_widget = self.ui.scrollAreaWidgetContents
-        layout = scroll_widget.layout()
-        
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        self.topic_widgets.clear()
-        self.untitled_frames.clear()
-        
-        if posts:
-            grouped = {}
-            for post in posts:
-                topic_title = "Untitled"
-                if post.get("topic_id"):
-                    topic = self.post_controller.get_topic_by_id(post["topic_id"])
-                    if topic:
-                        topic_title = topic.get("title", "Untitled")
-                
-                grouped.setdefault(topic_title, []).append(post)
-            
-            for topic_title in grouped:
-                grouped[topic_title].sort(key=lambda x: x.get('date', ''), reverse=True)
-            
-            sorted_groups = sorted(grouped.items(), 
-                                key=lambda x: (x[0] != "Untitled", x[0] if x[0] != "Untitled" else ""))
-            
-            for topic_title, topic_posts in sorted_groups:
-                if topic_title == "Untitled":
-                    for post in topic_posts:
-                        from frontend.widgets.Academics.topic_frame import TopicFrame
-                        frame = TopicFrame(post, self.post_controller, self.primary_role)
-                        frame.post_clicked.connect(self.post_selected.emit)
-                        
-                        # Apply consistent styling
-                        frame.setStyleSheet("""
-                            QFrame {
-                                background-color: white;
-                                border: 1px solid #E0E0E0;
-                                border-radius: 20px;
-                                margin-left: 20px;
-                            }
-                            QFrame:hover {
-                                background-color: #F8F9FA;
-                                border-color: #D0D7DE;
-                            }
-                        """)
-                        
-                        layout.addWidget(frame)
-                        self.untitled_frames.append(frame)
-                else:
-                    from frontend.widgets.Academics.topic_widget import TopicWidget
-                    topic_widget = TopicWidget(topic_title, topic_posts, self.post_controller, self.primary_role)
-                    
-                    # Apply consistent topic header styling
-                    topic_widget.title_label.setStyleSheet("""
-                        QLabel {
-                            font-size: 24px;
-                            font-weight: 400;
-                            margin-left: 20px;
-                            margin-top: 10px;
-                            margin-bottom: 5px;
-                            color: #000000;
-                            background-color: transparent;
-                            font-family: "Poppins", Arial, sans-serif;
-                        }
-                    """)
-                    
-                    for frame in topic_widget.frames:
-                        frame.post_clicked.connect(self.post_selected.emit)
-                        # Apply consistent frame styling
-                        frame.setStyleSheet("""
-                            QFrame {
-                                background-color: white;
-                                border: 1px solid #E0E0E0;
-                                border-radius: 20px;
-                                margin-left: 20px;
-                            }
-                            QFrame:hover {
-                                background-color: #F8F9FA;
-                                border-color: #D0D7DE;
-                            }
-                        """)
-                    
-                    layout.addWidget(topic_widget)
-                    self.topic_widgets.append(topic_widget)
-        
+        """Load posts grouped by topic; only changed rows of the tree are touched"""
+        self.tree_model.set_groups(self.post_controller.get_classworks_by_topic())
+        if filter_topic:
+            self.filter_posts(filter_topic)
         else:
-            # No posts message
-            no_posts_label = QLabel("No classworks available")
-            no_posts_label.setStyleSheet("""
-                QLabel {
-                    color: #666;
-                    font-size: 16px;
-                    padding: 50px;
-                    text-align: center;
-                    font-family: "Poppins", Arial, sans-serif;
-                }
-            """)
-            no_posts_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(no_posts_label)
-        
-        layout.addStretch()
+            self._update_empty_state()
+
+    def add_post(self, post):
+        """Show a newly created post as a single inserted row"""
+        topic = self.post_controller.get_topic_by_id(post["topic_id"]) if post.get("topic_id") else None
+        self.tree_model.add_post(post, topic.get("title", "") if topic else "")
+        self._update_empty_state()
 
     def filter_posts(self, filter_text):
         """Filter posts based on selection"""
         if not filter_text:
             return
         
-        # Show all first
-        for topic_widget in self.topic_widgets:
-            topic_widget.setVisible(True)
-            for frame in topic_widget.frames:
-                frame.setVisible(True)
-        
-        for frame in self.untitled_frames:
-            frame.setVisible(True)
-        
-        # Apply filters
         if filter_text == "All items":
-            return
-        
+            self.filter_model.set_filter()
         elif filter_text == "Material":
-            for frame in self.untitled_frames:
-                frame.setVisible(frame.post["type"] == "material")
-            
-            for widget in self.topic_widgets:
-                has_materials = any(f.post["type"] == "material" for f in widget.frames)
-                widget.setVisible(has_materials)
-                if widget.isVisible():
-                    for frame in widget.frames:
-                        frame.setVisible(frame.post["type"] == "material")
-        
+            self.filter_model.set_filter(post_type="material")
         elif filter_text == "Assessment":
-            for frame in self.untitled_frames:
-                frame.setVisible(frame.post["type"] == "assessment")
-            
-            for widget in self.topic_widgets:
-                has_assessments = any(f.post["type"] == "assessment" for f in widget.frames)
-                widget.setVisible(has_assessments)
-                if widget.isVisible():
-                    for frame in widget.frames:
-                        frame.setVisible(frame.post["type"] == "assessment")
-        
+            self.filter_model.set_filter(post_type="assessment")
         else:  # Topic filter
-            for frame in self.untitled_frames:
-                frame.setVisible(False)
-            
-            for widget in self.topic_widgets:
-                widget.setVisible(widget.title_label.text() == filter_text)
-                if widget.isVisible():
-                    for frame in widget.frames:
-                        frame.setVisible(True)
+            self.filter_model.set_filter(topic_title=filter_text)
+        self._update_empty_state()
+
+    def show_post_menu(self, post, pos):
+        """Show context menu for post actions (Edit, Delete)"""
+        menu = QMenu(self)
+        menu.setStyleSheet("""
+            QMenu {
+                background-color: white;
+                border: 1px solid #ddd;
+                border-radius: 4px;
+                padding: 4px 0px;
+                font-family: "Poppins", Arial, sans-serif;
+            }
+            QMenu::item {
+                padding: 8px 16px;
+                font-size: 16px;
+            }
+            QMenu::item:selected {
+                background-color: #f5f5f5;
+            }
+        """)
+        edit_action = QAction("Edit", self)
+        delete_action = QAction("Delete", self)
+        edit_action.triggered.connect(lambda: print(f"Edit post: {post['title']}"))
+        delete_action.triggered.connect(lambda: self.delete_post(post))
+        menu.addAction(edit_action)
+        menu.addAction(delete_action)
+        menu.exec(pos)
+
+    def delete_post(self, post):
+        """Delete a post and drop its row"""
+        if self.post_controller.delete_post(post["id"]):
+            self.tree_model.remove_post(post["id"])
+            self._update_empty_state()
+            if hasattr(self, 'stream_view'):
+                self.stream_view.remove_post(post["id"])
+        else:
+            print(f"Failed to delete post {post['id']}")
 
     def clear(self):
         """Clean up method"""
         self.ui.filterComboBox.clear()
-        layout = self.ui.scrollAreaWidgetContents.layout()
-        if layout:
-            while layout.count():
-                item = layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
\ No newline at end of file
+        self.tree_model.clear()
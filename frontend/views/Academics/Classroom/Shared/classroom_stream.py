@@ -1,8 +1,10 @@
 # classroom_stream.py
-from PyQt6.QtWidgets import QWidget, QLabel, QFrame, QVBoxLayout, QHBoxLayout, QPushButton,QSizePolicy
+from PyQt6.QtWidgets import QWidget, QLabel, QFrame, QVBoxLayout, QListView, QAbstractItemView, QSizePolicy
 from PyQt6.QtCore import pyqtSignal, Qt
 from widgets.Academics.stream_post_ui import Ui_ClassroomStreamContent
 from utils.date_utils import format_date_display
+from frontend.services.Academics.model.Academics.Classroom.stream_posts_model import StreamPostsModel
+from frontend.views.Academics.Classroom.Shared.stream_post_delegate import StreamPostDelegate
 
 class ClassroomStream(QWidget):
     post_selected = pyqtSignal(dict)
@@ -26,6 +28,7 @@ class ClassroomStream(QWidget):
         
         # Setup the existing template widgets
         self.setup_existing_widgets()
+        self.setup_post_list()
         
         self.load_posts()
         self.load_syllabus() 
@@ -136,37 +139,73 @@ class ClassroomStream(QWidget):
             }
             self.post_selected.emit(post_like_syllabus)
 
+    def setup_post_list(self):
+        """Create the post list (model + painted delegate) in the stream items layout"""
+        self.posts_model = StreamPostsModel(format_date=format_date_display, parent=self)
+
+        self.post_delegate = StreamPostDelegate(show_menu=self.primary_role in ["faculty", "admin"], parent=self)
+        self.post_delegate.post_clicked.connect(self.on_post_clicked)
+        self.post_delegate.menu_requested.connect(self.show_post_menu)
+
+        self.post_list = QListView()
+        self.post_list.setModel(self.posts_model)
+        self.post_list.setItemDelegate(self.post_delegate)
+        self.post_list.setUniformItemSizes(True)  # every card has the same height
+        self.post_list.setSpacing(5)
+        self.post_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.post_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.post_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.post_list.setFrameShape(QFrame.Shape.NoFrame)
+        self.post_list.setMouseTracking(True)
+        self.post_list.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.post_list.setStyleSheet("QListView { background: transparent; }")
+        self.post_list.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.post_list.setMinimumHeight(300)
+
+        self.no_posts_label = QLabel("No posts available")
+        self.no_posts_label.setStyleSheet("""
+            QLabel {
+                color: #666;
+                font-size: 14px;
+                padding: 20px;
+                text-align: center;
+            }
+        """)
+        self.no_posts_label.setVisible(False)
+
+        stream_layout = self.get_stream_layout()
+        stream_layout.addWidget(self.no_posts_label)
+        stream_layout.addWidget(self.post_list, 1)
+        # The list scrolls itself; let its row of the page take the spare height
+        if hasattr(self.ui, 'verticalLayout_5') and hasattr(self.ui, 'horizontalLayout_5'):
+            self.ui.verticalLayout_5.setStretchFactor(self.ui.horizontalLayout_5, 1)
+
     def load_posts(self):
         # Use PostController to get posts (they're already sorted by the service)
         posts = self.post_controller.get_stream_posts()
         print(f"Loading {len(posts)} posts in stream")
-        
-        # Get the stream items layout
-        stream_layout = self.get_stream_layout()
-        if not stream_layout:
-            print("Error: Could not find stream layout!")
-            return
-        
-        # Clear existing posts (except the template)
-        self.clear_stream_layout(stream_layout)
-        
-        if not posts:
-            no_posts_label = QLabel("No posts available")
-            no_posts_label.setStyleSheet("""
-                QLabel {
-                    color: #666;
-                    font-size: 14px;
-                    padding: 20px;
-                    text-align: center;
-                }
-            """)
-            stream_layout.addWidget(no_posts_label)
-            return
-        
-        # Add regular posts (excluding syllabus which is handled separately)
+
+        # Regular posts only (syllabus is handled separately); the model
+        # applies the difference to what is shown
         regular_posts = [p for p in posts if p.get("title") != "Syllabus"]
-        for post in regular_posts:
-            self.create_post_widget(post, stream_layout)
+        self.posts_model.set_posts(regular_posts)
+        self._update_empty_state()
+
+    def _update_empty_state(self):
+        empty = self.posts_model.rowCount() == 0
+        self.no_posts_label.setVisible(empty)
+        self.post_list.setVisible(not empty)
+
+    def add_post(self, post):
+        """Show a newly created post as one row at the top"""
+        if post.get("title") != "Syllabus":
+            self.posts_model.add_post(post)
+            self._update_empty_state()
+
+    def remove_post(self, post_id):
+        """Drop a deleted post's row"""
+        if self.posts_model.remove_post(post_id):
+            self._update_empty_state()
 
     def get_stream_layout(self):
         """Find the correct stream layout from the UI structure"""
@@ -196,174 +235,7 @@ class ClassroomStream(QWidget):
         self.ui.scrollArea.setWidget(fallback_widget)
         return fallback_layout
 
-    def clear_stream_layout(self, stream_layout):
-        """Clear the stream layout while preserving the template"""
-        if not stream_layout:
-            return
-            
-        # Remove all widgets except the template
-        for i in range(stream_layout.count() - 1, -1, -1):
-            item = stream_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                # Don't remove the template post
-                if widget != getattr(self.ui, 'postTemplate', None):
-                    widget.setParent(None)
-                    widget.deleteLater()
-
-
-    def create_post_widget(self, post, stream_layout):
-        """Create a post widget based on the template with proper spacing and document icon"""
-        try:
-            # Use the template as a base if it exists
-            if hasattr(self.ui, 'postTemplate') and self.ui.postTemplate:
-                # Clone the template structure
-                post_frame = QFrame()
-                post_frame.setStyleSheet(self.ui.postTemplate.styleSheet())
-                post_frame.setFrameShape(self.ui.postTemplate.frameShape())
-                post_frame.setFrameShadow(self.ui.postTemplate.frameShadow())
-                
-                # Create the same layout structure with better spacing
-                layout = QHBoxLayout(post_frame)
-                layout.setContentsMargins(15, 12, 15, 12)  # Increased padding
-                layout.setSpacing(15)  # Increased spacing between icon and content
-                
-                # Icon with document.svg
-                icon_label = QLabel()
-                icon_label.setFixedSize(42, 42)  # Fixed size instead of maximum
-                icon_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #084924;
-                        border-radius: 23px;
-                        border: 2px solid white;
-                        min-width: 42px;
-                        min-height: 42px;
-                    }
-                """)
-                icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                
-                # Load and set the document icon
-                try:
-                    from PyQt6.QtGui import QPixmap
-                    icon_path = "frontend/assets/icons/document.svg"
-                    pixmap = QPixmap(icon_path)
-                    if not pixmap.isNull():
-                        # Scale the icon to fit within the circle
-                        scaled_pixmap = pixmap.scaled(24, 24, Qt.AspectRatioMode.KeepAspectRatio, 
-                                                    Qt.TransformationMode.SmoothTransformation)
-                        icon_label.setPixmap(scaled_pixmap)
-                    else:
-                        # Fallback: use text if icon not found
-                        icon_label.setText("📄")
-                        icon_label.setStyleSheet(icon_label.styleSheet() + """
-                            QLabel {
-                                color: white;
-                                font-size: 16px;
-                            }
-                        """)
-                except Exception as icon_error:
-                    print(f"Error loading icon: {icon_error}")
-                    # Fallback to text icon
-                    icon_label.setText("📄")
-                    icon_label.setStyleSheet(icon_label.styleSheet() + """
-                        QLabel {
-                            color: white;
-                            font-size: 16px;
-                        }
-                    """)
-                
-                layout.addWidget(icon_label)
-                
-                # Content area with proper spacing
-                content_layout = QVBoxLayout()
-                content_layout.setSpacing(8)  # Increased spacing between title and date
-                content_layout.setContentsMargins(0, 0, 0, 0)
-                
-                # Title ONLY - no author mentioned
-                title = post.get("title", "")
-                title_label = QLabel(title)
-                title_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 16px;
-                        border: none;
-                        color: #333;
-                        margin: 0px;
-                        padding: 0px;
-                    }
-                """)
-                title_label.setWordWrap(True)
-                title_label.setMinimumHeight(20)  # Ensure minimum height
-                title_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-                content_layout.addWidget(title_label)
-                
-                # Date
-                date_text = self.format_date(post.get("date", ""))
-                date_label = QLabel(date_text)
-                date_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 14px;
-                        border: none;
-                        color: #666;
-                        margin: 0px;
-                        padding: 0px;
-                    }
-                """)
-                date_label.setMinimumHeight(16)  # Ensure minimum height
-                content_layout.addWidget(date_label)
-                
-                # Add stretch to push content to top and prevent squishing
-                content_layout.addStretch()
-                
-                layout.addLayout(content_layout)
-                layout.addStretch()
-                
-                # Add menu button for faculty/admin (same as Classworks)
-                if self.primary_role in ["faculty", "admin"]:
-                    menu_button = QPushButton("⋮")
-                    menu_button.setFixedSize(30, 30)
-                    from PyQt6.QtGui import QFont
-                    menu_font = QFont("Poppins")
-                    menu_font.setPointSize(16)
-                    menu_button.setFont(menu_font)
-                    menu_button.setStyleSheet("""
-                        QPushButton {
-                            border: none;
-                            background-color: transparent;
-                            color: #656d76;
-                            border-radius: 15px;
-                            font-weight: bold;
-                            font-family: "Poppins", Arial, sans-serif;
-                        }
-                        QPushButton:hover {
-                            background-color: #F3F4F6;
-                        }
-                    """)
-                    layout.addWidget(menu_button)
-                    
-                    # Connect menu button click
-                    menu_button.clicked.connect(lambda checked, p=post: self.show_post_menu(p, menu_button))
-                
-                # Make clickable
-                post_frame.mousePressEvent = lambda event, p=post: self.handle_post_click(event, p)
-                post_frame.setCursor(Qt.CursorShape.PointingHandCursor)
-                
-                stream_layout.addWidget(post_frame)
-                
-            else:
-                # Fallback: simple widget
-                self.create_simple_post_widget(post, stream_layout)
-                
-        except Exception as e:
-            print(f"Error creating post widget: {e}")
-            # Fallback to simple widget
-            self.create_simple_post_widget(post, stream_layout)
-                    
-        except Exception as e:
-            print(f"Error creating post widget: {e}")
-            # Fallback to simple widget
-            self.create_simple_post_widget(post, stream_layout)
-
-    def show_post_menu(self, post, menu_button):
+    def show_post_menu(self, post, pos):
         """Show context menu for post actions (Edit, Delete)"""
         from PyQt6.QtWidgets import QMenu
         from PyQt6.QtGui import QAction
@@ -395,8 +267,7 @@ class ClassroomStream(QWidget):
         menu.addAction(edit_action)
         menu.addAction(delete_action)
         
-        button_pos = menu_button.mapToGlobal(menu_button.rect().bottomLeft())
-        menu.exec(button_pos)
+        menu.exec(pos)
 
     def edit_post(self, post):
         """Handle edit post action"""
@@ -449,20 +320,21 @@ class ClassroomStream(QWidget):
             if self.post_controller.delete_post(post["id"]):
                 print("Post deleted successfully")
                 
-                # Refresh both Stream and Classworks views
-                self.refresh_posts()
+                # Drop the row here and in the Classworks view
+                self.remove_post(post["id"])
                 
-                # Also refresh Classworks view if it exists
-                if hasattr(self, 'classworks_view_ref'):
-                    self.classworks_view_ref.refresh_posts()
-                else:
+                classworks_view = getattr(self, 'classworks_view_ref', None)
+                if classworks_view is None:
                     # Try to find classworks view through parent
                     parent = self.parent()
                     while parent:
                         if hasattr(parent, 'classworks_view'):
-                            parent.classworks_view.refresh_posts()
+                            classworks_view = parent.classworks_view
                             break
                         parent = parent.parent()
+                if classworks_view is not None:
+                    classworks_view.tree_model.remove_post(post["id"])
+                    classworks_view._update_empty_state()
             else:
                 print("Failed to delete post")
                 QMessageBox.warning(self, "Error", "Failed to delete post. Please try again.")
@@ -471,119 +343,6 @@ class ClassroomStream(QWidget):
         """Set reference to Classworks view for cross-refresh"""
         self.classworks_view_ref = classworks_view
         
-    def create_simple_post_widget(self, post, stream_layout):
-        """Create a simple post widget as fallback with proper spacing and icon"""
-        try:
-            # Create a frame instead of just a QLabel for better layout control
-            post_frame = QFrame()
-            post_frame.setStyleSheet("""
-                QFrame {
-                    background-color: white;
-                    border: 1px solid #ddd;
-                    border-radius: 5px;
-                    margin: 5px;
-                }
-            """)
-            
-            layout = QHBoxLayout(post_frame)
-            layout.setContentsMargins(12, 8, 12, 8)
-            layout.setSpacing(10)
-            
-            # Icon with document.svg
-            icon_label = QLabel()
-            icon_label.setFixedSize(30, 30)
-            icon_label.setStyleSheet("""
-                QLabel {
-                    background-color: #084924;
-                    border-radius: 15px;
-                    border: 2px solid white;
-                }
-            """)
-            icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Load and set the document icon
-            try:
-                from PyQt6.QtGui import QPixmap
-                icon_path = "frontend/assets/icons/document.svg"
-                pixmap = QPixmap(icon_path)
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(18, 18, Qt.AspectRatioMode.KeepAspectRatio, 
-                                                Qt.TransformationMode.SmoothTransformation)
-                    icon_label.setPixmap(scaled_pixmap)
-                else:
-                    icon_label.setText("📄")
-                    icon_label.setStyleSheet(icon_label.styleSheet() + """
-                        QLabel {
-                            color: white;
-                            font-size: 12px;
-                        }
-                    """)
-            except Exception as icon_error:
-                icon_label.setText("📄")
-                icon_label.setStyleSheet(icon_label.styleSheet() + """
-                    QLabel {
-                        color: white;
-                        font-size: 12px;
-                    }
-                """)
-            
-            layout.addWidget(icon_label)
-            
-            # Content area
-            content_layout = QVBoxLayout()
-            content_layout.setSpacing(4)
-            content_layout.setContentsMargins(0, 0, 0, 0)
-            
-            # Title only
-            title_label = QLabel(post.get('title', ''))
-            title_label.setStyleSheet("font-size: 14px; font-weight: bold;")
-            title_label.setWordWrap(True)
-            title_label.setMinimumHeight(18)
-            content_layout.addWidget(title_label)
-            
-            # Date
-            date_label = QLabel(self.format_date(post.get('date', '')))
-            date_label.setStyleSheet("font-size: 12px; color: #666;")
-            date_label.setMinimumHeight(14)
-            content_layout.addWidget(date_label)
-            
-            layout.addLayout(content_layout, 1)  # Set stretch factor
-            
-            # Add menu button for faculty/admin
-            if self.primary_role in ["faculty", "admin"]:
-                menu_button = QPushButton("⋮")
-                menu_button.setFixedSize(30, 30)
-                from PyQt6.QtGui import QFont
-                menu_font = QFont("Poppins")
-                menu_font.setPointSize(16)
-                menu_button.setFont(menu_font)
-                menu_button.setStyleSheet("""
-                    QPushButton {
-                        border: none;
-                        background-color: transparent;
-                        color: #656d76;
-                        border-radius: 15px;
-                        font-weight: bold;
-                        font-family: "Poppins", Arial, sans-serif;
-                    }
-                    QPushButton:hover {
-                        background-color: #F3F4F6;
-                    }
-                """)
-                layout.addWidget(menu_button)
-                
-                # Connect menu button click
-                menu_button.clicked.connect(lambda checked, p=post: self.show_post_menu(p, menu_button))
-            
-            layout.addStretch()
-            
-            post_frame.mousePressEvent = lambda event, p=post: self.handle_post_click(event, p)
-            post_frame.setCursor(Qt.CursorShape.PointingHandCursor)
-            stream_layout.addWidget(post_frame)
-            
-        except Exception as e:
-            print(f"Error creating simple post widget: {e}")
-
         # In classroom_stream.py
     def set_classworks_reference(self, classworks_view):
         self.classworks_view = classworks_view
@@ -621,13 +380,10 @@ class ClassroomStream(QWidget):
     def format_date(self, date_str):
         return format_date_display(date_str)
     
-    def handle_post_click(self, event, post):
-        if event.button() == Qt.MouseButton.LeftButton:
-            print(f"Stream post clicked: {post['title']}")
-            self.post_selected.emit(post)
+    def on_post_clicked(self, post):
+        print(f"Stream post clicked: {post['title']}")
+        self.post_selected.emit(post)
 
     def clear(self):
-        """Clear the stream layout"""
-        stream_layout = self.get_stream_layout()
-        if stream_layout:
-            self.clear_stream_layout(stream_layout)
\ No newline at end of file
+        """Clear the stream posts"""
+        self.posts_model.clear()
@@ -0,0 +1,139 @@
+# classworks_delegate.py
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt6.QtCore import Qt, QEvent, QPoint, QRect, QRectF, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QCursor, QFont, QPainter, QPainterPath, QPen
+
+from frontend.services.Academics.model.Academics.Classroom.classworks_tree_model import ClassworksTreeModel
+
+
+class ClassworksDelegate(QStyledItemDelegate):
+    """
+    Paints the Classworks tree: topic rows as a title over a separator line,
+    post rows as a card with the title, date and (faculty/admin) a menu
+    button. The untitled group has no header row.
+    """
+
+    post_clicked = pyqtSignal(object)  # post
+    menu_requested = pyqtSignal(object, QPoint)  # post, global position
+
+    TOPIC_HEIGHT = 60
+    POST_HEIGHT = 90
+    MARGIN_LEFT = 20
+    MENU_SIZE = 30
+
+    def __init__(self, show_menu=False, parent=None):
+        super().__init__(parent)
+        self.show_menu = show_menu
+        self._topic_font = QFont("Poppins")
+        self._topic_font.setPixelSize(24)
+        self._title_font = QFont("Poppins")
+        self._title_font.setPixelSize(16)
+        self._date_font = QFont("Poppins")
+        self._date_font.setPixelSize(14)
+        self._menu_font = QFont("Poppins")
+        self._menu_font.setPointSize(16)
+        self._menu_font.setBold(True)
+
+    # ------------------------------------------------------------------
+    # Geometry
+    # ------------------------------------------------------------------
+
+    def sizeHint(self, option, index):
+        if index.data(ClassworksTreeModel.IsTopicRole):
+            return QSize(option.rect.width(), self.TOPIC_HEIGHT if index.data(ClassworksTreeModel.TopicTitleRole) else 0)
+        return QSize(option.rect.width(), self.POST_HEIGHT)
+
+    def _card_rect(self, cell_rect):
+        return cell_rect.adjusted(self.MARGIN_LEFT, 5, -1, -5)
+
+    def _menu_rect(self, cell_rect):
+        card = self._card_rect(cell_rect)
+        return QRect(card.right() - 20 - self.MENU_SIZE, card.center().y() - self.MENU_SIZE // 2,
+                     self.MENU_SIZE, self.MENU_SIZE)
+
+    @staticmethod
+    def _viewport(option):
+        # option.rect and mouse positions are in viewport coordinates
+        view = option.widget
+        return view.viewport() if hasattr(view, "viewport") else view
+
+    # ------------------------------------------------------------------
+    # Painting
+    # ------------------------------------------------------------------
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if index.data(ClassworksTreeModel.IsTopicRole):
+            self._paint_topic(painter, option, index)
+        else:
+            self._paint_post(painter, option, index)
+        painter.restore()
+
+    def _paint_topic(self, painter, option, index):
+        title = index.data(ClassworksTreeModel.TopicTitleRole)
+        if not title:
+            return
+        rect = option.rect
+        painter.setFont(self._topic_font)
+        painter.setPen(QColor("#000000"))
+        painter.drawText(QRect(rect.left() + self.MARGIN_LEFT, rect.top() + 10,
+                               rect.width() - 2 * self.MARGIN_LEFT, rect.height() - 20),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title)
+        painter.setPen(QPen(QColor("#A9A9A9"), 1))
+        painter.drawLine(rect.left() + self.MARGIN_LEFT, rect.bottom() - 4,
+                         rect.right() - self.MARGIN_LEFT, rect.bottom() - 4)
+
+    def _paint_post(self, painter, option, index):
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        card = QRectF(self._card_rect(option.rect))
+        path = QPainterPath()
+        path.addRoundedRect(card, 20, 20)
+        painter.fillPath(path, QColor("#F8F9FA" if hovered else "white"))
+        painter.setPen(QPen(QColor("#D0D7DE" if hovered else "#E0E0E0"), 1))
+        painter.drawPath(path)
+
+        content = self._card_rect(option.rect).adjusted(35, 0, -20, 0)
+        if self.show_menu:
+            menu_rect = self._menu_rect(option.rect)
+            content.setRight(menu_rect.left() - 10)
+            if hovered and option.widget is not None:
+                if menu_rect.contains(self._viewport(option).mapFromGlobal(QCursor.pos())):
+                    painter.setPen(Qt.PenStyle.NoPen)
+                    painter.setBrush(QColor("#F3F4F6"))
+                    painter.drawEllipse(menu_rect)
+            painter.setFont(self._menu_font)
+            painter.setPen(QColor("#656d76"))
+            painter.drawText(menu_rect, Qt.AlignmentFlag.AlignCenter, "⋮")
+
+        # Date on the right, title takes the rest
+        painter.setFont(self._date_font)
+        painter.setPen(QColor("#666"))
+        date_text = index.data(ClassworksTreeModel.DateTextRole) or ""
+        date_width = painter.fontMetrics().horizontalAdvance(date_text)
+        painter.drawText(content, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, date_text)
+
+        painter.setFont(self._title_font)
+        painter.setPen(QColor("#333"))
+        title_rect = content.adjusted(0, 0, -(date_width + 40), 0)
+        title = painter.fontMetrics().elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole) or "", Qt.TextElideMode.ElideRight, max(0, title_rect.width()))
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title)
+
+    # ------------------------------------------------------------------
+    # Mouse
+    # ------------------------------------------------------------------
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            post = index.data(ClassworksTreeModel.PostRole)
+            if post is None:
+                return True  # topic headers are not clickable
+            pos = event.position().toPoint()
+            menu_rect = self._menu_rect(option.rect)
+            if self.show_menu and menu_rect.contains(pos):
+                self.menu_requested.emit(post, self._viewport(option).mapToGlobal(menu_rect.bottomLeft()))
+            elif self._card_rect(option.rect).contains(pos):
+                self.post_clicked.emit(post)
+            return True
+        return super().editorEvent(event, model, option, index)
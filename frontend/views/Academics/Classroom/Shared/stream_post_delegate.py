@@ -0,0 +1,147 @@
+# stream_post_delegate.py
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt6.QtCore import Qt, QEvent, QPoint, QRect, QRectF, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QCursor, QFont, QPainter, QPainterPath, QPen, QPixmap
+
+from frontend.services.Academics.model.Academics.Classroom.stream_posts_model import StreamPostsModel
+
+
+class StreamPostDelegate(QStyledItemDelegate):
+    """
+    Paints a stream post card (document icon, title, date and, for faculty
+    and admin, a menu button) for each row of a StreamPostsModel. Only rows
+    in the viewport are painted; there are no widgets per post.
+    """
+
+    post_clicked = pyqtSignal(object)  # post
+    menu_requested = pyqtSignal(object, QPoint)  # post, global position
+
+    ROW_HEIGHT = 70
+    ICON_SIZE = 42
+    MENU_SIZE = 30
+    ICON_PATH = "frontend/assets/icons/document.svg"
+
+    _icon = None  # document icon, loaded from disk once per process
+
+    def __init__(self, show_menu=False, parent=None):
+        super().__init__(parent)
+        self.show_menu = show_menu
+        self._title_font = QFont()
+        self._title_font.setPixelSize(16)
+        self._date_font = QFont()
+        self._date_font.setPixelSize(14)
+        self._menu_font = QFont("Poppins")
+        self._menu_font.setPointSize(16)
+        self._menu_font.setBold(True)
+
+    @classmethod
+    def document_icon(cls):
+        """Scaled document icon, or None if the file could not be loaded."""
+        if cls._icon is None:
+            pixmap = QPixmap(cls.ICON_PATH)
+            cls._icon = pixmap.scaled(24, 24, Qt.AspectRatioMode.KeepAspectRatio,
+                                      Qt.TransformationMode.SmoothTransformation) if not pixmap.isNull() else False
+        return cls._icon or None
+
+    # ------------------------------------------------------------------
+    # Geometry
+    # ------------------------------------------------------------------
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    @staticmethod
+    def _card_rect(cell_rect):
+        return cell_rect.adjusted(1, 1, -1, -1)
+
+    @staticmethod
+    def _viewport(option):
+        # option.rect and mouse positions are in viewport coordinates
+        view = option.widget
+        return view.viewport() if hasattr(view, "viewport") else view
+
+    def _menu_rect(self, cell_rect):
+        card = self._card_rect(cell_rect)
+        return QRect(card.right() - 15 - self.MENU_SIZE, card.center().y() - self.MENU_SIZE // 2,
+                     self.MENU_SIZE, self.MENU_SIZE)
+
+    # ------------------------------------------------------------------
+    # Painting
+    # ------------------------------------------------------------------
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        card = QRectF(self._card_rect(option.rect))
+        path = QPainterPath()
+        path.addRoundedRect(card, 20, 20)
+        painter.fillPath(path, QColor("#F8F9FA" if hovered else "white"))
+        painter.setPen(QPen(QColor("#D0D7DE" if hovered else "#E0E0E0"), 1))
+        painter.drawPath(path)
+
+        # Document icon in a green circle
+        icon_rect = QRect(int(card.left()) + 15, int(card.center().y()) - self.ICON_SIZE // 2,
+                          self.ICON_SIZE, self.ICON_SIZE)
+        painter.setPen(QPen(QColor("white"), 2))
+        painter.setBrush(QColor("#084924"))
+        painter.drawEllipse(icon_rect)
+        icon = self.document_icon()
+        if icon is not None:
+            painter.drawPixmap(icon_rect.center().x() - icon.width() // 2 + 1,
+                               icon_rect.center().y() - icon.height() // 2 + 1, icon)
+        else:
+            painter.setPen(QColor("white"))
+            painter.drawText(icon_rect, Qt.AlignmentFlag.AlignCenter, "📄")
+
+        # Title and date
+        text_left = icon_rect.right() + 15
+        text_right = (self._menu_rect(option.rect).left() - 10) if self.show_menu else int(card.right()) - 15
+        text_width = max(0, text_right - text_left)
+
+        painter.setFont(self._title_font)
+        painter.setPen(QColor("#333"))
+        title_rect = QRect(text_left, int(card.center().y()) - 22, text_width, 22)
+        title = painter.fontMetrics().elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole) or "", Qt.TextElideMode.ElideRight, text_width)
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom, title)
+
+        painter.setFont(self._date_font)
+        painter.setPen(QColor("#666"))
+        date_rect = QRect(text_left, int(card.center().y()) + 4, text_width, 20)
+        painter.drawText(date_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+                         index.data(StreamPostsModel.DateTextRole) or "")
+
+        # Menu button (faculty/admin)
+        if self.show_menu:
+            menu_rect = self._menu_rect(option.rect)
+            if hovered and option.widget is not None:
+                cursor = self._viewport(option).mapFromGlobal(QCursor.pos())
+                if menu_rect.contains(cursor):
+                    painter.setPen(Qt.PenStyle.NoPen)
+                    painter.setBrush(QColor("#F3F4F6"))
+                    painter.drawEllipse(menu_rect)
+            painter.setFont(self._menu_font)
+            painter.setPen(QColor("#656d76"))
+            painter.drawText(menu_rect, Qt.AlignmentFlag.AlignCenter, "⋮")
+
+        painter.restore()
+
+    # ------------------------------------------------------------------
+    # Mouse
+    # ------------------------------------------------------------------
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            post = index.data(StreamPostsModel.PostRole)
+            if post is None:
+                return False
+            pos = event.position().toPoint()
+            if self.show_menu and self._menu_rect(option.rect).contains(pos):
+                menu_rect = self._menu_rect(option.rect)
+                self.menu_requested.emit(post, self._viewport(option).mapToGlobal(menu_rect.bottomLeft()))
+            elif self._card_rect(option.rect).contains(pos):
+                self.post_clicked.emit(post)
+            return True
+        return super().editorEvent(event, model, option, index)
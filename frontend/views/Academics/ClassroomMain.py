@@ -251,6 +251,8 @@ class ClassroomMain(QWidget):
 
         if hasattr(self.current_form_view, 'material_created'):
             self.current_form_view.material_created.connect(self.refresh_classroom_views)
+        if hasattr(self.current_form_view, 'assessment_created'):
+            self.current_form_view.assessment_created.connect(self.refresh_classroom_views)
         
         # Add form to stacked widget and show it
         self.stacked_widget.addWidget(self.current_form_view)
@@ -450,16 +452,21 @@ class ClassroomMain(QWidget):
                 print("No post controller available")
                 QMessageBox.warning(self, "Error", "Cannot delete post: No classroom view available.")
 
-    def refresh_classroom_views(self):
-        """Refresh all classroom views after post deletion"""
+    def refresh_classroom_views(self, new_post=None):
+        """Refresh all classroom views after a post is created or deleted"""
         if self.current_classroom_view:
-            # Refresh stream view
+            # A created post is inserted as one row; deletions reload
             if hasattr(self.current_classroom_view, 'stream_view'):
-                self.current_classroom_view.stream_view.refresh_posts()
+                if new_post:
+                    self.current_classroom_view.stream_view.add_post(new_post)
+                else:
+                    self.current_classroom_view.stream_view.refresh_posts()
             
-            # Refresh classworks view  
             if hasattr(self.current_classroom_view, 'classworks_view'):
-                self.current_classroom_view.classworks_view.refresh_posts()
+                if new_post:
+                    self.current_classroom_view.classworks_view.add_post(new_post)
+                else:
+                    self.current_classroom_view.classworks_view.refresh_posts()
     
     def return_to_classroom(self):
         """
@@ -84,6 +84,24 @@ class ClassesPage(QWidget):
             }
         """)
         header_layout.addWidget(self.add_btn)
+
+        # Whole-term conflict report
+        self.conflicts_btn = QPushButton("Check Conflicts")
+        self.conflicts_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #1e5631;
+                color: white;
+                padding: 8px 20px;
+                border-radius: 4px;
+                font-weight: bold;
+                font-size: 13px;
+                border: none;
+            }
+            QPushButton:hover {
+                background-color: #2d5a3d;
+            }
+        """)
+        header_layout.addWidget(self.conflicts_btn)
         layout.addLayout(header_layout)
         
         # Table
@@ -187,6 +205,7 @@ class ClassesPage(QWidget):
         Connect page signals to its appropriate slots.
         """
         self.add_btn.clicked.connect(self.handle_add)
+        self.conflicts_btn.clicked.connect(self.handle_conflict_report)
 
         # Connect model signals to refresh action buttons
         self.model.rowsInserted.connect(self._on_rows_changed)
@@ -354,6 +373,21 @@ class ClassesPage(QWidget):
         except Exception as e:
             logger.exception(f"An error occured while creating a class: {e}")
 
+    def handle_conflict_report(self) -> None:
+        """
+        Show every room and faculty clash of the term in one dialog.
+        """
+        from PyQt6.QtWidgets import QMessageBox
+
+        has_conflicts, text = self.controller.get_conflict_report()
+        box = QMessageBox(self)
+        box.setWindowTitle("Schedule Conflicts")
+        box.setIcon(QMessageBox.Icon.Warning if has_conflicts else QMessageBox.Icon.Information)
+        box.setText("Schedule conflicts found in this term." if has_conflicts else text)
+        if has_conflicts:
+            box.setDetailedText(text)
+        box.exec()
+
     def handle_edit(self, row: int) -> None:
         """
         Handle edit button click for a specific row.
@@ -1,10 +1,12 @@
-from PyQt6.QtWidgets import QGridLayout, QWidget, QVBoxLayout, QStackedWidget
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QGridLayout, QWidget, QVBoxLayout, QStackedWidget, QWIDGETSIZE_MAX
+from PyQt6.QtCore import Qt, QTimer
 from widgets.sidebar import Sidebar
 from widgets import header  # Assuming header module contains the Header class
 # from views.Login.user_profile import ProfileWidget
 
 class LayoutManager:
+    RESIZE_DEBOUNCE_MS = 80
+
     def __init__(self, main_layout, content, router, user_role):
         self.main_layout = main_layout
         self.content = content
@@ -32,6 +34,15 @@ class LayoutManager:
         self.header.profileRequested.connect(self._open_profile)
         self.header.logoutRequested.connect(self._logout)
 
+        # Resize events only record the width; the timer applies the last one
+        self._mode = None
+        self._pending_width = 0
+        self._resize_timer = QTimer()
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._apply_pending_width)
+
+        self._build_containers()
         self.apply_desktop_layout()
 
     def _init_stack(self, content):
@@ -44,126 +55,99 @@ class LayoutManager:
             self.content = self.stack
 
     def update_layout(self, width):
-        print(f"LayoutManager: Updating layout with window_width {width}")
-        current_is_mobile = self.main_layout.itemAtPosition(1, 0) is not None
-        should_be_mobile = width <= self.breakpoint[0]
-
-        if current_is_mobile != should_be_mobile:
+        """
+        Schedule a layout update for a new window width. Resize bursts are
+        coalesced: only the last width of a burst is applied, once the window
+        has stopped resizing for RESIZE_DEBOUNCE_MS.
+        """
+        self._pending_width = width
+        self._resize_timer.start()
+
+    def _apply_pending_width(self):
+        width = self._pending_width
+        mode = "mobile" if width <= self.breakpoint[0] else "desktop"
+
+        if mode != self._mode:
+            print(f"LayoutManager: Switching to {mode} layout at window_width {width}")
+            # Detach from the grid; the containers are reused, not recreated
             while self.main_layout.count():
-                item = self.main_layout.takeAt(0)
-                widget = item.widget()
-                if widget:
-                    widget.setParent(None)
-                    print(f"LayoutManager: Removed widget {type(widget).__name__} from layout")
+                self.main_layout.takeAt(0)
 
-            if should_be_mobile:
+            if mode == "mobile":
                 self.apply_mobile_layout()
             else:
                 self.apply_desktop_layout()
-        else:
-            if not should_be_mobile:
-                self.apply_desktop_layout()
-            print("LayoutManager: No layout mode change needed")
-
-        self.content.update()
-        self.navbar.update()
-        self.header.update()
-        print(f"LayoutManager: Updated layout, content visible: {self.content.isVisible()}, navbar visible: {self.navbar.isVisible()}, header visible: {self.header.isVisible()}")
-
-    def apply_desktop_layout(self):
-        print("LayoutManager: Applying desktop layout")
-        if not self.navbar:
-            self.navbar = Sidebar(self.router, self.user_role)
-            self.navbar.setContentsMargins(0, 0, 0, 0)
-            print(f"LayoutManager: Created Sidebar, visible: {self.navbar.isVisible()}, collapsed: {self.navbar.is_collapsed}")
-
-        if not self.header:
-            self.header = header.Header()
-            print(f"LayoutManager: Created Header, visible: {self.header.isVisible()}")
-
-        # Create content container with header and stacked widget
-        content_container = QWidget()
-        content_layout = QVBoxLayout(content_container)
-        content_layout.setContentsMargins(10, 0, 10, 10)  # sidebar & header margin
-        content_layout.setSpacing(10)
-
-        # Add header with its own container for styling
-        header_container = QWidget()
-        header_container.setStyleSheet("background: transparent;")
-        header_layout = QVBoxLayout(header_container)
-        header_layout.setContentsMargins(12, 0, 12, 12)  # Add padding for shadow
-        header_layout.addWidget(self.header)
-        content_layout.addWidget(header_container)
-
-        # Add stacked widget
+        elif mode == "desktop":
+            # Sidebar may have been toggled since the last update
+            self._apply_column_widths()
+
+    def _build_containers(self):
+        """Content container (header above the page stack), built once and reused by both layouts."""
+        self._content_container = QWidget()
+        self._content_layout = QVBoxLayout(self._content_container)
+        self._content_container.setStyleSheet("background: #ffffff;")
+
+        # Header with its own container for styling
+        self._header_container = QWidget()
+        self._header_container.setStyleSheet("background: transparent;")
+        self._header_layout = QVBoxLayout(self._header_container)
+        self._header_layout.addWidget(self.header)
+        self._content_layout.addWidget(self._header_container)
+
+        # Stacked widget
         stack_container = QWidget()
         stack_layout = QVBoxLayout(stack_container)
         stack_layout.setContentsMargins(20, 0, 0, 0)
         stack_layout.setSpacing(0)
         stack_layout.addWidget(self.content)
-        content_layout.addWidget(stack_container, 1)
+        self._content_layout.addWidget(stack_container, 1)
+
+    def _apply_column_widths(self):
+        # Adjust column widths based on sidebar collapse state
+        self.main_layout.setColumnMinimumWidth(0, 70 if self.navbar.is_collapsed else 280)
+        self.main_layout.setColumnStretch(0, 0)
+        self.main_layout.setColumnStretch(1, 1)
+
+    def apply_desktop_layout(self):
+        print("LayoutManager: Applying desktop layout")
+        self._content_layout.setContentsMargins(10, 0, 10, 10)  # sidebar & header margin
+        self._content_layout.setSpacing(10)
+        self._header_layout.setContentsMargins(12, 0, 12, 12)  # Add padding for shadow
+
+        # Undo the mobile layout's bottom bar sizing
+        self.navbar.setMinimumHeight(0)
+        self.navbar.setMaximumHeight(QWIDGETSIZE_MAX)
+        self.main_layout.setRowStretch(0, 0)
+        self.main_layout.setRowStretch(1, 0)
 
         # Add widgets to main layout
         self.main_layout.addWidget(self.navbar, 0, 0, 2, 1)
-        self.main_layout.addWidget(content_container, 0, 1, 2, 1)
+        self.main_layout.addWidget(self._content_container, 0, 1, 2, 1)
+        self._apply_column_widths()
 
-        # Adjust column widths based on sidebar collapse state
-        if self.navbar.is_collapsed:
-            self.main_layout.setColumnMinimumWidth(0, 70)
-            self.main_layout.setColumnStretch(0, 0)
-            self.main_layout.setColumnStretch(1, 1)
-            print("LayoutManager: Adjusted for collapsed sidebar (70px)")
-        else:
-            self.main_layout.setColumnMinimumWidth(0, 280)
-            self.main_layout.setColumnStretch(0, 0)
-            self.main_layout.setColumnStretch(1, 1)
-            print("LayoutManager: Adjusted for expanded sidebar (280px)")
-
-        content_container.setStyleSheet("background: #ffffff;")
+        self._mode = "desktop"
         self.main_layout.invalidate()
         print("LayoutManager: Desktop layout applied")
 
     def apply_mobile_layout(self):
         print("LayoutManager: Applying mobile layout")
-        if not self.navbar:
-            self.navbar = Sidebar(self.router, self.user_role)
-            self.navbar.setContentsMargins(0, 0, 0, 0)
-            print(f"LayoutManager: Created Sidebar, visible: {self.navbar.isVisible()}, collapsed: {self.navbar.is_collapsed}")
-
-        if not self.header:
-            self.header = header.Header()
-            print(f"LayoutManager: Created Header, visible: {self.header.isVisible()}")
-
-        # Create content container with header and stacked widget
-        content_container = QWidget()
-        content_layout = QVBoxLayout(content_container)
-        content_layout.setContentsMargins(0, 12, 20, 20)  # Add top padding for shadow
-        content_layout.setSpacing(20)
-
-        # Add header with its own container for styling
-        header_container = QWidget()
-        header_container.setStyleSheet("background: transparent;")
-        header_layout = QVBoxLayout(header_container)
-        header_layout.setContentsMargins(12, 12, 12, 12)  # Add padding for shadow
-        header_layout.addWidget(self.header)
-        content_layout.addWidget(header_container)
-
-        # Add stacked widget
-        stack_container = QWidget()
-        stack_layout = QVBoxLayout(stack_container)
-        stack_layout.setContentsMargins(20, 0, 0, 0)
-        stack_layout.setSpacing(0)
-        stack_layout.addWidget(self.content)
-        content_layout.addWidget(stack_container, 1)
+        self._content_layout.setContentsMargins(0, 12, 20, 20)  # Add top padding for shadow
+        self._content_layout.setSpacing(20)
+        self._header_layout.setContentsMargins(12, 12, 12, 12)  # Add padding for shadow
 
         # Add widgets to main layout
-        self.main_layout.addWidget(content_container, 0, 0, 1, 1)
+        self.main_layout.setColumnMinimumWidth(0, 0)
+        self.main_layout.setColumnStretch(1, 0)
+        self.main_layout.addWidget(self._content_container, 0, 0, 1, 1)
         self.main_layout.addWidget(self.navbar, 1, 0, 1, 1)
         self.main_layout.setRowStretch(0, 3)
         self.main_layout.setRowStretch(1, 1)
         self.navbar.setFixedHeight(100)
-        content_container.setStyleSheet("background: #ffffff;")
+
+        self._mode = "mobile"
+        self.main_layout.invalidate()
         print("LayoutManager: Mobile layout applied")
+
     # def _open_profile(self):
     #     w = self.pages.get("profile")
     #     if w is None: